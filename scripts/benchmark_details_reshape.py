@@ -0,0 +1,105 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Compares the reshape of an hourly `details` output file into a long format:
+the previous pandas stack / unstack implementation against `reshape_details_output`.
+
+Usage: python scripts/benchmark_details_reshape.py --clusters 500
+"""
+
+import time
+import warnings
+
+from typing import Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from antares.craft.model.output import Frequency
+from antares.craft.service.output_matrix_parsing import (
+    OutputDataFrame,
+    get_start_column,
+    parse_output_file,
+    reshape_details_output,
+)
+
+VARIABLES = [("MWh", "EXP"), ("NP Cost - Euro", "EXP"), ("NODU", "EXP"), ("Profit - Euro", "EXP")]
+HOURS = 8760
+
+
+def build_details_file(cluster_count: int) -> bytes:
+    columns = [(f"cluster_{k:04d}", variable, unit) for k in range(cluster_count) for variable, unit in VARIABLES]
+    first_column = get_start_column(Frequency.HOURLY)
+    padding = "\t" * first_column
+    lines = [
+        "area\tde\thourly",
+        "\tVARIABLES\tBEGIN\tEND",
+        f"\t{len(columns)}\t1\t{HOURS}",
+        "",
+        padding + "\t".join(column[0] for column in columns),
+        padding + "\t".join(column[1] for column in columns),
+        padding + "\t".join(column[2] for column in columns),
+    ]
+    values = np.random.default_rng(0).integers(0, 1000, size=(HOURS, len(columns)))
+    time_columns = "\tde\t{hour}\tJAN\t00:00"
+    lines += [time_columns.format(hour=hour + 1) + "\t" + "\t".join(map(str, row)) for hour, row in enumerate(values)]
+    return "\n".join(lines).encode("utf-8")
+
+
+def stack_reshape(output: OutputDataFrame) -> pd.DataFrame:
+    # Implementation replaced by `reshape_details_output`
+    df = output.data.to_pandas()
+    df.columns = pd.MultiIndex.from_tuples(output.headers)  # type: ignore
+    nb_clusters = df.columns.get_level_values(0).nunique()
+    actual_cols = sorted(df.columns.get_level_values(1).unique())
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=FutureWarning)
+        final_df = df.stack(level=[0, 1]).unstack()
+    final_df.reset_index(inplace=True)
+    final_df.drop(final_df.columns[0], axis=1, inplace=True)
+    final_df.columns = pd.Index(["cluster"] + actual_cols, dtype="str")
+    final_df["timeId"] = (final_df.index // nb_clusters) + 1
+    return final_df.reindex(columns=["cluster", "timeId"] + list(actual_cols))  # type: ignore
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@click.command()
+@click.option("--clusters", default=500, help="Number of clusters of the area.")
+@click.option("--repeat", default=3, help="Number of runs, the best one is kept.")
+def main(clusters: int, repeat: int) -> None:
+    output = parse_output_file(build_details_file(clusters), get_start_column(Frequency.HOURLY))
+    pd.testing.assert_frame_equal(
+        reshape_details_output(output).to_pandas(), stack_reshape(output), check_dtype=False, check_column_type=False
+    )
+
+    stack_time = best_time(lambda: stack_reshape(output), repeat)
+    reshape_time = best_time(lambda: reshape_details_output(output), repeat)
+    pandas_reshape_time = best_time(lambda: reshape_details_output(output).to_pandas(), repeat)
+    click.echo(f"{clusters} clusters, {HOURS} hours, {len(VARIABLES)} variables per cluster")
+    click.echo(f"stack / unstack:                    {stack_time:.3f}s")
+    click.echo(f"reshape_details_output:             {reshape_time:.3f}s (x{stack_time / reshape_time:.1f})")
+    click.echo(
+        f"reshape_details_output + to_pandas: {pandas_reshape_time:.3f}s (x{stack_time / pandas_reshape_time:.1f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
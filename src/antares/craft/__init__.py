@@ -34,12 +34,17 @@ from antares.craft.model.link import (
     TransmissionCapacities,
 )
 from antares.craft.model.output import (
+    AggregationFormat,
     Frequency,
     MCAllAreasDataType,
     MCAllLinksDataType,
     MCIndAreasDataType,
     MCIndLinksDataType,
+    MCStatistic,
     Output,
+    OutputCube,
+    ParquetCompression,
+    TsNumbersKind,
 )
 from antares.craft.model.renewable import (
     RenewableClusterGroup,
@@ -165,11 +170,14 @@ __all__ = [
     "ThermalClusterGroup",
     "LocalTSGenerationBehavior",
     "ThermalCostGeneration",
+    "AggregationFormat",
     "Frequency",
     "MCIndAreasDataType",
     "MCAllAreasDataType",
     "MCIndLinksDataType",
+    "MCStatistic",
     "MCAllLinksDataType",
+    "TsNumbersKind",
     "ConstraintSign",
     "UcType",
     "Master",
@@ -227,4 +235,6 @@ __all__ = [
     "STStorageAdditionalConstraint",
     "STStorageAdditionalConstraintUpdate",
     "Output",
+    "OutputCube",
+    "ParquetCompression",
 ]
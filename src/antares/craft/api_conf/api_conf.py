@@ -10,10 +10,13 @@
 #
 # This file is part of the Antares project.
 
+from typing import Optional
+
 import requests
 
 from antares.craft.config.base_configuration import BaseConfiguration
 from antares.craft.exceptions.exceptions import MissingTokenError
+from antares.craft.tools.matrix_cache import MatrixMemoryCache
 
 
 class APIconf(BaseConfiguration):
@@ -23,6 +26,9 @@ class APIconf(BaseConfiguration):
         api_host: Base URL of the Antares Web API (e.g., `https://antares-web.mydomain`).
         token: Bearer token used for authentication.
         verify: Whether to verify the server's TLS certificate. Defaults to `True`.
+        matrix_memory_cache_size: Size in bytes of an in-memory LRU cache of the downloaded input matrices.
+            Repeated reads of a matrix then skip the download, the returned dataframes being read-only.
+            Only the modifications made through this configuration invalidate the cache. Disabled by default.
 
     Example:
         ```python
@@ -30,10 +36,15 @@ class APIconf(BaseConfiguration):
         ```
     """
 
-    def __init__(self, api_host: str, token: str, verify: bool = True) -> None:
+    def __init__(
+        self, api_host: str, token: str, verify: bool = True, matrix_memory_cache_size: Optional[int] = None
+    ) -> None:
         self._api_host: str = api_host
         self._token: str = token
         self._verify: bool = verify
+        self._matrix_memory_cache = (
+            MatrixMemoryCache(matrix_memory_cache_size) if matrix_memory_cache_size is not None else None
+        )
 
     @property
     def token(self) -> str:
@@ -54,6 +65,11 @@ class APIconf(BaseConfiguration):
         """Whether TLS certificate verification is enabled."""
         return self._verify
 
+    @property
+    def matrix_memory_cache(self) -> Optional[MatrixMemoryCache]:
+        """In-memory cache of the downloaded input matrices, `None` if disabled."""
+        return self._matrix_memory_cache
+
     @property
     def api_host(self) -> str:
         return self._api_host
@@ -11,23 +11,84 @@
 # This file is part of the Antares project.
 
 from pathlib import Path
+from typing import Optional
 
 from antares.craft.config.base_configuration import BaseConfiguration
+from antares.craft.tools.matrix_cache import MatrixCache, MatrixMemoryCache
+from antares.craft.tools.matrix_store import MatrixStore
 
 
 class LocalConfiguration(BaseConfiguration):
     """Configuration for accessing and modifying studies on your machine."""
 
-    def __init__(self, local_path: Path, study_name: str):
+    def __init__(
+        self,
+        local_path: Path,
+        study_name: str,
+        matrix_cache_dir: Optional[Path] = None,
+        memory_map_matrices: bool = False,
+        matrix_memory_cache_size: Optional[int] = None,
+        matrix_store_dir: Optional[Path] = None,
+        output_aggregation_workers: int = 1,
+    ):
         """Initialize your local configuration.
 
         Args:
             local_path: Path to the parent folder of your study.
             study_name: Name of your study.
+            matrix_cache_dir: Folder used to cache a binary copy of the input matrices.
+                Repeated reads of an unchanged matrix then skip the text parsing. Disabled by default.
+                The index of the output files and the location of their parquet conversion are also kept there.
+            memory_map_matrices: Whether input matrices are returned as read-only dataframes backed by a
+                memory-mapped float64 copy stored inside `matrix_cache_dir`.
+                Processes reading the same matrix then share one physical copy of the data.
+            matrix_memory_cache_size: Size in bytes of an in-memory LRU cache of the input matrices.
+                Repeated reads of a matrix then cost nothing, the returned dataframes being read-only.
+                Disabled by default.
+            matrix_store_dir: Folder of a content-addressed store of the written input matrices.
+                Identical matrices are then written once and hard linked into the study. Disabled by default.
+            output_aggregation_workers: Number of threads parsing the output files when aggregating results.
+                Files are parsed one by one by default.
+
+        Raises:
+            ValueError: If `memory_map_matrices` is set without a `matrix_cache_dir`
+                or if `matrix_memory_cache_size` or `output_aggregation_workers` is not strictly positive.
         """
+        if memory_map_matrices and not matrix_cache_dir:
+            raise ValueError("Memory-mapped matrices require a `matrix_cache_dir` to store their binary copy")
+        if output_aggregation_workers < 1:
+            raise ValueError(
+                f"The number of aggregation workers should be strictly positive, got {output_aggregation_workers}"
+            )
         self._study_path = local_path / study_name
+        self._matrix_cache = MatrixCache(matrix_cache_dir, memory_map_matrices) if matrix_cache_dir else None
+        self._matrix_memory_cache = (
+            MatrixMemoryCache(matrix_memory_cache_size) if matrix_memory_cache_size is not None else None
+        )
+        self._matrix_store = MatrixStore(matrix_store_dir) if matrix_store_dir else None
+        self._output_aggregation_workers = output_aggregation_workers
 
     @property
     def study_path(self) -> Path:
         """Path to the study on your disc."""
         return self._study_path
+
+    @property
+    def matrix_cache(self) -> Optional[MatrixCache]:
+        """Binary cache of the input matrices, `None` if disabled."""
+        return self._matrix_cache
+
+    @property
+    def matrix_memory_cache(self) -> Optional[MatrixMemoryCache]:
+        """In-memory cache of the input matrices, `None` if disabled."""
+        return self._matrix_memory_cache
+
+    @property
+    def matrix_store(self) -> Optional[MatrixStore]:
+        """Content-addressed store of the written input matrices, `None` if disabled."""
+        return self._matrix_store
+
+    @property
+    def output_aggregation_workers(self) -> int:
+        """Number of threads parsing the output files when aggregating results."""
+        return self._output_aggregation_workers
@@ -353,6 +353,12 @@ class MatrixDownloadError(Exception):
         super().__init__(self.message)
 
 
+class StudyMatrixDownloadError(Exception):
+    def __init__(self, study_id: str, matrix_path: str, message: str) -> None:
+        self.message = f"Could not download matrix {matrix_path} of study {study_id}: {message}"
+        super().__init__(self.message)
+
+
 class LinkUploadError(Exception):
     def __init__(self, area_from_id: str, area_to_id: str, matrix_type: str, message: str) -> None:
         self.message = f"Error uploading {matrix_type} matrix for link '{area_from_id}/{area_to_id}': {message}"
@@ -687,6 +693,12 @@ class OutputAggregationError(Exception):
         super().__init__(f"Could not aggregate output data for output '{output_id}' : {message}.")
 
 
+class OutputConversionError(Exception):
+    def __init__(self, output_id: str, message: str) -> None:
+        self.message = f"Could not convert the output '{output_id}' to parquet: " + message
+        super().__init__(self.message)
+
+
 class OutputDataRetrievalError(Exception):
     def __init__(self, output_name: str, message: str) -> None:
         self.message = f"Could not retrieve data for output '{output_name}': " + message
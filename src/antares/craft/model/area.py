@@ -17,9 +17,11 @@ electrical demand (load), generation fleet (clusters).
 
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Optional
+from typing import Literal, Optional, Sequence, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft.exceptions.exceptions import RenewableDeletionError, STStorageDeletionError, ThermalDeletionError
 from antares.craft.model.commons import FilterOption
@@ -35,6 +37,7 @@ from antares.craft.service.base_services import (
     BaseThermalService,
 )
 from antares.craft.tools.contents_tool import EnumIgnoreCase, transform_name_to_id
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import FILTER_VALUES
 
 DELETION_ERROR_MSG = "it doesn't exist"
@@ -304,45 +307,160 @@ class Area:
 
         return storage
 
-    def get_load_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_load_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_load_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_load_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_load_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the load time-series for the area.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The load time-series.
         """
-        return self._area_service.get_load_matrix(self.id)
+        return self._area_service.get_load_matrix(self.id, columns=columns, output_format=output_format)
 
-    def get_wind_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_wind_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_wind_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_wind_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_wind_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the wind time-series for the area.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The wind time-series.
         """
-        return self._area_service.get_wind_matrix(self.id)
+        return self._area_service.get_wind_matrix(self.id, columns=columns, output_format=output_format)
 
-    def get_solar_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_solar_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_solar_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_solar_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_solar_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the solar time-series for the area.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The solar time-series.
         """
-        return self._area_service.get_solar_matrix(self.id)
+        return self._area_service.get_solar_matrix(self.id, columns=columns, output_format=output_format)
 
-    def get_reserves_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_reserves_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_reserves_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_reserves_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_reserves_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the reserves time-series for the area.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The reserves time-series.
         """
-        return self._area_service.get_reserves_matrix(self.id)
+        return self._area_service.get_reserves_matrix(self.id, columns=columns, output_format=output_format)
 
-    def get_misc_gen_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_misc_gen_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_misc_gen_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_misc_gen_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_misc_gen_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the miscellaneous generation time-series for the area.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The miscellaneous generation time-series.
         """
-        return self._area_service.get_misc_gen_matrix(self.id)
+        return self._area_service.get_misc_gen_matrix(self.id, columns=columns, output_format=output_format)
 
     def delete_thermal_clusters(self, thermal_clusters: list[ThermalCluster]) -> None:
         """Delete a list of thermal clusters in this area.
@@ -10,13 +10,16 @@
 #
 # This file is part of the Antares project.
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Literal, Optional, Sequence, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft.model.commons import FilterOption
 from antares.craft.service.base_services import BaseBindingConstraintService
 from antares.craft.tools.contents_tool import EnumIgnoreCase
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import FILTER_VALUES, ConstraintMatrixName
 
 
@@ -266,17 +269,80 @@ class BindingConstraint:
         self._properties = new_properties[self.id]
         return self._properties
 
-    def get_less_term_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_less_term_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_less_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_less_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_less_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the "less than" (<) term matrix"""
-        return self._binding_constraint_service.get_constraint_matrix(self, ConstraintMatrixName.LESS_TERM)
+        return self._binding_constraint_service.get_constraint_matrix(
+            self, ConstraintMatrixName.LESS_TERM, columns=columns, output_format=output_format
+        )
 
-    def get_equal_term_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_equal_term_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_equal_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_equal_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_equal_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the "equal" (==) term matrix"""
-        return self._binding_constraint_service.get_constraint_matrix(self, ConstraintMatrixName.EQUAL_TERM)
+        return self._binding_constraint_service.get_constraint_matrix(
+            self, ConstraintMatrixName.EQUAL_TERM, columns=columns, output_format=output_format
+        )
 
-    def get_greater_term_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_greater_term_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_greater_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_greater_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_greater_term_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the "greater than" (>) term matrix"""
-        return self._binding_constraint_service.get_constraint_matrix(self, ConstraintMatrixName.GREATER_TERM)
+        return self._binding_constraint_service.get_constraint_matrix(
+            self, ConstraintMatrixName.GREATER_TERM, columns=columns, output_format=output_format
+        )
 
     def set_less_term(self, matrix: pd.DataFrame) -> None:
         """Set the "less than" (<) term matrix
@@ -10,11 +10,14 @@
 #
 # This file is part of the Antares project.
 from dataclasses import asdict, dataclass, replace
-from typing import Optional
+from typing import Literal, Optional, Sequence, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft.service.base_services import BaseHydroService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 
 
 @dataclass
@@ -245,73 +248,266 @@ class Hydro:
         new_allocation = self._service.set_allocation(self.area_id, allocation)
         self._allocation = new_allocation
 
-    def get_maxpower(self) -> pd.DataFrame:
+    @overload
+    def get_maxpower(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_maxpower(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_maxpower(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_maxpower(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get maximum power.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The maximum power time-series.
         """
-        return self._service.get_maxpower(self.area_id)
-
-    def get_reservoir(self) -> pd.DataFrame:
+        return self._service.get_maxpower(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_reservoir(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_reservoir(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_reservoir(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_reservoir(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get reservoir levels.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The reservoir level time-series.
         """
-        return self._service.get_reservoir(self.area_id)
-
-    def get_inflow_pattern(self) -> pd.DataFrame:
+        return self._service.get_reservoir(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_inflow_pattern(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_inflow_pattern(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_inflow_pattern(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_inflow_pattern(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get inflow pattern.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             Inflow pattern time-series.
         """
-        return self._service.get_inflow_pattern(self.area_id)
-
-    def get_credit_modulations(self) -> pd.DataFrame:
+        return self._service.get_inflow_pattern(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_credit_modulations(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_credit_modulations(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_credit_modulations(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_credit_modulations(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get credit modulation.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             Credit modulation
         """
-        return self._service.get_credit_modulations(self.area_id)
-
-    def get_water_values(self) -> pd.DataFrame:
+        return self._service.get_credit_modulations(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_water_values(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_water_values(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_water_values(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_water_values(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get water values.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             Water values time-series which depend on the date (365 days) and the reservoir fill percentage.
         """
-        return self._service.get_water_values(self.area_id)
-
-    def get_ror_series(self) -> pd.DataFrame:
+        return self._service.get_water_values(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_ror_series(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_ror_series(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_ror_series(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_ror_series(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get run-of-river generation time-series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             Run-of-river time-series.
         """
-        return self._service.get_ror_series(self.area_id)
+        return self._service.get_ror_series(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_mod_series(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_mod_series(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_mod_series(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_mod_series(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        """Get modulation time-series.
 
-    def get_mod_series(self) -> pd.DataFrame:
-        """"""
-        return self._service.get_mod_series(self.area_id)
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
 
-    def get_mingen(self) -> pd.DataFrame:
+        Returns:
+            Modulation time-series.
+        """
+        return self._service.get_mod_series(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_mingen(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_mingen(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_mingen(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_mingen(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get minimum generation time-series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             Minimum generation time-series.
         """
-        return self._service.get_mingen(self.area_id)
-
-    def get_energy(self) -> pd.DataFrame:
+        return self._service.get_mingen(self.area_id, columns=columns, output_format=output_format)
+
+    @overload
+    def get_energy(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_energy(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_energy(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_energy(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get energy.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             Energy time-series.
         """
-        return self._service.get_energy(self.area_id)
+        return self._service.get_energy(self.area_id, columns=columns, output_format=output_format)
 
     def set_maxpower(self, series: pd.DataFrame) -> None:
         """Set maximum power.
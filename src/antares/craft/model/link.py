@@ -11,13 +11,16 @@
 # This file is part of the Antares project.
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional, Sequence, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft.model.commons import FilterOption
 from antares.craft.service.base_services import BaseLinkService
 from antares.craft.tools.contents_tool import transform_name_to_id
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import FILTER_VALUES
 
 
@@ -261,23 +264,86 @@ class Link:
         """
         self._link_service.set_capacity_indirect(series, self.area_from_id, self.area_to_id)
 
-    def get_capacity_direct(self) -> pd.DataFrame:
+    @overload
+    def get_capacity_direct(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_capacity_direct(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_capacity_direct(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_capacity_direct(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get direct transmission capacities of the link.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The hourly time-series of direct capacities.
         """
-        return self._link_service.get_capacity_direct(self.area_from_id, self.area_to_id)
-
-    def get_capacity_indirect(self) -> pd.DataFrame:
+        return self._link_service.get_capacity_direct(
+            self.area_from_id, self.area_to_id, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_capacity_indirect(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_capacity_indirect(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_capacity_indirect(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_capacity_indirect(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get indirect transmission capacities of the link.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The hourly time-series of indirect capacities.
         """
-        return self._link_service.get_capacity_indirect(self.area_from_id, self.area_to_id)
-
-    def get_parameters(self) -> pd.DataFrame:
+        return self._link_service.get_capacity_indirect(
+            self.area_from_id, self.area_to_id, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_parameters(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_parameters(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_parameters(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_parameters(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get parameters of the link
 
         - hurdle costs direct
@@ -289,7 +355,13 @@ class Link:
 
         hourly time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The hourly time-series of the different parameters.
         """
-        return self._link_service.get_parameters(self.area_from_id, self.area_to_id)
+        return self._link_service.get_parameters(
+            self.area_from_id, self.area_to_id, columns=columns, output_format=output_format
+        )
@@ -12,9 +12,14 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from pathlib import Path
+from typing import Literal, Optional, Sequence, TypeAlias, cast, overload
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 
 from antares.craft.exceptions.exceptions import OutputDataRetrievalError
 from antares.craft.service.base_services import BaseOutputService
@@ -118,6 +123,58 @@ class Frequency(Enum):
     ANNUAL = "annual"
 
 
+class AggregationFormat(Enum):
+    """Type of the objects returned by the aggregation methods.
+
+    Attributes:
+        PANDAS: A pandas dataframe.
+        POLARS: A polars dataframe, built without any pandas conversion.
+        ARROW: A pyarrow table, built without any pandas conversion.
+    """
+
+    PANDAS = "pandas"
+    POLARS = "polars"
+    ARROW = "arrow"
+
+
+AggregatedData: TypeAlias = pd.DataFrame | pl.DataFrame | pa.Table
+
+ParquetCompression: TypeAlias = Literal["zstd", "snappy", "gzip", "brotli", "lz4", "none"]
+"""Compression codec of the parquet files written by `Output.convert_to_parquet`."""
+
+
+class MCStatistic(Enum):
+    """Statistic computed across Monte Carlo years.
+
+    Attributes:
+        MEAN: Mean, weighted by the Monte Carlo years weights.
+        STD: Standard deviation, weighted by the Monte Carlo years weights.
+        MIN: Minimum.
+        MAX: Maximum.
+    """
+
+    MEAN = "mean"
+    STD = "std"
+    MIN = "min"
+    MAX = "max"
+
+
+class TsNumbersKind(Enum):
+    """Kind of objects whose time series numbers are written in the `ts-numbers` folder of an output.
+
+    The value is the name of the sub-folder holding their files.
+    """
+
+    LOAD = "load"
+    SOLAR = "solar"
+    WIND = "wind"
+    HYDRO = "hydro"
+    THERMAL = "thermal"
+    NTC = "ntc"
+    ST_STORAGE = "st-storage"
+    BINDING_CONSTRAINTS = "bindingconstraints"
+
+
 @dataclass(frozen=True)
 class XpansionOutputAntares:
     """Output of Xpansion investment module.
@@ -338,6 +395,7 @@ class AggregationEntry:
         mc_years: Monte Carlo years to include in the query. If left empty, all years are included.
         type_ids: which links/areas to be selected (ex: "be - fr"). If empty, all are selected.
         columns_names: names or regexes (if data_type is of type details) to select columns.
+        output_format: type of the returned aggregation.
     """
 
     data_type: MCAllAreasDataType | MCIndAreasDataType | MCAllLinksDataType | MCIndLinksDataType
@@ -345,6 +403,31 @@ class AggregationEntry:
     mc_years: Optional[list[int]] = None
     type_ids: Optional[list[str]] = None
     columns_names: Optional[list[str]] = None
+    output_format: AggregationFormat = AggregationFormat.PANDAS
+
+
+@dataclass(frozen=True)
+class OutputCube:
+    """Individual results of several areas or links, with one 3-D array per variable.
+
+    Attributes:
+        mc_years: Monte-Carlo years, along the first axis of the arrays.
+        ids: Area or link IDs (e.g. "de - fr"), along the third axis of the arrays.
+        values: One array per variable, of shape (Monte-Carlo years, time steps, IDs).
+            The time step `timeId` is found at the index `timeId - 1`. Missing values are NaN.
+    """
+
+    mc_years: list[int]
+    ids: list[str]
+    values: dict[str, np.ndarray]
+
+
+def _format_links_ids(links_ids: Optional[list[tuple[str, str]]]) -> Optional[list[str]]:
+    return (
+        [f"{area_from} - {area_to}" for link_id in links_ids for area_from, area_to in [sorted(link_id)]]
+        if links_ids
+        else None
+    )
 
 
 class Output:
@@ -533,6 +616,144 @@ class Output:
         file_path = f"mc-all/binding_constraints/binding-constraints-{frequency.value}"
         return self._output_service.get_matrix(self.name, file_path, frequency)
 
+    def _get_stacked_matrices(
+        self, file_paths: Sequence[tuple[tuple[str | int, ...], str]], names: list[str], frequency: Frequency
+    ) -> pd.DataFrame:
+        if not file_paths:
+            return pd.DataFrame()
+        matrices = self._output_service.get_matrices(self.name, [file_path for _, file_path in file_paths], frequency)
+        df = pd.concat(matrices, keys=[key for key, _ in file_paths], names=[*names, "timeId"], sort=False)
+        # Time ids start at 1, as in the aggregations
+        index = cast(pd.MultiIndex, df.index)
+        return df.set_axis(index.set_levels(index.levels[-1] + 1, level=-1), axis=0)
+
+    def _check_links(self, links: list[tuple[str, str]]) -> None:
+        if any([area_from, area_to] != sorted([area_from, area_to]) for area_from, area_to in links):
+            raise OutputDataRetrievalError(self.name, "Areas should be sorted alphabetically")
+
+    def get_mc_all_areas(self, frequency: Frequency, data_type: MCAllAreasDataType, areas: list[str]) -> pd.DataFrame:
+        """Get synthetic output data from a simulation for several areas at once.
+
+        Same as `get_mc_all_area` for each area, except that the files are read concurrently
+        and stacked in a single dataframe.
+
+        Args:
+            frequency: Whether "HOURLY", "DAILY", "WEEKLY", "MONTHLY" or "ANNUAL",
+                corresponding to the time step between each values in the output.
+            data_type: Whether "VALUES", "DETAILS", "DETAILS_ST_STORAGE", "DETAILS_RES",
+                "ID", corresponding to the nature of the result.
+            areas: The area IDs.
+
+        Returns:
+            A dataframe with the results of every area, one row per area and time step.
+
+                The rows are multi-indexed with `area` and `timeId` (starting at 1).
+                The columns are multi-indexed as for `get_mc_all_area`, those missing for an area are NaN.
+        """
+        file_paths = [((area,), f"mc-all/areas/{area}/{data_type.value}-{frequency.value}") for area in areas]
+        return self._get_stacked_matrices(file_paths, ["area"], frequency)
+
+    def get_mc_all_links(
+        self, frequency: Frequency, data_type: MCAllLinksDataType, links: list[tuple[str, str]]
+    ) -> pd.DataFrame:
+        """Get synthetic output data from a simulation for several links at once.
+
+        Same as `get_mc_all_link` for each link, except that the files are read concurrently
+        and stacked in a single dataframe.
+
+        Args:
+            frequency: Whether "HOURLY", "DAILY", "WEEKLY", "MONTHLY" or "ANNUAL",
+                corresponding to the time step between each values in the output.
+            data_type: Whether "VALUES", "ID", corresponding to the nature of the result.
+            links: The links, as (area_from, area_to) tuples sorted alphabetically.
+
+        Returns:
+            A dataframe with the results of every link, one row per link and time step.
+
+                The rows are multi-indexed with `link` (e.g. "de - fr") and `timeId` (starting at 1).
+                The columns are multi-indexed as for `get_mc_all_link`.
+        """
+        self._check_links(links)
+        file_paths = [
+            ((f"{area_from} - {area_to}",), f"mc-all/links/{area_from} - {area_to}/{data_type.value}-{frequency.value}")
+            for area_from, area_to in links
+        ]
+        return self._get_stacked_matrices(file_paths, ["link"], frequency)
+
+    def get_mc_ind_areas(
+        self, mc_years: list[int], frequency: Frequency, data_type: MCIndAreasDataType, areas: list[str]
+    ) -> pd.DataFrame:
+        """Get output data for several Monte-Carlo years and areas at once.
+
+        Same as `get_mc_ind_area` for each year and area, except that the files are read concurrently
+        and stacked in a single dataframe.
+
+        Args:
+            mc_years: Monte-Carlo years indexes.
+            frequency: Whether "HOURLY", "DAILY", "WEEKLY", "MONTHLY" or "ANNUAL",
+                corresponding to the time step between each values in the output.
+            data_type: Whether "VALUES", "DETAILS", "DETAILS_ST_STORAGE", "DETAILS_RES",
+                "ID", corresponding to the nature of the result.
+            areas: The area IDs.
+
+        Returns:
+            A dataframe with the results of every year and area, one row per year, area and time step.
+
+                The rows are multi-indexed with `mcYear`, `area` and `timeId` (starting at 1).
+                The columns are multi-indexed as for `get_mc_ind_area`, those missing for an area are NaN.
+        """
+        file_paths = [
+            ((mc_year, area), f"mc-ind/{mc_year:05}/areas/{area}/{data_type.value}-{frequency.value}")
+            for mc_year in mc_years
+            for area in areas
+        ]
+        return self._get_stacked_matrices(file_paths, ["mcYear", "area"], frequency)
+
+    def get_mc_ind_links(
+        self, mc_years: list[int], frequency: Frequency, data_type: MCIndLinksDataType, links: list[tuple[str, str]]
+    ) -> pd.DataFrame:
+        """Get output data for several Monte-Carlo years and links at once.
+
+        Same as `get_mc_ind_link` for each year and link, except that the files are read concurrently
+        and stacked in a single dataframe.
+
+        Args:
+            mc_years: Monte-Carlo years indexes.
+            frequency: Whether "HOURLY", "DAILY", "WEEKLY", "MONTHLY" or "ANNUAL",
+                corresponding to the time step between each values in the output.
+            data_type: Only possibility for the nature of the results which is "VALUES".
+            links: The links, as (area_from, area_to) tuples sorted alphabetically.
+
+        Returns:
+            A dataframe with the results of every year and link, one row per year, link and time step.
+
+                The rows are multi-indexed with `mcYear`, `link` (e.g. "de - fr") and `timeId` (starting at 1).
+                The columns are multi-indexed as for `get_mc_ind_link`.
+        """
+        self._check_links(links)
+        file_paths = [
+            (
+                (mc_year, f"{area_from} - {area_to}"),
+                f"mc-ind/{mc_year:05}/links/{area_from} - {area_to}/{data_type.value}-{frequency.value}",
+            )
+            for mc_year in mc_years
+            for area_from, area_to in links
+        ]
+        return self._get_stacked_matrices(file_paths, ["mcYear", "link"], frequency)
+
+    @overload
+    def aggregate_mc_ind_areas(
+        self,
+        data_type: MCIndAreasDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.PANDAS] = AggregationFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
     def aggregate_mc_ind_areas(
         self,
         data_type: MCIndAreasDataType,
@@ -540,7 +761,32 @@ class Output:
         mc_years: Optional[list[int]] = None,
         areas_ids: Optional[list[str]] = None,
         columns_names: Optional[list[str]] = None,
-    ) -> pd.DataFrame:
+        *,
+        output_format: Literal[AggregationFormat.POLARS],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def aggregate_mc_ind_areas(
+        self,
+        data_type: MCIndAreasDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.ARROW],
+    ) -> pa.Table: ...
+
+    def aggregate_mc_ind_areas(
+        self,
+        data_type: MCIndAreasDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: AggregationFormat = AggregationFormat.PANDAS,
+    ) -> AggregatedData:
         """Get an aggregation of individual results for specific areas.
 
         Given the parameters, it will aggregate data from files such as:
@@ -559,6 +805,8 @@ class Output:
             columns_names: List of the column names to fetch
                 (apart from those automatically generated by the aggregation see below).
                 If not indicated, all columns are taken in the aggregation.
+            output_format: Whether the aggregation is returned as a pandas dataframe (by default),
+                a polars dataframe or a pyarrow table. The last two are built without any pandas conversion.
 
         Returns:
             A dataframe aggregating all the data with at least the columns:
@@ -570,10 +818,12 @@ class Output:
             mc_years=mc_years,
             type_ids=areas_ids,
             columns_names=columns_names,
+            output_format=output_format,
         )
 
         return self._output_service.aggregate_values(self.name, aggregation_entry, "areas", "ind")
 
+    @overload
     def aggregate_mc_ind_links(
         self,
         data_type: MCIndLinksDataType,
@@ -581,7 +831,44 @@ class Output:
         mc_years: Optional[list[int]] = None,
         links_ids: Optional[list[tuple[str, str]]] = None,
         columns_names: Optional[list[str]] = None,
-    ) -> pd.DataFrame:
+        *,
+        output_format: Literal[AggregationFormat.PANDAS] = AggregationFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def aggregate_mc_ind_links(
+        self,
+        data_type: MCIndLinksDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.POLARS],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def aggregate_mc_ind_links(
+        self,
+        data_type: MCIndLinksDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.ARROW],
+    ) -> pa.Table: ...
+
+    def aggregate_mc_ind_links(
+        self,
+        data_type: MCIndLinksDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: AggregationFormat = AggregationFormat.PANDAS,
+    ) -> AggregatedData:
         """Get an aggregation of individual results for specific links.
 
         Given the parameters, it will aggregate data from files such as:
@@ -599,15 +886,13 @@ class Output:
             columns_names: List of the column names to fetch
                 (apart from those automatically generated by the aggregation see below).
                 If not indicated, all columns are taken into account for the aggregation.
+            output_format: Whether the aggregation is returned as a pandas dataframe (by default),
+                a polars dataframe or a pyarrow table. The last two are built without any pandas conversion.
 
         Returns:
             A dataframe aggregating all the data with at least the columns: `link`, `mcYear` and `timeId`.
         """
-        type_ids = (
-            [f"{area_from} - {area_to}" for link_id in links_ids for area_from, area_to in [sorted(link_id)]]
-            if links_ids
-            else None
-        )
+        type_ids = _format_links_ids(links_ids)
 
         aggregation_entry = AggregationEntry(
             data_type=data_type,
@@ -615,17 +900,53 @@ class Output:
             mc_years=mc_years,
             type_ids=type_ids,
             columns_names=columns_names,
+            output_format=output_format,
         )
 
         return self._output_service.aggregate_values(self.name, aggregation_entry, "links", "ind")
 
+    @overload
     def aggregate_mc_all_areas(
         self,
         data_type: MCAllAreasDataType,
         frequency: Frequency,
         areas_ids: Optional[list[str]] = None,
         columns_names: Optional[list[str]] = None,
-    ) -> pd.DataFrame:
+        *,
+        output_format: Literal[AggregationFormat.PANDAS] = AggregationFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def aggregate_mc_all_areas(
+        self,
+        data_type: MCAllAreasDataType,
+        frequency: Frequency,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.POLARS],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def aggregate_mc_all_areas(
+        self,
+        data_type: MCAllAreasDataType,
+        frequency: Frequency,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.ARROW],
+    ) -> pa.Table: ...
+
+    def aggregate_mc_all_areas(
+        self,
+        data_type: MCAllAreasDataType,
+        frequency: Frequency,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: AggregationFormat = AggregationFormat.PANDAS,
+    ) -> AggregatedData:
         """Get an aggregation of synthetic results for specific areas.
 
         Given the parameters, it will aggregate data from files such as:
@@ -642,6 +963,8 @@ class Output:
             columns_names: List of the column names to fetch
                 (apart from those automatically generated by the aggregation see below).
                 If not indicated, all columns are taken into account for the aggregation.
+            output_format: Whether the aggregation is returned as a pandas dataframe (by default),
+                a polars dataframe or a pyarrow table. The last two are built without any pandas conversion.
 
         Returns:
             A dataframe aggregating all the data.
@@ -658,17 +981,53 @@ class Output:
             frequency=frequency,
             type_ids=areas_ids,
             columns_names=columns_names,
+            output_format=output_format,
         )
 
         return self._output_service.aggregate_values(self.name, aggregation_entry, "areas", "all")
 
+    @overload
     def aggregate_mc_all_links(
         self,
         data_type: MCAllLinksDataType,
         frequency: Frequency,
         links_ids: Optional[list[tuple[str, str]]] = None,
         columns_names: Optional[list[str]] = None,
-    ) -> pd.DataFrame:
+        *,
+        output_format: Literal[AggregationFormat.PANDAS] = AggregationFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def aggregate_mc_all_links(
+        self,
+        data_type: MCAllLinksDataType,
+        frequency: Frequency,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.POLARS],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def aggregate_mc_all_links(
+        self,
+        data_type: MCAllLinksDataType,
+        frequency: Frequency,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: Literal[AggregationFormat.ARROW],
+    ) -> pa.Table: ...
+
+    def aggregate_mc_all_links(
+        self,
+        data_type: MCAllLinksDataType,
+        frequency: Frequency,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        *,
+        output_format: AggregationFormat = AggregationFormat.PANDAS,
+    ) -> AggregatedData:
         """Get an aggregation of synthetic results for specific links.
 
         Given the parameters, it will aggregate data from files such as:
@@ -684,6 +1043,8 @@ class Output:
             columns_names: List of the column names to fetch
                 (apart from those automatically generated by the aggregation see below).
                 If not indicated, all columns are taken into account for the aggregation.
+            output_format: Whether the aggregation is returned as a pandas dataframe (by default),
+                a polars dataframe or a pyarrow table. The last two are built without any pandas conversion.
 
         Returns:
             A dataframe aggregating all the data with at least the columns: `link` and `timeId`.
@@ -691,21 +1052,314 @@ class Output:
                 Those results are not multi indexed columns, the statistical metrics is appended to
                 the column name such as "EXP", "STD", "MAX" and "MIN".
         """
-        type_ids = (
-            [f"{area_from} - {area_to}" for link_id in links_ids for area_from, area_to in [sorted(link_id)]]
-            if links_ids
-            else None
-        )
+        type_ids = _format_links_ids(links_ids)
 
         aggregation_entry = AggregationEntry(
             data_type=data_type,
             frequency=frequency,
             type_ids=type_ids,
             columns_names=columns_names,
+            output_format=output_format,
         )
 
         return self._output_service.aggregate_values(self.name, aggregation_entry, "links", "all")
 
+    def aggregate_mc_ind_areas_to_parquet(
+        self,
+        path: Path,
+        data_type: MCIndAreasDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        partition_by: Sequence[str] = ("mcYear",),
+    ) -> pl.LazyFrame:
+        """Write an aggregation of individual results for specific areas to a parquet dataset.
+
+        Same as `aggregate_mc_ind_areas`, except that the aggregation is streamed to the disk
+        and never held in memory as a whole.
+
+        Args:
+            path: Folder of the parquet dataset, it should not exist or be empty.
+            data_type: See `aggregate_mc_ind_areas`.
+            frequency: See `aggregate_mc_ind_areas`.
+            mc_years: See `aggregate_mc_ind_areas`.
+            areas_ids: See `aggregate_mc_ind_areas`.
+            columns_names: See `aggregate_mc_ind_areas`.
+            partition_by: Columns used to partition the dataset (hive style), one folder per Monte-Carlo year
+                by default. If empty, the dataset is not partitioned.
+
+        Returns:
+            A polars lazy frame scanning the written dataset.
+        """
+        aggregation_entry = AggregationEntry(
+            data_type=data_type,
+            frequency=frequency,
+            mc_years=mc_years,
+            type_ids=areas_ids,
+            columns_names=columns_names,
+        )
+
+        return self._output_service.aggregate_values_to_parquet(
+            self.name, aggregation_entry, "areas", "ind", path, partition_by
+        )
+
+    def aggregate_mc_ind_links_to_parquet(
+        self,
+        path: Path,
+        data_type: MCIndLinksDataType,
+        frequency: Frequency,
+        mc_years: Optional[list[int]] = None,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        partition_by: Sequence[str] = ("mcYear",),
+    ) -> pl.LazyFrame:
+        """Write an aggregation of individual results for specific links to a parquet dataset.
+
+        Same as `aggregate_mc_ind_links`, except that the aggregation is streamed to the disk
+        and never held in memory as a whole.
+
+        Args:
+            path: Folder of the parquet dataset, it should not exist or be empty.
+            data_type: See `aggregate_mc_ind_links`.
+            frequency: See `aggregate_mc_ind_links`.
+            mc_years: See `aggregate_mc_ind_links`.
+            links_ids: See `aggregate_mc_ind_links`.
+            columns_names: See `aggregate_mc_ind_links`.
+            partition_by: Columns used to partition the dataset (hive style), one folder per Monte-Carlo year
+                by default. If empty, the dataset is not partitioned.
+
+        Returns:
+            A polars lazy frame scanning the written dataset.
+        """
+        aggregation_entry = AggregationEntry(
+            data_type=data_type,
+            frequency=frequency,
+            mc_years=mc_years,
+            type_ids=_format_links_ids(links_ids),
+            columns_names=columns_names,
+        )
+
+        return self._output_service.aggregate_values_to_parquet(
+            self.name, aggregation_entry, "links", "ind", path, partition_by
+        )
+
+    def aggregate_mc_all_areas_to_parquet(
+        self,
+        path: Path,
+        data_type: MCAllAreasDataType,
+        frequency: Frequency,
+        areas_ids: Optional[list[str]] = None,
+        columns_names: Optional[list[str]] = None,
+        partition_by: Sequence[str] = (),
+    ) -> pl.LazyFrame:
+        """Write an aggregation of synthetic results for specific areas to a parquet dataset.
+
+        Same as `aggregate_mc_all_areas`, except that the aggregation is streamed to the disk
+        and never held in memory as a whole.
+
+        Args:
+            path: Folder of the parquet dataset, it should not exist or be empty.
+            data_type: See `aggregate_mc_all_areas`.
+            frequency: See `aggregate_mc_all_areas`.
+            areas_ids: See `aggregate_mc_all_areas`.
+            columns_names: See `aggregate_mc_all_areas`.
+            partition_by: Columns used to partition the dataset (hive style), e.g. `["area"]`.
+                By default, the dataset is not partitioned.
+
+        Returns:
+            A polars lazy frame scanning the written dataset.
+        """
+        aggregation_entry = AggregationEntry(
+            data_type=data_type,
+            frequency=frequency,
+            type_ids=areas_ids,
+            columns_names=columns_names,
+        )
+
+        return self._output_service.aggregate_values_to_parquet(
+            self.name, aggregation_entry, "areas", "all", path, partition_by
+        )
+
+    def aggregate_mc_all_links_to_parquet(
+        self,
+        path: Path,
+        data_type: MCAllLinksDataType,
+        frequency: Frequency,
+        links_ids: Optional[list[tuple[str, str]]] = None,
+        columns_names: Optional[list[str]] = None,
+        partition_by: Sequence[str] = (),
+    ) -> pl.LazyFrame:
+        """Write an aggregation of synthetic results for specific links to a parquet dataset.
+
+        Same as `aggregate_mc_all_links`, except that the aggregation is streamed to the disk
+        and never held in memory as a whole.
+
+        Args:
+            path: Folder of the parquet dataset, it should not exist or be empty.
+            data_type: See `aggregate_mc_all_links`.
+            frequency: See `aggregate_mc_all_links`.
+            links_ids: See `aggregate_mc_all_links`.
+            columns_names: See `aggregate_mc_all_links`.
+            partition_by: Columns used to partition the dataset (hive style), e.g. `["link"]`.
+                By default, the dataset is not partitioned.
+
+        Returns:
+            A polars lazy frame scanning the written dataset.
+        """
+        aggregation_entry = AggregationEntry(
+            data_type=data_type,
+            frequency=frequency,
+            type_ids=_format_links_ids(links_ids),
+            columns_names=columns_names,
+        )
+
+        return self._output_service.aggregate_values_to_parquet(
+            self.name, aggregation_entry, "links", "all", path, partition_by
+        )
+
+    def compute_mc_statistics(
+        self,
+        data_type: MCIndAreasDataType | MCIndLinksDataType,
+        frequency: Frequency,
+        columns_names: Optional[list[str]] = None,
+        stats: Sequence[MCStatistic] = (MCStatistic.MEAN, MCStatistic.STD, MCStatistic.MIN, MCStatistic.MAX),
+        quantiles: Sequence[float] = (),
+        weights: Optional[dict[int, float]] = None,
+        mc_years: Optional[list[int]] = None,
+        ids: Optional[list[str] | list[tuple[str, str]]] = None,
+    ) -> pd.DataFrame:
+        """Compute statistics across Monte Carlo years of individual results for specific areas or links.
+
+        The individual results are read one Monte Carlo year at a time and folded into online accumulators,
+        so the memory only depends on the size of a year, not on the number of years. The results of API studies
+        are aggregated by the server and downloaded at once though, so their memory grows with the number of years.
+        Mean and standard deviation are computed with Welford's algorithm and quantiles are estimated
+        with the P² algorithm (exact up to 5 Monte Carlo years).
+
+        Args:
+            data_type: Individual results of areas (`MCIndAreasDataType`) or links (`MCIndLinksDataType`).
+            frequency: Whether "HOURLY", "DAILY", "WEEKLY", "MONTHLY", "ANNUAL".
+            columns_names: List of the column names to compute statistics on.
+                If not indicated, all columns are considered.
+            stats: The statistics to compute.
+            quantiles: The quantiles to estimate, between 0 and 1, e.g. `[0.5]` for the median.
+            weights: Weight of the Monte Carlo years, e.g. from the playlist. The missing years weigh 1.
+                Only the mean and the standard deviation are weighted, and it cannot be used with quantiles.
+                The years weighing 0 are ignored by every statistic.
+            mc_years: List of the Monte-Carlo years index to consider.
+                If not indicated, all Monte-Carlo years are considered.
+            ids: List of the area IDs or the links (as tuples of area IDs) to consider.
+                If not indicated, all areas or links are considered.
+
+        Returns:
+            A dataframe with the columns `area` or `link`, `timeId` and `cluster` if `data_type` is not "VALUES",
+            followed by one column per result column and statistic, e.g. `LOAD EXP`, `LOAD STD` or `LOAD Q50`.
+
+        Raises:
+            ValueError: If a quantile is not between 0 and 1, if a weight is negative,
+                or if both quantiles and weights are given.
+        """
+        object_type = "areas" if isinstance(data_type, MCIndAreasDataType) else "links"
+        if object_type == "links":
+            type_ids = _format_links_ids(cast(Optional[list[tuple[str, str]]], ids))
+        else:
+            type_ids = cast(Optional[list[str]], ids)
+        aggregation_entry = AggregationEntry(
+            data_type=data_type,
+            frequency=frequency,
+            mc_years=mc_years,
+            type_ids=type_ids,
+            columns_names=columns_names,
+            output_format=AggregationFormat.POLARS,
+        )
+
+        return self._output_service.compute_mc_statistics(
+            self.name, aggregation_entry, object_type, stats, quantiles, weights
+        )
+
+    def to_cube(
+        self,
+        variables: list[str],
+        data_type: MCIndAreasDataType | MCIndLinksDataType,
+        frequency: Frequency,
+        ids: Optional[list[str] | list[tuple[str, str]]] = None,
+        mc_years: Optional[list[int]] = None,
+        dtype: npt.DTypeLike = np.float64,
+        memmap_dir: Optional[Path] = None,
+    ) -> OutputCube:
+        """Gather individual results of areas or links in one (Monte-Carlo year, time step, area/link) array per variable.
+
+        The arrays are preallocated and directly filled from the parsed files, without building
+        the long format dataframe of the aggregations. This is both faster and lighter in memory,
+        in particular with `float32` values.
+
+        Args:
+            variables: Names of the variables to gather, e.g. `["LOAD", "MRG. PRICE"]` (case-insensitive).
+                A variable missing from the output is filled with NaN.
+            data_type: Whether the "VALUES" of the areas (`MCIndAreasDataType`) or of the links (`MCIndLinksDataType`).
+            frequency: Whether "HOURLY", "DAILY", "WEEKLY", "MONTHLY", "ANNUAL".
+            ids: List of the area IDs or the links (as tuples of area IDs) to gather.
+                If not indicated, all areas or links are gathered.
+            mc_years: List of the Monte-Carlo years index to gather.
+                If not indicated, all Monte-Carlo years are gathered.
+            dtype: Type of the values, `np.float64` by default. `np.float32` halves the memory.
+            memmap_dir: If given, each array is a memory-mapped `<variable>.npy` file of this folder,
+                which can be opened again later with `np.load(..., mmap_mode="r")`.
+
+        Returns:
+            The Monte-Carlo years and IDs along the axes of the arrays, and the arrays keyed by variable.
+
+        Raises:
+            ValueError: If no variable is given or if `data_type` is not "VALUES".
+        """
+        if not variables:
+            raise ValueError("At least one variable should be given to build a cube")
+        if data_type.value != MCIndAreasDataType.VALUES.value:
+            raise ValueError(f"Only the values of areas and links can be gathered in a cube, got {data_type.value}")
+
+        object_type = "areas" if isinstance(data_type, MCIndAreasDataType) else "links"
+        if object_type == "links":
+            type_ids = _format_links_ids(cast(Optional[list[tuple[str, str]]], ids))
+        else:
+            type_ids = cast(Optional[list[str]], ids)
+        aggregation_entry = AggregationEntry(
+            data_type=data_type,
+            frequency=frequency,
+            mc_years=mc_years,
+            type_ids=type_ids,
+            columns_names=variables,
+            output_format=AggregationFormat.POLARS,
+        )
+
+        return self._output_service.to_cube(self.name, aggregation_entry, object_type, dtype, memmap_dir)
+
+    def convert_to_parquet(self, dest: Path, compression: ParquetCompression = "zstd") -> None:
+        """Convert the whole output into parquet datasets, which are then read instead of the output files.
+
+        Individual and synthetic results of the areas, links and binding constraints are converted,
+        along with the time series numbers. Each kind of file (e.g. the hourly values of the areas
+        in individual results) becomes a dataset, partitioned by Monte-Carlo year for individual results.
+        A `manifest.json` file describes the datasets.
+
+        Once converted, the `get_mc_*`, `aggregate_mc_*`, `compute_mc_statistics`, `to_cube` and
+        `get_*_ts_numbers` methods read the datasets instead of parsing the output files:
+        only the requested years, areas or links and columns are read. The datasets are ignored
+        if the output changes afterward. The output itself is never modified: the datasets are only used
+        by the next sessions if the study is read with a `matrix_cache_dir`, where their location is recorded.
+
+        Only available for local studies.
+
+        Args:
+            dest: Folder of the datasets. It should not exist or be empty.
+            compression: Compression codec of the parquet files, "zstd" by default.
+
+        Raises:
+            FileExistsError: If the `dest` folder is not empty.
+            OutputConversionError: If the output cannot be converted, e.g. for a study of AntaREST.
+        """
+        self._output_service.convert_to_parquet(self.name, dest, compression)
+
     def get_xpansion_result(self) -> XpansionResult:
         """Get xpansion result.
 
@@ -797,3 +1451,20 @@ class Output:
         return self._output_service.get_st_storage_additional_constraints_numbers(
             area_id, st_storage_id, constraint_id, self._name
         )
+
+    def get_all_ts_numbers(self, kind: TsNumbersKind) -> pd.DataFrame:
+        """Get the time series numbers of every object of the given kind at once.
+
+        All the files of `ts-numbers/<kind>` are read in one pass, which is much faster
+        than calling the per-object getters for each area, link or cluster.
+
+        Args:
+            kind: Kind of objects, e.g. `TsNumbersKind.THERMAL`.
+
+        Returns:
+            An integer dataframe indexed by Monte-Carlo year (`mcYear`, starting at 1) with one column per object.
+            Columns are named after the path of the object file inside the `ts-numbers/<kind>` folder,
+            without extension, e.g. `fr` for a load, `fr/gas_1` for a thermal cluster
+            or `de/fr` for a link.
+        """
+        return self._output_service.get_all_ts_numbers(kind, self._name)
@@ -11,15 +11,18 @@
 # This file is part of the Antares project.
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, cast
+from typing import Literal, Optional, Sequence, cast, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from typing_extensions import override
 
 from antares.craft.model.cluster import ClusterProperties, ClusterPropertiesUpdate
 from antares.craft.service.base_services import BaseRenewableService
 from antares.craft.tools.contents_tool import EnumIgnoreCase, transform_name_to_id
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 
 
 class RenewableClusterGroup(EnumIgnoreCase):
@@ -149,13 +152,38 @@ class RenewableCluster:
         self._properties = new_properties[self]
         return self._properties
 
-    def get_timeseries(self) -> pd.DataFrame:
+    @overload
+    def get_timeseries(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_timeseries(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_timeseries(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_timeseries(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get renewable availability time-series.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             Renewable time-series.
         """
-        return self._renewable_service.get_renewable_matrix(self.id, self.area_id)
+        return self._renewable_service.get_renewable_matrix(
+            self.id, self.area_id, columns=columns, output_format=output_format
+        )
 
     def set_series(self, matrix: pd.DataFrame) -> None:
         """Set renewable availability time-series.
@@ -11,12 +11,15 @@
 # This file is part of the Antares project.
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Optional
+from typing import Literal, Optional, Sequence, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft.service.base_services import BaseShortTermStorageService
 from antares.craft.tools.contents_tool import EnumIgnoreCase, transform_name_to_id
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import STStorageMatrixName
 
 
@@ -276,85 +279,315 @@ class STStorage:
         self._properties = new_properties[self]
         return self._properties
 
-    def get_pmax_injection(self) -> pd.DataFrame:
+    @overload
+    def get_pmax_injection(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_pmax_injection(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_pmax_injection(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_pmax_injection(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the maximum injection power time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The maximum injection power dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.PMAX_INJECTION)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.PMAX_INJECTION, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_pmax_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_pmax_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_pmax_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
 
-    def get_pmax_withdrawal(self) -> pd.DataFrame:
+    def get_pmax_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the maximum withdrawal power time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The maximum withdrawal power dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.PMAX_WITHDRAWAL)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.PMAX_WITHDRAWAL, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_lower_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
 
-    def get_lower_rule_curve(self) -> pd.DataFrame:
+    @overload
+    def get_lower_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_lower_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_lower_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the lower rule curve time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The lower rule curve dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.LOWER_CURVE_RULE)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.LOWER_CURVE_RULE, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_upper_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_upper_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_upper_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
 
-    def get_upper_rule_curve(self) -> pd.DataFrame:
+    def get_upper_rule_curve(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the upper rule curve time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The upper rule curve dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.UPPER_RULE_CURVE)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.UPPER_RULE_CURVE, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_storage_inflows(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
 
-    def get_storage_inflows(self) -> pd.DataFrame:
+    @overload
+    def get_storage_inflows(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_storage_inflows(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_storage_inflows(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the natural inflow time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The natural inflow dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.INFLOWS)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.INFLOWS, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_cost_injection(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_cost_injection(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_cost_injection(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
 
-    def get_cost_injection(self) -> pd.DataFrame:
+    def get_cost_injection(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the injection cost time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The injection cost dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.COST_INJECTION)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.COST_INJECTION, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_cost_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
 
-    def get_cost_withdrawal(self) -> pd.DataFrame:
+    @overload
+    def get_cost_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_cost_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_cost_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the withdrawal cost time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The withdrawal cost dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.COST_WITHDRAWAL)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.COST_WITHDRAWAL, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_cost_level(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_cost_level(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_cost_level(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
 
-    def get_cost_level(self) -> pd.DataFrame:
+    def get_cost_level(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the level cost time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The level cost dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.COST_LEVEL)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.COST_LEVEL, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_cost_variation_injection(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
 
-    def get_cost_variation_injection(self) -> pd.DataFrame:
+    @overload
+    def get_cost_variation_injection(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_cost_variation_injection(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_cost_variation_injection(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the variation injection cost time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The variation injection cost dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.COST_VARIATION_INJECTION)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.COST_VARIATION_INJECTION, columns=columns, output_format=output_format
+        )
+
+    @overload
+    def get_cost_variation_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_cost_variation_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_cost_variation_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
 
-    def get_cost_variation_withdrawal(self) -> pd.DataFrame:
+    def get_cost_variation_withdrawal(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get the variation withdrawal cost time series.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The variation withdrawal cost dataframe.
         """
-        return self._storage_service.get_storage_matrix(self, STStorageMatrixName.COST_VARIATION_WITHDRAWAL)
+        return self._storage_service.get_storage_matrix(
+            self, STStorageMatrixName.COST_VARIATION_WITHDRAWAL, columns=columns, output_format=output_format
+        )
 
     def set_pmax_injection(self, p_max_injection_matrix: pd.DataFrame) -> None:
         """Set the maximum injection power time series.
@@ -477,16 +710,47 @@ class STStorage:
         for ids in constraint_ids:
             del self._constraints[ids]
 
-    def get_constraint_term(self, constraint_id: str) -> pd.DataFrame:
+    @overload
+    def get_constraint_term(
+        self,
+        constraint_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_constraint_term(
+        self,
+        constraint_id: str,
+        columns: Optional[Sequence[int]] = None,
+        *,
+        output_format: Literal[MatrixFormat.POLARS],
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_constraint_term(
+        self, constraint_id: str, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_constraint_term(
+        self,
+        constraint_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         """Get constraint term.
 
         Args:
             constraint_id: The constraint ID.
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
 
         Returns:
             The constraint term dataframe.
         """
-        return self._storage_service.get_constraint_term(self._area_id, self._id, constraint_id)
+        return self._storage_service.get_constraint_term(
+            self._area_id, self._id, constraint_id, columns=columns, output_format=output_format
+        )
 
     def set_constraint_term(self, constraint_id: str, matrix: pd.DataFrame) -> None:
         """Set constraint term.
@@ -12,9 +12,11 @@
 from dataclasses import replace
 from pathlib import Path, PurePath
 from types import MappingProxyType
-from typing import Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, cast, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft import (
     APIconf,
@@ -50,6 +52,7 @@ from antares.craft.model.st_storage import STStorage
 from antares.craft.model.thermal import ThermalCluster, ThermalClusterPropertiesUpdate
 from antares.craft.model.xpansion.xpansion_configuration import XpansionConfiguration
 from antares.craft.service.base_services import BaseLinkService, BaseStudyService, StudyServices
+from antares.craft.tools.matrix_tool import MatrixFormat, TimeSeriesRequest
 from antares.study.version import StudyVersion
 
 """
@@ -353,18 +356,23 @@ class Study:
         """
         return self._run_service.run_antares_simulation(parameters)
 
-    def wait_job_completion(self, job: Job, time_out: int = 172800) -> None:
+    def wait_job_completion(
+        self, job: Job, time_out: int = 172800, on_poll: Optional[Callable[[Job], object]] = None
+    ) -> None:
         """
         Waits for the completion of a job.
 
         Args:
             job: The job to wait for
             time_out: Time limit for waiting (seconds), default: 172800s
+            on_poll: Called with the job each time its status is checked while it runs.
+                For a local simulation written unzipped, `job.output_id` is then the output being written,
+                e.g. to follow it with an `IncrementalAggregator`.
 
         Raises:
             SimulationTimeOutError: if exceeded timeout
         """
-        self._run_service.wait_job_completion(job, time_out)
+        self._run_service.wait_job_completion(job, time_out, on_poll)
         self._read_outputs()
 
     def _read_outputs(self) -> None:
@@ -550,6 +558,50 @@ class Study:
         scenario_builder.validate_against_version(self._version)
         self._study_service.set_scenario_builder(scenario_builder)
 
+    @overload
+    def read_timeseries_many(
+        self,
+        requests: Sequence[TimeSeriesRequest],
+        max_workers: Optional[int] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> dict[TimeSeriesRequest, pd.DataFrame]: ...
+
+    @overload
+    def read_timeseries_many(
+        self,
+        requests: Sequence[TimeSeriesRequest],
+        max_workers: Optional[int] = None,
+        *,
+        output_format: Literal[MatrixFormat.POLARS],
+    ) -> dict[TimeSeriesRequest, pl.DataFrame]: ...
+
+    @overload
+    def read_timeseries_many(
+        self,
+        requests: Sequence[TimeSeriesRequest],
+        max_workers: Optional[int] = None,
+        *,
+        output_format: Literal[MatrixFormat.NUMPY],
+    ) -> dict[TimeSeriesRequest, np.ndarray]: ...
+
+    def read_timeseries_many(
+        self,
+        requests: Sequence[TimeSeriesRequest],
+        max_workers: Optional[int] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> dict[TimeSeriesRequest, Any]:
+        """Reads several matrices of the study concurrently.
+
+        Args:
+            requests: Matrices to read. Duplicated requests are only read once.
+            max_workers: Maximum number of matrices read in parallel. Defaults to the `ThreadPoolExecutor` default.
+            output_format: Type of the returned matrices.
+
+        Returns:
+            The matrices keyed by request, in the order of the given requests.
+        """
+        return self._study_service.read_timeseries_many(requests, max_workers, output_format)
+
     @property
     def xpansion(self) -> XpansionConfiguration:
         """Xpansion configuration."""
@@ -592,7 +644,9 @@ class Study:
 # import mechanics, we need to use local imports to avoid circular dependencies.
 
 
-def create_study_local(study_name: str, version: str, parent_directory: Path | str) -> "Study":
+def create_study_local(
+    study_name: str, version: str, parent_directory: Path | str, matrix_store_dir: Optional[Path | str] = None
+) -> "Study":
     """
     Creates a new study on your filesystem.
 
@@ -600,28 +654,53 @@ def create_study_local(study_name: str, version: str, parent_directory: Path | s
         study_name: the name of the created study
         version: the study version, for example "8.8"
         parent_directory: the directory where the new study will be created
+        matrix_store_dir: if given, written input matrices are stored once in this folder and hard linked
+            into the study, so that identical matrices only take disk space once
 
     Returns:
         a Study object representing the newly created study
     """
     from antares.craft.service.local_services.factory import create_study_local
 
-    return create_study_local(study_name, version, parent_directory)
+    return create_study_local(study_name, version, parent_directory, matrix_store_dir)
 
 
-def read_study_local(study_path: Path | str) -> "Study":
+def read_study_local(
+    study_path: Path | str,
+    matrix_cache_dir: Optional[Path | str] = None,
+    memory_map_matrices: bool = False,
+    matrix_memory_cache_size: Optional[int] = None,
+    matrix_store_dir: Optional[Path | str] = None,
+    output_aggregation_workers: int = 1,
+) -> "Study":
     """
     Reads an existing study on your filesystem.
 
     Parameters:
         study_path: the path to the existing study on your filesystem
+        matrix_cache_dir: if given, a binary copy of every read input matrix is stored in this folder
+            so that the next reads of an unchanged matrix skip the text parsing
+        memory_map_matrices: if True, input matrices are returned as read-only dataframes backed by a
+            memory-mapped copy stored in `matrix_cache_dir`, shared between every process reading them
+        matrix_memory_cache_size: size in bytes of an in-memory LRU cache of the input matrices
+        matrix_store_dir: if given, written input matrices are stored once in this folder and hard linked
+            into the study, so that identical matrices only take disk space once
+        output_aggregation_workers: number of threads parsing the output files when aggregating results,
+            the order of the aggregated rows doesn't depend on it
 
     Returns:
         a Study object representing the study on disk
     """
     from antares.craft.service.local_services.factory import read_study_local
 
-    return read_study_local(study_path)
+    return read_study_local(
+        study_path,
+        matrix_cache_dir,
+        memory_map_matrices,
+        matrix_memory_cache_size,
+        matrix_store_dir,
+        output_aggregation_workers,
+    )
 
 
 def create_study_api(study_name: str, version: str, api_config: APIconf, parent_path: Path | None = None) -> "Study":
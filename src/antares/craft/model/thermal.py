@@ -11,15 +11,18 @@
 # This file is part of the Antares project.
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, cast
+from typing import Literal, Optional, Sequence, cast, overload
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from typing_extensions import override
 
 from antares.craft.model.cluster import ClusterProperties, ClusterPropertiesUpdate
 from antares.craft.service.base_services import BaseThermalService
 from antares.craft.tools.contents_tool import EnumIgnoreCase, transform_name_to_id
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import ThermalClusterMatrixName
 
 
@@ -293,45 +296,170 @@ class ThermalCluster:
         self._properties = new_properties[self]
         return self._properties
 
-    def get_prepro_data_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_prepro_data_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_prepro_data_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_prepro_data_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_prepro_data_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get matrix corresponding to the TS-GENERATOR matrix in AntaresWeb.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             matrix: Matrix with outage probabilities and durations to use inside the timeseries generation.
         """
-        return self._thermal_service.get_thermal_matrix(self, ThermalClusterMatrixName.PREPRO_DATA)
+        return self._thermal_service.get_thermal_matrix(
+            self, ThermalClusterMatrixName.PREPRO_DATA, columns=columns, output_format=output_format
+        )
 
-    def get_prepro_modulation_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_prepro_modulation_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_prepro_modulation_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_prepro_modulation_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_prepro_modulation_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get matrix corresponding to the COMMON matrix in AntaresWeb.
 
+        Args:
+            columns: Indices of the columns to read. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             matrix: Matrix for the "Marginal cost modulation", "Market bid modulation", "Capacity modulation" and "Min gen modulation".
         """
-        return self._thermal_service.get_thermal_matrix(self, ThermalClusterMatrixName.PREPRO_MODULATION)
+        return self._thermal_service.get_thermal_matrix(
+            self, ThermalClusterMatrixName.PREPRO_MODULATION, columns=columns, output_format=output_format
+        )
 
-    def get_series_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_series_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_series_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_series_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_series_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get availibility matrix.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The availibility time-series of the thermal cluster.
         """
-        return self._thermal_service.get_thermal_matrix(self, ThermalClusterMatrixName.SERIES)
+        return self._thermal_service.get_thermal_matrix(
+            self, ThermalClusterMatrixName.SERIES, columns=columns, output_format=output_format
+        )
 
-    def get_co2_cost_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_co2_cost_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_co2_cost_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_co2_cost_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_co2_cost_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get $\\ce{CO2}$ cost matrix.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The $\\ce{CO2}$ cost matrix.
         """
-        return self._thermal_service.get_thermal_matrix(self, ThermalClusterMatrixName.SERIES_CO2_COST)
+        return self._thermal_service.get_thermal_matrix(
+            self, ThermalClusterMatrixName.SERIES_CO2_COST, columns=columns, output_format=output_format
+        )
 
-    def get_fuel_cost_matrix(self) -> pd.DataFrame:
+    @overload
+    def get_fuel_cost_matrix(
+        self,
+        columns: Optional[Sequence[int]] = None,
+        output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    ) -> pd.DataFrame: ...
+
+    @overload
+    def get_fuel_cost_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.POLARS]
+    ) -> pl.DataFrame: ...
+
+    @overload
+    def get_fuel_cost_matrix(
+        self, columns: Optional[Sequence[int]] = None, *, output_format: Literal[MatrixFormat.NUMPY]
+    ) -> np.ndarray: ...
+
+    def get_fuel_cost_matrix(
+        self, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """Get fuel cost matrix.
 
+        Args:
+            columns: Indices of the columns to read, e.g. some Monte Carlo years. All the columns by default.
+            output_format: Type of the returned matrix, pandas by default.
+
         Returns:
             The fuel cost matrix.
         """
-        return self._thermal_service.get_thermal_matrix(self, ThermalClusterMatrixName.SERIES_FUEL_COST)
+        return self._thermal_service.get_thermal_matrix(
+            self, ThermalClusterMatrixName.SERIES_FUEL_COST, columns=columns, output_format=output_format
+        )
 
     def set_prepro_data(self, matrix: pd.DataFrame) -> None:
         """Set matrix corresponding to the TS-GENERATOR matrix in AntaresWeb.
@@ -10,7 +10,7 @@
 #
 # This file is part of the Antares project.
 
-from typing import Dict, Optional, cast
+from typing import Dict, Optional, Sequence, cast
 
 import pandas as pd
 
@@ -47,7 +47,7 @@ from antares.craft.service.api_services.models.st_storage import (
 )
 from antares.craft.service.api_services.models.thermal import ThermalClusterPropertiesAPI
 from antares.craft.service.api_services.services.hydro import HydroApiService
-from antares.craft.service.api_services.utils import get_matrix, update_series
+from antares.craft.service.api_services.utils import get_matrix, invalidate_matrices, update_series
 from antares.craft.service.base_services import (
     BaseAreaService,
     BaseHydroService,
@@ -55,6 +55,7 @@ from antares.craft.service.base_services import (
     BaseShortTermStorageService,
     BaseThermalService,
 )
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 
 
 class AreaApiService(BaseAreaService):
@@ -276,7 +277,14 @@ class AreaApiService(BaseAreaService):
             expected_rows = 8760
             if rows_number < expected_rows:
                 raise MatrixUploadError(area_id, "load", f"Expected {expected_rows} rows and received {rows_number}.")
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                series_path,
+                cache=self.api_config.matrix_memory_cache,
+            )
         except APIError as e:
             raise MatrixUploadError(area_id, "load", e.message) from e
 
@@ -284,7 +292,14 @@ class AreaApiService(BaseAreaService):
     def set_wind(self, area_id: str, series: pd.DataFrame) -> None:
         try:
             series_path = f"input/wind/series/wind_{area_id}"
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                series_path,
+                cache=self.api_config.matrix_memory_cache,
+            )
         except APIError as e:
             raise MatrixUploadError(area_id, "wind", e.message) from e
 
@@ -292,7 +307,14 @@ class AreaApiService(BaseAreaService):
     def set_reserves(self, area_id: str, series: pd.DataFrame) -> None:
         try:
             series_path = f"input/reserves/{area_id}"
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                series_path,
+                cache=self.api_config.matrix_memory_cache,
+            )
         except APIError as e:
             raise MatrixUploadError(area_id, "reserves", e.message) from e
 
@@ -300,7 +322,14 @@ class AreaApiService(BaseAreaService):
     def set_solar(self, area_id: str, series: pd.DataFrame) -> None:
         try:
             series_path = f"input/solar/series/solar_{area_id}"
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                series_path,
+                cache=self.api_config.matrix_memory_cache,
+            )
         except APIError as e:
             raise MatrixUploadError(area_id, "solar", e.message) from e
 
@@ -308,7 +337,14 @@ class AreaApiService(BaseAreaService):
     def set_misc_gen(self, area_id: str, series: pd.DataFrame) -> None:
         try:
             series_path = f"input/misc-gen/miscgen-{area_id}"
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                series_path,
+                cache=self.api_config.matrix_memory_cache,
+            )
         except APIError as e:
             raise MatrixUploadError(area_id, "misc-gen", e.message) from e
 
@@ -343,6 +379,8 @@ class AreaApiService(BaseAreaService):
             self._wrapper.delete(url)
         except APIError as e:
             raise AreaDeletionError(area_id, e.message) from e
+        # The matrices of the area, its links and its clusters are spread over the whole input folder.
+        invalidate_matrices(self.api_config.matrix_memory_cache, self.study_id)
 
     @override
     def delete_thermal_clusters(self, area_id: str, clusters: list[ThermalCluster]) -> None:
@@ -352,6 +390,13 @@ class AreaApiService(BaseAreaService):
             self._wrapper.delete(url, json=body)
         except APIError as e:
             raise ThermalDeletionError(area_id, body, e.message) from e
+        for cluster_id in body:
+            for keyword in ["series", "prepro"]:
+                invalidate_matrices(
+                    self.api_config.matrix_memory_cache,
+                    self.study_id,
+                    f"input/thermal/{keyword}/{area_id}/{cluster_id}/",
+                )
 
     @override
     def delete_renewable_clusters(self, area_id: str, clusters: list[RenewableCluster]) -> None:
@@ -361,6 +406,10 @@ class AreaApiService(BaseAreaService):
             self._wrapper.delete(url, json=body)
         except APIError as e:
             raise RenewableDeletionError(area_id, body, e.message) from e
+        for cluster_id in body:
+            invalidate_matrices(
+                self.api_config.matrix_memory_cache, self.study_id, f"input/renewables/series/{area_id}/{cluster_id}/"
+            )
 
     @override
     def delete_st_storages(self, area_id: str, storages: list[STStorage]) -> None:
@@ -370,39 +419,96 @@ class AreaApiService(BaseAreaService):
             self._wrapper.delete(url, json=body)
         except APIError as e:
             raise STStorageDeletionError(area_id, body, e.message) from e
+        for storage_id in body:
+            for folder in ["series", "constraints"]:
+                invalidate_matrices(
+                    self.api_config.matrix_memory_cache,
+                    self.study_id,
+                    f"input/st-storage/{folder}/{area_id}/{storage_id}/",
+                )
 
     @override
-    def get_load_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_load_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/load/series/load_{area_id}")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/load/series/load_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "load", e.message)
 
     @override
-    def get_solar_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_solar_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/solar/series/solar_{area_id}")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/solar/series/solar_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "solar", e.message)
 
     @override
-    def get_wind_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_wind_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/wind/series/wind_{area_id}")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/wind/series/wind_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "wind", e.message)
 
     @override
-    def get_reserves_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_reserves_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/reserves/{area_id}")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/reserves/{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "reserves", e.message)
 
     @override
-    def get_misc_gen_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_misc_gen_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/misc-gen/miscgen-{area_id}")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/misc-gen/miscgen-{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "misc-gen", e.message)
 
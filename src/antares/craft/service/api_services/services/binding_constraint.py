@@ -12,7 +12,7 @@
 
 from dataclasses import asdict
 from pathlib import PurePosixPath
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import pandas as pd
 
@@ -35,8 +35,9 @@ from antares.craft.model.binding_constraint import (
     ConstraintTerm,
 )
 from antares.craft.service.api_services.models.binding_constraint import BindingConstraintPropertiesAPI
-from antares.craft.service.api_services.utils import get_matrix
+from antares.craft.service.api_services.utils import get_matrix, invalidate_matrices
 from antares.craft.service.base_services import BaseBindingConstraintService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import ConstraintMatrixName
 
 
@@ -48,6 +49,10 @@ class BindingConstraintApiService(BaseBindingConstraintService):
         self._wrapper = RequestWrapper(self.api_config.set_up_api_conf())
         self._base_url = f"{self.api_config.get_host()}/api/v1"
 
+    def _invalidate_cached_matrices(self, matrix_prefix: str) -> None:
+        path = PurePosixPath("input") / "bindingconstraints" / matrix_prefix
+        invalidate_matrices(self.api_config.matrix_memory_cache, self.study_id, path.as_posix())
+
     @override
     def create_binding_constraint(
         self,
@@ -110,15 +115,30 @@ class BindingConstraintApiService(BaseBindingConstraintService):
         except APIError as e:
             raise BindingConstraintCreationError(name, e.message) from e
 
+        self._invalidate_cached_matrices(f"{bc_id}_")
         constraint = BindingConstraint(bc_id, name, self, bc_properties, terms)
 
         return constraint
 
     @override
-    def get_constraint_matrix(self, constraint: BindingConstraint, matrix_name: ConstraintMatrixName) -> pd.DataFrame:
+    def get_constraint_matrix(
+        self,
+        constraint: BindingConstraint,
+        matrix_name: ConstraintMatrixName,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         try:
             path = PurePosixPath("input") / "bindingconstraints" / f"{constraint.id}_{matrix_name.value}"
-            return get_matrix(self._base_url, self.study_id, self._wrapper, path.as_posix())
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                path.as_posix(),
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise ConstraintMatrixDownloadError(constraint.id, matrix_name.value, e.message) from e
 
@@ -137,6 +157,7 @@ class BindingConstraintApiService(BaseBindingConstraintService):
             self._wrapper.put(url, json=body)
         except APIError as e:
             raise ConstraintMatrixUpdateError(constraint.id, matrix_name.value, e.message) from e
+        self._invalidate_cached_matrices(f"{constraint.id}_{matrix_name.value}")
 
     @override
     def update_binding_constraints_properties(
@@ -162,6 +183,10 @@ class BindingConstraintApiService(BaseBindingConstraintService):
         except APIError as e:
             raise ConstraintsPropertiesUpdateError(self.study_id, e.message) from e
 
+        # Changing the operator of a constraint moves its matrices
+        for bc_id in updated_constraints:
+            self._invalidate_cached_matrices(f"{bc_id}_")
+
         return updated_constraints
 
     @override
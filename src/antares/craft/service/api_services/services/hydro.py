@@ -10,6 +10,8 @@
 #
 # This file is part of the Antares project.
 
+from typing import Optional, Sequence
+
 import pandas as pd
 
 from typing_extensions import override
@@ -41,6 +43,7 @@ from antares.craft.service.api_services.models.hydro import (
 )
 from antares.craft.service.api_services.utils import get_matrix, update_series
 from antares.craft.service.base_services import BaseHydroService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 
 
 class HydroApiService(BaseHydroService):
@@ -107,75 +110,155 @@ class HydroApiService(BaseHydroService):
             raise HydroAllocationUpdateError(area_id, e.message) from e
 
     @override
-    def get_maxpower(self, area_id: str) -> pd.DataFrame:
+    def get_maxpower(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
             return get_matrix(
-                self._base_url, self.study_id, self._wrapper, f"input/hydro/common/capacity/maxpower_{area_id}"
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/common/capacity/maxpower_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
             )
         except APIError as e:
             raise MatrixDownloadError(area_id, "maxpower", e.message) from e
 
     @override
-    def get_reservoir(self, area_id: str) -> pd.DataFrame:
+    def get_reservoir(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
             return get_matrix(
-                self._base_url, self.study_id, self._wrapper, f"input/hydro/common/capacity/reservoir_{area_id}"
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/common/capacity/reservoir_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
             )
         except APIError as e:
             raise MatrixDownloadError(area_id, "reservoir", e.message) from e
 
     @override
-    def get_inflow_pattern(self, area_id: str) -> pd.DataFrame:
+    def get_inflow_pattern(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
             return get_matrix(
-                self._base_url, self.study_id, self._wrapper, f"input/hydro/common/capacity/inflowPattern_{area_id}"
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/common/capacity/inflowPattern_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
             )
         except APIError as e:
             raise MatrixDownloadError(area_id, "inflow_pattern", e.message) from e
 
     @override
-    def get_credit_modulations(self, area_id: str) -> pd.DataFrame:
+    def get_credit_modulations(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
             return get_matrix(
-                self._base_url, self.study_id, self._wrapper, f"input/hydro/common/capacity/creditmodulations_{area_id}"
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/common/capacity/creditmodulations_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
             )
         except APIError as e:
             raise MatrixDownloadError(area_id, "credit_modulations", e.message) from e
 
     @override
-    def get_water_values(self, area_id: str) -> pd.DataFrame:
+    def get_water_values(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
             return get_matrix(
-                self._base_url, self.study_id, self._wrapper, f"input/hydro/common/capacity/waterValues_{area_id}"
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/common/capacity/waterValues_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
             )
         except APIError as e:
             raise MatrixDownloadError(area_id, "water_values", e.message) from e
 
     @override
-    def get_ror_series(self, area_id: str) -> pd.DataFrame:
+    def get_ror_series(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/hydro/series/{area_id}/ror")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/series/{area_id}/ror",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "ror", e.message) from e
 
     @override
-    def get_mod_series(self, area_id: str) -> pd.DataFrame:
+    def get_mod_series(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/hydro/series/{area_id}/mod")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/series/{area_id}/mod",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "mod", e.message) from e
 
     @override
-    def get_mingen(self, area_id: str) -> pd.DataFrame:
+    def get_mingen(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/hydro/series/{area_id}/mingen")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/series/{area_id}/mingen",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "mingen", e.message) from e
 
     @override
-    def get_energy(self, area_id: str) -> pd.DataFrame:
+    def get_energy(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, f"input/hydro/prepro/{area_id}/energy")
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                f"input/hydro/prepro/{area_id}/energy",
+                cache=self.api_config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise MatrixDownloadError(area_id, "energy", e.message) from e
 
@@ -183,7 +266,12 @@ class HydroApiService(BaseHydroService):
     def set_maxpower(self, area_id: str, series: pd.DataFrame) -> None:
         try:
             update_series(
-                self._base_url, self.study_id, self._wrapper, series, f"input/hydro/common/capacity/maxpower_{area_id}"
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                f"input/hydro/common/capacity/maxpower_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "max_power", e.message) from e
@@ -192,7 +280,12 @@ class HydroApiService(BaseHydroService):
     def set_reservoir(self, area_id: str, series: pd.DataFrame) -> None:
         try:
             update_series(
-                self._base_url, self.study_id, self._wrapper, series, f"input/hydro/common/capacity/reservoir_{area_id}"
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                f"input/hydro/common/capacity/reservoir_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "reservoir", e.message) from e
@@ -206,6 +299,7 @@ class HydroApiService(BaseHydroService):
                 self._wrapper,
                 series,
                 f"input/hydro/common/capacity/inflowPattern_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "inflow_pattern", e.message) from e
@@ -219,6 +313,7 @@ class HydroApiService(BaseHydroService):
                 self._wrapper,
                 series,
                 f"input/hydro/common/capacity/creditmodulations_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "credit_modulations", e.message) from e
@@ -232,6 +327,7 @@ class HydroApiService(BaseHydroService):
                 self._wrapper,
                 series,
                 f"input/hydro/common/capacity/waterValues_{area_id}",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "water_values", e.message) from e
@@ -239,7 +335,14 @@ class HydroApiService(BaseHydroService):
     @override
     def set_ror_series(self, area_id: str, series: pd.DataFrame) -> None:
         try:
-            update_series(self._base_url, self.study_id, self._wrapper, series, f"input/hydro/series/{area_id}/ror")
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series,
+                f"input/hydro/series/{area_id}/ror",
+                cache=self.api_config.matrix_memory_cache,
+            )
         except APIError as e:
             raise MatrixUploadError(area_id, "ror", e.message) from e
 
@@ -252,6 +355,7 @@ class HydroApiService(BaseHydroService):
                 self._wrapper,
                 series,
                 f"input/hydro/series/{area_id}/mod",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "mod", e.message) from e
@@ -265,6 +369,7 @@ class HydroApiService(BaseHydroService):
                 self._wrapper,
                 series,
                 f"input/hydro/series/{area_id}/mingen",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "mingen", e.message) from e
@@ -278,6 +383,7 @@ class HydroApiService(BaseHydroService):
                 self._wrapper,
                 series,
                 f"input/hydro/prepro/{area_id}/energy",
+                cache=self.api_config.matrix_memory_cache,
             )
         except APIError as e:
             raise MatrixUploadError(area_id, "energy", e.message) from e
@@ -10,7 +10,7 @@
 #
 # This file is part of the Antares project.
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
 import pandas as pd
 
@@ -29,8 +29,9 @@ from antares.craft.exceptions.exceptions import (
 )
 from antares.craft.model.link import Link, LinkProperties, LinkPropertiesUpdate, LinkUi, LinkUiUpdate
 from antares.craft.service.api_services.models.link import LinkPropertiesAndUiAPI
-from antares.craft.service.api_services.utils import get_matrix, update_series
+from antares.craft.service.api_services.utils import get_matrix, invalidate_matrices, update_series
 from antares.craft.service.base_services import BaseLinkService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 
 
 class LinkApiService(BaseLinkService):
@@ -93,6 +94,11 @@ class LinkApiService(BaseLinkService):
             self._wrapper.delete(url)
         except APIError as e:
             raise LinkDeletionError(link.id, e.message) from e
+        for path_prefix in [
+            f"input/links/{area_from_id}/{area_to_id}_",
+            f"input/links/{area_from_id}/capacities/{area_to_id}_",
+        ]:
+            invalidate_matrices(self.config.matrix_memory_cache, self.study_id, path_prefix)
 
     @override
     def update_link_ui(self, link: Link, ui: LinkUiUpdate) -> LinkUi:
@@ -115,10 +121,24 @@ class LinkApiService(BaseLinkService):
         return link_ui
 
     @override
-    def get_parameters(self, area_from: str, area_to: str) -> pd.DataFrame:
+    def get_parameters(
+        self,
+        area_from: str,
+        area_to: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         try:
             parameters_path = f"input/links/{area_from}/{area_to}_parameters"
-            matrix = get_matrix(self._base_url, self.study_id, self._wrapper, parameters_path)
+            matrix = get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                parameters_path,
+                cache=self.config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise LinkDownloadError(area_from, area_to, "parameters", e.message) from e
 
@@ -128,15 +148,31 @@ class LinkApiService(BaseLinkService):
     def set_parameters(self, series: pd.DataFrame, area_from: str, area_to: str) -> None:
         try:
             series_path = f"input/links/{area_from}/{area_to}_parameters"
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url, self.study_id, self._wrapper, series, series_path, cache=self.config.matrix_memory_cache
+            )
         except APIError as e:
             raise LinkUploadError(area_from, area_to, "parameters", e.message) from e
 
     @override
-    def get_capacity_direct(self, area_from: str, area_to: str) -> pd.DataFrame:
+    def get_capacity_direct(
+        self,
+        area_from: str,
+        area_to: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         try:
             series_path = f"input/links/{area_from}/capacities/{area_to}_direct"
-            matrix = get_matrix(self._base_url, self.study_id, self._wrapper, series_path)
+            matrix = get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series_path,
+                cache=self.config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise LinkDownloadError(area_from, area_to, "directcapacity", e.message) from e
         return matrix
@@ -145,15 +181,31 @@ class LinkApiService(BaseLinkService):
     def set_capacity_direct(self, series: pd.DataFrame, area_from: str, area_to: str) -> None:
         try:
             series_path = f"input/links/{area_from}/capacities/{area_to}_direct"
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url, self.study_id, self._wrapper, series, series_path, cache=self.config.matrix_memory_cache
+            )
         except APIError as e:
             raise LinkUploadError(area_from, area_to, "directcapacity", e.message) from e
 
     @override
-    def get_capacity_indirect(self, area_from: str, area_to: str) -> pd.DataFrame:
+    def get_capacity_indirect(
+        self,
+        area_from: str,
+        area_to: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         try:
             series_path = f"input/links/{area_from}/capacities/{area_to}_indirect"
-            matrix = get_matrix(self._base_url, self.study_id, self._wrapper, series_path)
+            matrix = get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series_path,
+                cache=self.config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise LinkDownloadError(area_from, area_to, "indirectcapacity", e.message) from e
         return matrix
@@ -162,7 +214,9 @@ class LinkApiService(BaseLinkService):
     def set_capacity_indirect(self, series: pd.DataFrame, area_from: str, area_to: str) -> None:
         try:
             series_path = f"input/links/{area_from}/capacities/{area_to}_indirect"
-            update_series(self._base_url, self.study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url, self.study_id, self._wrapper, series, series_path, cache=self.config.matrix_memory_cache
+            )
         except APIError as e:
             raise LinkUploadError(area_from, area_to, "indirectcapacity", e.message) from e
 
@@ -10,11 +10,16 @@
 #
 # This file is part of the Antares project.
 import io
+import zipfile
 
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Mapping, Optional, Sequence
 
+import numpy.typing as npt
 import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
 
 from typing_extensions import override
 
@@ -23,13 +28,28 @@ from antares.craft.api_conf.request_wrapper import RequestWrapper
 from antares.craft.exceptions.exceptions import (
     AggregateCreationError,
     APIError,
+    OutputConversionError,
     TsNumbersOutputParsingError,
     XpansionOutputParsingError,
 )
-from antares.craft.model.output import AggregationEntry, Frequency, XpansionResult, XpansionSensitivityResult
+from antares.craft.model.output import (
+    AggregatedData,
+    AggregationEntry,
+    AggregationFormat,
+    Frequency,
+    MCStatistic,
+    OutputCube,
+    ParquetCompression,
+    TsNumbersKind,
+    XpansionResult,
+    XpansionSensitivityResult,
+)
 from antares.craft.service.base_services import BaseOutputService
+from antares.craft.service.mc_statistics import MC_YEAR_COLUMN, compute_mc_statistics, split_by_year
+from antares.craft.service.output_cube import build_cube_from_table
 from antares.craft.service.output_matrix_parsing import read_output_matrix
-from antares.craft.service.utils import read_ts_numbers_file
+from antares.craft.service.parquet_dataset import write_parquet_dataset
+from antares.craft.service.utils import build_ts_numbers_dataframe, parse_ts_numbers, read_ts_numbers_file
 from antares.craft.service.xpansion_output_parsing import parse_xpansion_out_json, parse_xpansion_sensitivity_out_json
 
 
@@ -49,6 +69,12 @@ def _convert_aggregation_entry_to_api_query(aggregation_entry: AggregationEntry,
     return f"query_file={aggregation_entry.data_type.value}&frequency={aggregation_entry.frequency.value}{mc_years}{type_ids}{columns_names}&format=parquet"
 
 
+OUTPUT_DOWNLOAD_WORKERS = 8
+"""Number of output files downloaded at the same time by the batch getters.
+
+It stays below the default connection pool size of a `requests` session, so that connections are reused."""
+
+
 class OutputApiService(BaseOutputService):
     def __init__(self, config: APIconf, study_id: str):
         super().__init__()
@@ -64,9 +90,13 @@ class OutputApiService(BaseOutputService):
 
         raw_url = f"{self._base_url}/studies/{self.study_id}/raw/original-file?path={full_path}"
         response = self._wrapper.get(raw_url)
-        data = StringIO(response.text)
+        return read_output_matrix(response.content, frequency)
 
-        return read_output_matrix(data, frequency)
+    @override
+    def get_matrices(self, output_id: str, file_paths: Sequence[str], frequency: Frequency) -> list[pd.DataFrame]:
+        # The files are downloaded concurrently through the session, which keeps its connections open.
+        with ThreadPoolExecutor(max_workers=OUTPUT_DOWNLOAD_WORKERS) as executor:
+            return list(executor.map(lambda file_path: self.get_matrix(output_id, file_path, frequency), file_paths))
 
     @staticmethod
     def _convert_path_for_web(file_path: str) -> str:
@@ -85,10 +115,9 @@ class OutputApiService(BaseOutputService):
         api_parts[index] = api_formatting
         return "/".join(api_parts)
 
-    @override
-    def aggregate_values(
+    def _download_aggregate(
         self, output_id: str, aggregation_entry: AggregationEntry, object_type: str, mc_type: str
-    ) -> pd.DataFrame:
+    ) -> io.BytesIO:
         url = f"{self._base_url}/studies/{self.study_id}/outputs/{output_id}/aggregate/{object_type}/mc-{mc_type}"
         url += f"?{_convert_aggregation_entry_to_api_query(aggregation_entry, object_type)}"
         try:
@@ -100,12 +129,71 @@ class OutputApiService(BaseOutputService):
             # Returns the aggregation
             download_url = f"{self._base_url}/downloads/{download_id}"
             aggregate = self._wrapper.get(download_url)
-            content = io.BytesIO(aggregate.content)
-            return pd.read_parquet(content)
+            return io.BytesIO(aggregate.content)
 
         except APIError as e:
             raise AggregateCreationError(self.study_id, output_id, mc_type, object_type, e.message)
 
+    @override
+    def aggregate_values(
+        self, output_id: str, aggregation_entry: AggregationEntry, object_type: str, mc_type: str
+    ) -> AggregatedData:
+        content = self._download_aggregate(output_id, aggregation_entry, object_type, mc_type)
+        if aggregation_entry.output_format == AggregationFormat.POLARS:
+            return pl.read_parquet(content)
+        if aggregation_entry.output_format == AggregationFormat.ARROW:
+            return pq.read_table(content)
+        return pd.read_parquet(content)
+
+    @override
+    def aggregate_values_to_parquet(
+        self,
+        output_id: str,
+        aggregation_entry: AggregationEntry,
+        object_type: str,
+        mc_type: str,
+        path: Path,
+        partition_by: Sequence[str],
+    ) -> pl.LazyFrame:
+        # The aggregation is computed by the server: we can only partition the downloaded result.
+        content = self._download_aggregate(output_id, aggregation_entry, object_type, mc_type)
+        return write_parquet_dataset(path, [pl.read_parquet(content)], partition_by)
+
+    @override
+    def compute_mc_statistics(
+        self,
+        output_id: str,
+        aggregation_entry: AggregationEntry,
+        object_type: str,
+        stats: Sequence[MCStatistic],
+        quantiles: Sequence[float],
+        weights: Optional[Mapping[int, float]],
+    ) -> pd.DataFrame:
+        # The individual results are aggregated by the server: the years are only split once downloaded.
+        content = self._download_aggregate(output_id, aggregation_entry, object_type, "ind")
+        year_dfs = split_by_year(pl.read_parquet(content).partition_by(MC_YEAR_COLUMN, maintain_order=True))
+        return compute_mc_statistics(year_dfs, stats, quantiles, weights).to_pandas()
+
+    @override
+    def to_cube(
+        self,
+        output_id: str,
+        aggregation_entry: AggregationEntry,
+        object_type: str,
+        dtype: npt.DTypeLike,
+        memmap_dir: Optional[Path],
+    ) -> OutputCube:
+        # The files are only reachable through the server aggregation, which is then scattered in the cube.
+        content = self._download_aggregate(output_id, aggregation_entry, object_type, "ind")
+        id_column = "area" if object_type == "areas" else "link"
+        variables = aggregation_entry.columns_names or []
+        return build_cube_from_table(pl.read_parquet(content), id_column, variables, dtype, memmap_dir)
+
+    @override
+    def convert_to_parquet(self, output_id: str, dest: Path, compression: ParquetCompression) -> None:
+        # The output files are only reachable through the server, which already aggregates them.
+        raise OutputConversionError(output_id, "Only the outputs of local studies can be converted")
+
     @override
     def get_xpansion_result(self, output_id: str) -> XpansionResult:
         full_path = f"output/{output_id}/expansion/out"
@@ -184,3 +272,24 @@ class OutputApiService(BaseOutputService):
     ) -> dict[int, int]:
         full_path = f"{self._get_ts_numbers_path(output_id)}/st-storage/{area_id}/{st_storage_id}/{constraint_id}"
         return self._get_ts_numbers(output_id, full_path, "st-storages constraints")
+
+    @override
+    def get_all_ts_numbers(self, kind: TsNumbersKind, output_id: str) -> pd.DataFrame:
+        # The whole folder is downloaded at once as a zip archive instead of one request per object
+        full_path = f"{self._get_ts_numbers_path(output_id)}/{kind.value}"
+        raw_url = f"{self._base_url}/studies/{self.study_id}/raw/original-file?path={full_path}"
+        try:
+            response = self._wrapper.get(raw_url)
+            with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+                names = [name for name in archive.namelist() if name.endswith(".txt")]
+                # The archive may hold the folder itself instead of its content
+                prefix = f"{kind.value}/" if names and all(name.startswith(f"{kind.value}/") for name in names) else ""
+                ts_numbers = {
+                    name.removeprefix(prefix).removesuffix(".txt"): parse_ts_numbers(archive.read(name))
+                    for name in names
+                }
+        except APIError as e:
+            raise TsNumbersOutputParsingError(self.study_id, output_id, kind.value, e.message)
+        except zipfile.BadZipFile as e:
+            raise TsNumbersOutputParsingError(self.study_id, output_id, kind.value, str(e))
+        return build_ts_numbers_dataframe(ts_numbers)
@@ -11,6 +11,7 @@
 # This file is part of the Antares project.
 
 from pathlib import PurePosixPath
+from typing import Optional, Sequence
 
 import pandas as pd
 
@@ -28,6 +29,7 @@ from antares.craft.model.renewable import RenewableCluster, RenewableClusterProp
 from antares.craft.service.api_services.models.renewable import RenewableClusterPropertiesAPI
 from antares.craft.service.api_services.utils import get_matrix, update_series
 from antares.craft.service.base_services import BaseRenewableService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 
 
 class RenewableApiService(BaseRenewableService):
@@ -50,15 +52,36 @@ class RenewableApiService(BaseRenewableService):
                 / "series"
             )
 
-            update_series(self._base_url, self.study_id, self._wrapper, matrix, path.as_posix())
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                matrix,
+                path.as_posix(),
+                cache=self.config.matrix_memory_cache,
+            )
         except APIError as e:
             raise RenewableMatrixUpdateError(renewable_cluster.area_id, renewable_cluster.id, e.message) from e
 
     @override
-    def get_renewable_matrix(self, cluster_id: str, area_id: str) -> pd.DataFrame:
+    def get_renewable_matrix(
+        self,
+        cluster_id: str,
+        area_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         try:
             path = PurePosixPath("input") / "renewables" / "series" / f"{area_id}" / f"{cluster_id}" / "series"
-            return get_matrix(self._base_url, self.study_id, self._wrapper, path.as_posix())
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                path.as_posix(),
+                cache=self.config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise RenewableMatrixDownloadError(area_id, cluster_id, e.message) from e
 
@@ -11,7 +11,7 @@
 # This file is part of the Antares project.
 import time
 
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 from typing_extensions import override
 
@@ -95,7 +95,7 @@ class RunApiService(BaseRunService):
         return Job(job_id=job_id, status=status, parameters=parameters, output_id=output_id)
 
     @override
-    def wait_job_completion(self, job: Job, time_out: int) -> None:
+    def wait_job_completion(self, job: Job, time_out: int, on_poll: Optional[Callable[[Job], object]] = None) -> None:
         start_time = time.time()
         repeat_interval = 5
         if job.status == JobStatus.SUCCESS:
@@ -106,6 +106,8 @@ class RunApiService(BaseRunService):
                 raise SimulationTimeOutError(job.job_id, time_out)
             time.sleep(repeat_interval)
             self._update_job(job)
+            if on_poll is not None and job.status in (JobStatus.RUNNING, JobStatus.PENDING):
+                on_poll(job)
 
         if job.status == JobStatus.FAILED or not job.output_id:
             raise SimulationFailedError(self.study_id, job.job_id)
@@ -10,6 +10,8 @@
 #
 # This file is part of the Antares project.
 
+from typing import Optional, Sequence
+
 import pandas as pd
 
 from typing_extensions import override
@@ -38,8 +40,9 @@ from antares.craft.service.api_services.models.st_storage import (
     serialize_st_storage_api,
     serialize_st_storage_constraint_api,
 )
-from antares.craft.service.api_services.utils import get_matrix, update_series
+from antares.craft.service.api_services.utils import get_matrix, invalidate_matrices, update_series
 from antares.craft.service.base_services import BaseShortTermStorageService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import STStorageMatrixName
 
 
@@ -55,15 +58,31 @@ class ShortTermStorageApiService(BaseShortTermStorageService):
     def set_storage_matrix(self, storage: STStorage, ts_name: STStorageMatrixName, matrix: pd.DataFrame) -> None:
         series_path = f"input/st-storage/series/{storage.area_id}/{storage.id}/{ts_name.value}"
         try:
-            update_series(self._base_url, self.study_id, self._wrapper, matrix, series_path)
+            update_series(
+                self._base_url, self.study_id, self._wrapper, matrix, series_path, cache=self.config.matrix_memory_cache
+            )
         except APIError as e:
             raise STStorageMatrixUploadError(storage.area_id, storage.id, ts_name.value, e.message) from e
 
     @override
-    def get_storage_matrix(self, storage: STStorage, ts_name: STStorageMatrixName) -> pd.DataFrame:
+    def get_storage_matrix(
+        self,
+        storage: STStorage,
+        ts_name: STStorageMatrixName,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         series_path = f"input/st-storage/series/{storage.area_id}/{storage.id}/{ts_name.value}"
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, series_path)
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series_path,
+                cache=self.config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise STStorageMatrixDownloadError(storage.area_id, storage.id, ts_name.value, e.message) from e
 
@@ -148,12 +167,33 @@ class ShortTermStorageApiService(BaseShortTermStorageService):
 
         except APIError as e:
             raise STStorageConstraintDeletionError(self.study_id, area_id, storage_id, e.message) from e
+        for constraint_id in constraint_ids:
+            invalidate_matrices(
+                self.config.matrix_memory_cache,
+                self.study_id,
+                f"input/st-storage/constraints/{area_id}/{storage_id}/rhs_{constraint_id}",
+            )
 
     @override
-    def get_constraint_term(self, area_id: str, storage_id: str, constraint_id: str) -> pd.DataFrame:
+    def get_constraint_term(
+        self,
+        area_id: str,
+        storage_id: str,
+        constraint_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         series_path = f"input/st-storage/constraints/{area_id}/{storage_id}/rhs_{constraint_id}"
         try:
-            return get_matrix(self._base_url, self.study_id, self._wrapper, series_path)
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                series_path,
+                cache=self.config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise STStorageMatrixDownloadError(area_id, storage_id, f"constraint {constraint_id}", e.message) from e
 
@@ -161,6 +201,8 @@ class ShortTermStorageApiService(BaseShortTermStorageService):
     def set_constraint_term(self, area_id: str, storage_id: str, constraint_id: str, matrix: pd.DataFrame) -> None:
         series_path = f"input/st-storage/constraints/{area_id}/{storage_id}/rhs_{constraint_id}"
         try:
-            update_series(self._base_url, self.study_id, self._wrapper, matrix, series_path)
+            update_series(
+                self._base_url, self.study_id, self._wrapper, matrix, series_path, cache=self.config.matrix_memory_cache
+            )
         except APIError as e:
             raise STStorageMatrixUploadError(area_id, storage_id, f"constraint {constraint_id}", e.message) from e
@@ -9,8 +9,9 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 from typing_extensions import override
 
@@ -25,6 +26,7 @@ from antares.craft.exceptions.exceptions import (
     ScenarioBuilderEditionError,
     ScenarioBuilderReadingError,
     StudyDeletionError,
+    StudyMatrixDownloadError,
     StudyMoveError,
     StudyVariantCreationError,
     TaskFailedError,
@@ -37,8 +39,9 @@ from antares.craft.model.binding_constraint import (
 )
 from antares.craft.model.output import Output
 from antares.craft.service.api_services.models.scenario_builder import ScenarioBuilderAPI
-from antares.craft.service.api_services.utils import wait_task_completion
+from antares.craft.service.api_services.utils import get_matrix, invalidate_matrices, wait_task_completion
 from antares.craft.service.base_services import BaseOutputService, BaseStudyService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, TimeSeriesRequest
 from antares.study.version import StudyVersion
 
 if TYPE_CHECKING:
@@ -71,6 +74,8 @@ class StudyApiService(BaseStudyService):
             self._wrapper.delete(url, json=body)
         except APIError as e:
             raise BindingConstraintDeletionError(body, e.message) from e
+        for bc_id in body:
+            invalidate_matrices(self._config.matrix_memory_cache, self.study_id, f"input/bindingconstraints/{bc_id}_")
 
     @override
     def delete(self, children: bool) -> None:
@@ -152,6 +157,7 @@ class StudyApiService(BaseStudyService):
             wait_task_completion(self._base_url, self._wrapper, task_id)
         except (APIError, TaskFailedError, TaskTimeOutError) as e:
             raise ThermalTimeseriesGenerationError(self.study_id, e.message)
+        invalidate_matrices(self._config.matrix_memory_cache, self.study_id, "input/thermal/series/")
 
     @override
     def get_scenario_builder(self, nb_years: int, study_version: StudyVersion) -> ScenarioBuilder:
@@ -172,3 +178,36 @@ class StudyApiService(BaseStudyService):
             self._wrapper.put(url, json=body)
         except APIError as e:
             raise ScenarioBuilderEditionError(self.study_id, e.message)
+
+    @override
+    def read_timeseries_many(
+        self, requests: Sequence[TimeSeriesRequest], max_workers: Optional[int], output_format: MatrixFormat
+    ) -> dict[TimeSeriesRequest, Any]:
+        unique_requests = list(dict.fromkeys(requests))
+        if not unique_requests:
+            return {}
+
+        def _download(request: TimeSeriesRequest) -> Matrix:
+            # The server paths of the matrices don't have any extension
+            series_path = request.ts_file_type.value.removesuffix(".txt").format(
+                area_id=request.area_id,
+                constraint_id=request.constraint_id,
+                cluster_id=request.cluster_id,
+                second_area_id=request.second_area_id,
+                file_name=request.file_name,
+            )
+            try:
+                return get_matrix(
+                    self._base_url,
+                    self.study_id,
+                    self._wrapper,
+                    series_path,
+                    output_format,
+                    cache=self._config.matrix_memory_cache,
+                    columns=request.columns,
+                )
+            except APIError as e:
+                raise StudyMatrixDownloadError(self.study_id, series_path, e.message) from e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(unique_requests, executor.map(_download, unique_requests)))
@@ -11,6 +11,7 @@
 # This file is part of the Antares project.
 
 from pathlib import PurePosixPath
+from typing import Optional, Sequence
 
 import pandas as pd
 
@@ -32,6 +33,7 @@ from antares.craft.model.thermal import (
 from antares.craft.service.api_services.models.thermal import ThermalClusterPropertiesAPI
 from antares.craft.service.api_services.utils import get_matrix, update_series
 from antares.craft.service.base_services import BaseThermalService
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import ThermalClusterMatrixName
 
 
@@ -57,14 +59,27 @@ class ThermalApiService(BaseThermalService):
             / ts_name.value
         )
         try:
-            update_series(self._base_url, self.study_id, self._wrapper, matrix, path.as_posix())
+            update_series(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                matrix,
+                path.as_posix(),
+                cache=self.config.matrix_memory_cache,
+            )
         except APIError as e:
             raise ThermalMatrixUpdateError(
                 thermal_cluster.area_id, thermal_cluster.name, ts_name.value, e.message
             ) from e
 
     @override
-    def get_thermal_matrix(self, thermal_cluster: ThermalCluster, ts_name: ThermalClusterMatrixName) -> pd.DataFrame:
+    def get_thermal_matrix(
+        self,
+        thermal_cluster: ThermalCluster,
+        ts_name: ThermalClusterMatrixName,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         try:
             keyword = "series" if "SERIES" in ts_name.name else "prepro"
             path = (
@@ -75,7 +90,15 @@ class ThermalApiService(BaseThermalService):
                 / f"{thermal_cluster.id.lower()}"
                 / ts_name.value
             )
-            return get_matrix(self._base_url, self.study_id, self._wrapper, path.as_posix())
+            return get_matrix(
+                self._base_url,
+                self.study_id,
+                self._wrapper,
+                path.as_posix(),
+                cache=self.config.matrix_memory_cache,
+                columns=columns,
+                output_format=output_format,
+            )
         except APIError as e:
             raise ThermalMatrixDownloadError(
                 thermal_cluster.area_id, thermal_cluster.name, ts_name.value, e.message
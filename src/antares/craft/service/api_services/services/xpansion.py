@@ -56,7 +56,7 @@ from antares.craft.service.api_services.models.xpansion import (
     serialize_xpansion_constraints_api,
     serialize_xpansion_settings_api,
 )
-from antares.craft.service.api_services.utils import get_matrix, update_series
+from antares.craft.service.api_services.utils import get_matrix, invalidate_matrices, update_series
 from antares.craft.service.base_services import BaseXpansionService
 from antares.craft.service.utils import (
     update_candidate,
@@ -97,12 +97,15 @@ class XpansionAPIService(BaseXpansionService):
             self._wrapper.delete(self._expansion_url)
         except APIError as e:
             raise XpansionConfigurationDeletionError(self._study_id, e.message) from e
+        invalidate_matrices(self.config.matrix_memory_cache, self._study_id, "user/expansion/")
 
     @override
     def get_matrix(self, file_name: str, file_type: XpansionMatrix) -> pd.DataFrame:
         series_path = f"user/expansion/{FILE_MAPPING[file_type]}/{file_name}"
         try:
-            return get_matrix(self._base_url, self._study_id, self._wrapper, series_path)
+            return get_matrix(
+                self._base_url, self._study_id, self._wrapper, series_path, cache=self.config.matrix_memory_cache
+            )
         except APIError as e:
             raise XpansionMatrixReadingError(self._study_id, file_name, e.message) from e
 
@@ -110,12 +113,22 @@ class XpansionAPIService(BaseXpansionService):
     def delete_matrix(self, file_name: str, file_type: XpansionMatrix) -> None:
         url = f"{self._expansion_url}/resources/{file_type.value}/{file_name}"
         self._delete_matrix(file_name, url)
+        invalidate_matrices(
+            self.config.matrix_memory_cache, self._study_id, f"user/expansion/{FILE_MAPPING[file_type]}/{file_name}"
+        )
 
     @override
     def set_matrix(self, file_name: str, series: pd.DataFrame, file_type: XpansionMatrix) -> None:
         series_path = f"user/expansion/{FILE_MAPPING[file_type]}/{file_name}"
         try:
-            update_series(self._base_url, self._study_id, self._wrapper, series, series_path)
+            update_series(
+                self._base_url,
+                self._study_id,
+                self._wrapper,
+                series,
+                series_path,
+                cache=self.config.matrix_memory_cache,
+            )
         except APIError:
             # Perhaps the file didn't exist, we should try to create it.
             url = f"{self._expansion_url}/resources/{file_type.value}"
@@ -12,26 +12,144 @@
 import io
 import time
 
+from typing import Literal, Optional, Sequence, cast, overload
+
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft.api_conf.request_wrapper import RequestWrapper
 from antares.craft.exceptions.exceptions import TaskFailedError, TaskTimeOutError
+from antares.craft.tools.matrix_cache import MatrixMemoryCache
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, validate_columns
 
 DEFAULT_TIME_OUT = 172800
 
 
-def update_series(base_url: str, study_id: str, wrapper: RequestWrapper, series: pd.DataFrame, path: str) -> None:
+def matrix_cache_key(study_id: str, path: str) -> str:
+    # Matrix paths are case-insensitive for the server, e.g. thermal ids are lowered for reading only.
+    return f"{study_id}/{path}".lower()
+
+
+def invalidate_matrices(cache: Optional[MatrixMemoryCache], study_id: str, path_prefix: str = "") -> None:
+    """Removes the cached matrices of the study under the given path, e.g. once the server rewrote or deleted them.
+
+    Without a path, every cached matrix of the study is removed.
+    """
+    if cache:
+        cache.invalidate_prefix(matrix_cache_key(study_id, path_prefix))
+
+
+def update_series(
+    base_url: str,
+    study_id: str,
+    wrapper: RequestWrapper,
+    series: pd.DataFrame,
+    path: str,
+    cache: Optional[MatrixMemoryCache] = None,
+) -> None:
     url = f"{base_url}/studies/{study_id}/raw?path={path}"
     array_data = series.to_numpy().tolist()
     wrapper.post(url, json=array_data)
+    if cache:
+        cache.invalidate(matrix_cache_key(study_id, path))
 
 
-def get_matrix(base_url: str, study_id: str, wrapper: RequestWrapper, series_path: str) -> pd.DataFrame:
+def _download_matrix(
+    base_url: str, study_id: str, wrapper: RequestWrapper, series_path: str, output_format: MatrixFormat
+) -> Matrix:
     raw_url = f"{base_url}/studies/{study_id}/raw?path={series_path}&matrix_format=arrow compressed"
     response = wrapper.get(raw_url)
-    dataframe = pd.read_feather(io.BytesIO(response.content))
-    dataframe.columns = pd.RangeIndex(len(dataframe.columns))  # type: ignore
-    return dataframe
+    if output_format == MatrixFormat.PANDAS:
+        dataframe = pd.read_feather(io.BytesIO(response.content))
+        dataframe.columns = pd.RangeIndex(len(dataframe.columns))  # type: ignore
+        return dataframe
+
+    # Decodes the Arrow payload straight into polars, without going through pandas.
+    polars_df = pl.read_ipc(io.BytesIO(response.content), memory_map=False)
+    if output_format == MatrixFormat.NUMPY:
+        return polars_df.to_numpy()
+    return polars_df.rename({col: f"column_{k + 1}" for k, col in enumerate(polars_df.columns)})
+
+
+def _select_columns(matrix: Matrix, columns: Sequence[int]) -> Matrix:
+    # The server cannot send a subset of the columns, so the selection happens once the matrix is downloaded.
+    # Selected pandas columns keep their labels, i.e. their indices in the whole matrix.
+    validate_columns(columns, matrix.shape[1])
+    if isinstance(matrix, pd.DataFrame):
+        return matrix.iloc[:, list(columns)]
+    if isinstance(matrix, pl.DataFrame):
+        return matrix.select(matrix.columns[k] for k in columns)
+    return matrix[:, list(columns)]
+
+
+@overload
+def get_matrix(
+    base_url: str,
+    study_id: str,
+    wrapper: RequestWrapper,
+    series_path: str,
+    output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+    cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+) -> pd.DataFrame: ...
+
+
+@overload
+def get_matrix(
+    base_url: str,
+    study_id: str,
+    wrapper: RequestWrapper,
+    series_path: str,
+    output_format: Literal[MatrixFormat.POLARS],
+    cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+) -> pl.DataFrame: ...
+
+
+@overload
+def get_matrix(
+    base_url: str,
+    study_id: str,
+    wrapper: RequestWrapper,
+    series_path: str,
+    output_format: Literal[MatrixFormat.NUMPY],
+    cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+) -> np.ndarray: ...
+
+
+@overload
+def get_matrix(
+    base_url: str,
+    study_id: str,
+    wrapper: RequestWrapper,
+    series_path: str,
+    output_format: MatrixFormat,
+    cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+) -> Matrix: ...
+
+
+def get_matrix(
+    base_url: str,
+    study_id: str,
+    wrapper: RequestWrapper,
+    series_path: str,
+    output_format: MatrixFormat = MatrixFormat.PANDAS,
+    cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+) -> Matrix:
+    if cache is None or output_format != MatrixFormat.PANDAS:
+        matrix = _download_matrix(base_url, study_id, wrapper, series_path, output_format)
+    else:
+        key = matrix_cache_key(study_id, series_path)
+        cached_df = cache.get(key)
+        if cached_df is None:
+            downloaded_df = _download_matrix(base_url, study_id, wrapper, series_path, output_format)
+            cached_df = cache.put(key, cast(pd.DataFrame, downloaded_df))
+        matrix = cached_df
+    return matrix if columns is None else _select_columns(matrix, columns)
 
 
 def wait_task_completion(
@@ -13,13 +13,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Sequence
 
+import numpy.typing as npt
 import pandas as pd
+import polars as pl
 
 from antares.craft.model.settings.study_settings import StudySettings, StudySettingsUpdate
 from antares.craft.model.simulation import AntaresSimulationParameters, Job
 from antares.craft.model.xpansion.candidate import XpansionLinkProfile
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat
 from antares.craft.tools.utils import ConstraintMatrixName, STStorageMatrixName, ThermalClusterMatrixName
 from antares.study.version import StudyVersion
 
@@ -47,9 +50,14 @@ if TYPE_CHECKING:
     from antares.craft.model.hydro import HydroAllocation, HydroPropertiesUpdate, InflowStructure, InflowStructureUpdate
     from antares.craft.model.link import Link, LinkProperties, LinkPropertiesUpdate, LinkUi, LinkUiUpdate
     from antares.craft.model.output import (
+        AggregatedData,
         AggregationEntry,
         Frequency,
+        MCStatistic,
         Output,
+        OutputCube,
+        ParquetCompression,
+        TsNumbersKind,
         XpansionResult,
         XpansionSensitivityResult,
     )
@@ -72,6 +80,7 @@ if TYPE_CHECKING:
         ThermalClusterPropertiesUpdate,
     )
     from antares.craft.model.xpansion.xpansion_configuration import XpansionConfiguration, XpansionMatrix
+    from antares.craft.tools.matrix_tool import TimeSeriesRequest
 
 
 class BaseAreaService(ABC):
@@ -246,10 +255,14 @@ class BaseAreaService(ABC):
         pass
 
     @abstractmethod
-    def get_load_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_load_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """
         Args:
             area_id: concerned area.
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
         """
         # Currently we do not return index and column names.
         # Once AntaresWeb will introduce specific endpoint for each matrix it will perhaps change.
@@ -257,34 +270,50 @@ class BaseAreaService(ABC):
         pass
 
     @abstractmethod
-    def get_reserves_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_reserves_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """
         Args:
             area_id: concerned area.
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
         """
         pass
 
     @abstractmethod
-    def get_misc_gen_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_misc_gen_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """
         Args:
             area_id: concerned area.
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
         """
         pass
 
     @abstractmethod
-    def get_solar_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_solar_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """
         Args:
             area_id: concerned area.
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
         """
         pass
 
     @abstractmethod
-    def get_wind_matrix(self, area_id: str) -> pd.DataFrame:
+    def get_wind_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         """
         Args:
             area_id: concerned area.
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
         """
         pass
 
@@ -317,39 +346,57 @@ class BaseHydroService(ABC):
         pass
 
     @abstractmethod
-    def get_maxpower(self, area_id: str) -> pd.DataFrame:
+    def get_maxpower(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_reservoir(self, area_id: str) -> pd.DataFrame:
+    def get_reservoir(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_inflow_pattern(self, area_id: str) -> pd.DataFrame:
+    def get_inflow_pattern(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_credit_modulations(self, area_id: str) -> pd.DataFrame:
+    def get_credit_modulations(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_water_values(self, area_id: str) -> pd.DataFrame:
+    def get_water_values(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_ror_series(self, area_id: str) -> pd.DataFrame:
+    def get_ror_series(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_mod_series(self, area_id: str) -> pd.DataFrame:
+    def get_mod_series(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_mingen(self, area_id: str) -> pd.DataFrame:
+    def get_mingen(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
-    def get_energy(self, area_id: str) -> pd.DataFrame:
+    def get_energy(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
         pass
 
     @abstractmethod
@@ -428,7 +475,13 @@ class BaseLinkService(ABC):
         pass
 
     @abstractmethod
-    def get_parameters(self, area_from: str, area_to: str) -> pd.DataFrame:
+    def get_parameters(
+        self,
+        area_from: str,
+        area_to: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         """
         Returns: link parameters
         """
@@ -439,7 +492,13 @@ class BaseLinkService(ABC):
         pass
 
     @abstractmethod
-    def get_capacity_direct(self, area_from: str, area_to: str) -> pd.DataFrame:
+    def get_capacity_direct(
+        self,
+        area_from: str,
+        area_to: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         """
         Returns: the direct capacity of a link
         """
@@ -450,7 +509,13 @@ class BaseLinkService(ABC):
         pass
 
     @abstractmethod
-    def get_capacity_indirect(self, area_from: str, area_to: str) -> pd.DataFrame:
+    def get_capacity_indirect(
+        self,
+        area_from: str,
+        area_to: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         """
         Returns: the indirect capacity of a link
         """
@@ -474,12 +539,18 @@ class BaseThermalService(ABC):
 
     @abstractmethod
     def get_thermal_matrix(
-        self, thermal_cluster: "ThermalCluster", ts_name: "ThermalClusterMatrixName"
-    ) -> pd.DataFrame:
+        self,
+        thermal_cluster: "ThermalCluster",
+        ts_name: "ThermalClusterMatrixName",
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         """
         Args:
             thermal_cluster: cluster to retrieve matrix
             ts_name:  matrix name
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
 
         Returns: matrix requested
 
@@ -532,12 +603,18 @@ class BaseBindingConstraintService(ABC):
 
     @abstractmethod
     def get_constraint_matrix(
-        self, constraint: "BindingConstraint", matrix_name: "ConstraintMatrixName"
-    ) -> pd.DataFrame:
+        self,
+        constraint: "BindingConstraint",
+        matrix_name: "ConstraintMatrixName",
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         """
         Args:
             constraint: the concerned binding constraint
             matrix_name: the matrix suffix.
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
         """
         pass
 
@@ -640,14 +717,37 @@ class BaseStudyService(ABC):
     def set_scenario_builder(self, scenario_builder: "ScenarioBuilder") -> None:
         pass
 
+    @abstractmethod
+    def read_timeseries_many(
+        self, requests: Sequence["TimeSeriesRequest"], max_workers: Optional[int], output_format: MatrixFormat
+    ) -> dict["TimeSeriesRequest", Any]:
+        """
+        Reads several matrices of the study concurrently
+
+        Args:
+            requests: matrices to read. Duplicated requests are only read once.
+            max_workers: maximum number of matrices read in parallel
+            output_format: type of the returned matrices
+        Returns: the matrices keyed by request, in the order of the given requests
+        """
+        pass
+
 
 class BaseRenewableService(ABC):
     @abstractmethod
-    def get_renewable_matrix(self, cluster_id: str, area_id: str) -> pd.DataFrame:
+    def get_renewable_matrix(
+        self,
+        cluster_id: str,
+        area_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         """
         Args:
             cluster_id: renewable cluster id to retrieve matrix
             area_id: area id to retrieve matrix
+            columns: indices of the columns to read (e.g. Monte Carlo years). All of them by default.
+            output_format: type of the returned matrix.
         Returns: matrix requested
 
         """
@@ -672,7 +772,13 @@ class BaseRenewableService(ABC):
 
 class BaseShortTermStorageService(ABC):
     @abstractmethod
-    def get_storage_matrix(self, storage: "STStorage", ts_name: "STStorageMatrixName") -> pd.DataFrame:
+    def get_storage_matrix(
+        self,
+        storage: "STStorage",
+        ts_name: "STStorageMatrixName",
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         pass
 
     @abstractmethod
@@ -702,7 +808,14 @@ class BaseShortTermStorageService(ABC):
         pass
 
     @abstractmethod
-    def get_constraint_term(self, area_id: str, storage_id: str, constraint_id: str) -> pd.DataFrame:
+    def get_constraint_term(
+        self,
+        area_id: str,
+        storage_id: str,
+        constraint_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         pass
 
     @abstractmethod
@@ -723,13 +836,14 @@ class BaseRunService(ABC):
         pass
 
     @abstractmethod
-    def wait_job_completion(self, job: Job, time_out: int) -> None:
+    def wait_job_completion(self, job: Job, time_out: int, on_poll: Optional[Callable[[Job], object]] = None) -> None:
         """
         Waits for the completion of a job
 
         Args:
             job: The job to wait for
             time_out: Time limit for waiting (seconds)
+            on_poll: Called with the job each time its status is checked while it runs
 
         Raises: SimulationTimeOutError if exceeded timeout
         """
@@ -751,10 +865,24 @@ class BaseOutputService(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_matrices(self, output_id: str, file_paths: Sequence[str], frequency: "Frequency") -> list[pd.DataFrame]:
+        """
+        Gets several matrices of the output at once
+
+        Args:
+            output_id: id of the output
+            file_paths: output paths
+            frequency: Matrices frequency (annual, monthly, weekly, daily, hourly)
+
+        Returns: One Pandas DataFrame per path, in the same order
+        """
+        pass
+
     @abstractmethod
     def aggregate_values(
         self, output_id: str, aggregation_entry: "AggregationEntry", object_type: str, mc_type: str
-    ) -> pd.DataFrame:
+    ) -> "AggregatedData":
         """
         Creates a matrix of aggregated raw data
 
@@ -764,7 +892,80 @@ class BaseOutputService(ABC):
             mc_type: all or ind (enum)
             object_type: links or areas (enum)
 
-        Returns: Pandas DataFrame corresponding to the aggregated raw data
+        Returns: DataFrame or Arrow table, depending on the entry output format, with the aggregated raw data
+        """
+        pass
+
+    @abstractmethod
+    def aggregate_values_to_parquet(
+        self,
+        output_id: str,
+        aggregation_entry: "AggregationEntry",
+        object_type: str,
+        mc_type: str,
+        path: Path,
+        partition_by: Sequence[str],
+    ) -> pl.LazyFrame:
+        """
+        Writes the aggregated raw data to a parquet dataset without holding it in memory as a whole
+
+        Args:
+            output_id: id of the output
+            aggregation_entry: input (query_file, frequency, mc_years, ..)
+            mc_type: all or ind (enum)
+            object_type: links or areas (enum)
+            path: folder of the dataset
+            partition_by: columns used to partition the dataset
+
+        Returns: Polars LazyFrame scanning the written dataset
+        """
+        pass
+
+    @abstractmethod
+    def compute_mc_statistics(
+        self,
+        output_id: str,
+        aggregation_entry: "AggregationEntry",
+        object_type: str,
+        stats: Sequence["MCStatistic"],
+        quantiles: Sequence[float],
+        weights: Optional[Mapping[int, float]],
+    ) -> pd.DataFrame:
+        """
+        Computes statistics across the Monte Carlo years of the individual results
+
+        Args:
+            output_id: id of the output
+            aggregation_entry: input (query_file, frequency, mc_years, ..)
+            object_type: links or areas (enum)
+            stats: statistics to compute (mean, std, min, max)
+            quantiles: quantiles to estimate
+            weights: weight of each Monte Carlo year
+
+        Returns: DataFrame with one column per variable and statistic
+        """
+        pass
+
+    @abstractmethod
+    def to_cube(
+        self,
+        output_id: str,
+        aggregation_entry: "AggregationEntry",
+        object_type: str,
+        dtype: npt.DTypeLike,
+        memmap_dir: Optional[Path],
+    ) -> "OutputCube":
+        pass
+
+    @abstractmethod
+    def convert_to_parquet(self, output_id: str, dest: Path, compression: "ParquetCompression") -> None:
+        """
+        Converts the whole output into parquet datasets, then used to read the output
+
+        Args:
+            output_id: id of the output
+            dest: folder of the datasets
+            compression: compression codec of the parquet files
         """
         pass
 
@@ -820,6 +1021,10 @@ class BaseOutputService(ABC):
     ) -> dict[int, int]:
         pass
 
+    @abstractmethod
+    def get_all_ts_numbers(self, kind: "TsNumbersKind", output_id: str) -> pd.DataFrame:
+        pass
+
 
 class BaseStudySettingsService(ABC):
     @abstractmethod
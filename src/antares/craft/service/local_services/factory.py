@@ -12,7 +12,7 @@
 import getpass
 
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 from antares.craft import HydroProperties
 from antares.craft.config.local_configuration import LocalConfiguration
@@ -111,7 +111,9 @@ def _get_current_os_user() -> str:
         return "Unknown"
 
 
-def create_study_local(study_name: str, version: str, parent_directory: Path | str) -> "Study":
+def create_study_local(
+    study_name: str, version: str, parent_directory: Path | str, matrix_store_dir: Optional[Path | str] = None
+) -> "Study":
     """
     Create a directory structure for the study with empty files.
 
@@ -119,6 +121,7 @@ def create_study_local(study_name: str, version: str, parent_directory: Path | s
         study_name: antares study name to be created
         version: antares version for study
         parent_directory: Local directory to store the study in.
+        matrix_store_dir: folder of a content-addressed store deduplicating the written input matrices
 
     Raises:
         FileExistsError if the study already exists in the given location
@@ -126,7 +129,10 @@ def create_study_local(study_name: str, version: str, parent_directory: Path | s
     if isinstance(parent_directory, str):
         parent_directory = Path(parent_directory)
 
-    local_config = LocalConfiguration(parent_directory, study_name)
+    if isinstance(matrix_store_dir, str):
+        matrix_store_dir = Path(matrix_store_dir)
+
+    local_config = LocalConfiguration(parent_directory, study_name, matrix_store_dir=matrix_store_dir)
 
     study_directory = parent_directory / study_name
 
@@ -154,11 +160,23 @@ def create_study_local(study_name: str, version: str, parent_directory: Path | s
     return study
 
 
-def read_study_local(study_directory: Path | str) -> "Study":
+def read_study_local(
+    study_directory: Path | str,
+    matrix_cache_dir: Optional[Path | str] = None,
+    memory_map_matrices: bool = False,
+    matrix_memory_cache_size: Optional[int] = None,
+    matrix_store_dir: Optional[Path | str] = None,
+    output_aggregation_workers: int = 1,
+) -> "Study":
     """
     Read a study structure by returning a study object.
     Args:
         study_directory: antares study path to be read
+        matrix_cache_dir: folder used to cache a binary copy of the input matrices
+        memory_map_matrices: whether input matrices are served as read-only memory-mapped dataframes
+        matrix_memory_cache_size: size in bytes of an in-memory LRU cache of the input matrices
+        matrix_store_dir: folder of a content-addressed store deduplicating the written input matrices
+        output_aggregation_workers: number of threads parsing the output files when aggregating results
 
     Raises:
         FileNotFoundError: If the provided directory does not exist.
@@ -166,7 +184,20 @@ def read_study_local(study_directory: Path | str) -> "Study":
     if isinstance(study_directory, str):
         study_directory = Path(study_directory)
 
-    local_services, version, study_name = _build_local_services_and_metadata(study_directory)
+    if isinstance(matrix_cache_dir, str):
+        matrix_cache_dir = Path(matrix_cache_dir)
+
+    if isinstance(matrix_store_dir, str):
+        matrix_store_dir = Path(matrix_store_dir)
+
+    local_services, version, study_name = _build_local_services_and_metadata(
+        study_directory,
+        matrix_cache_dir,
+        memory_map_matrices,
+        matrix_memory_cache_size,
+        matrix_store_dir,
+        output_aggregation_workers,
+    )
 
     study = Study(name=study_name, version=f"{version:2d}", services=local_services, path=study_directory)
 
@@ -188,14 +219,29 @@ def read_study_local(study_directory: Path | str) -> "Study":
     return study
 
 
-def _build_local_services_and_metadata(study_directory: Path) -> tuple[StudyServices, StudyVersion, str]:
+def _build_local_services_and_metadata(
+    study_directory: Path,
+    matrix_cache_dir: Optional[Path] = None,
+    memory_map_matrices: bool = False,
+    matrix_memory_cache_size: Optional[int] = None,
+    matrix_store_dir: Optional[Path] = None,
+    output_aggregation_workers: int = 1,
+) -> tuple[StudyServices, StudyVersion, str]:
     if not study_directory.is_dir():
         raise FileNotFoundError(f"The given path {study_directory} doesn't exist or isn't a folder.")
 
     study_antares_path = study_directory / "study.antares"
     study_params = IniReader().read(study_antares_path)["antares"]
 
-    local_config = LocalConfiguration(study_directory.parent, study_directory.name)
+    local_config = LocalConfiguration(
+        study_directory.parent,
+        study_directory.name,
+        matrix_cache_dir,
+        memory_map_matrices,
+        matrix_memory_cache_size,
+        matrix_store_dir,
+        output_aggregation_workers,
+    )
     version = StudyVersion.parse(str(study_params["version"]))
     name = study_params["caption"]
     return create_local_services(config=local_config, study_name=name, study_version=version), version, name
@@ -15,7 +15,7 @@ import os
 import shutil
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Sequence, cast
 
 import numpy as np
 import pandas as pd
@@ -76,7 +76,7 @@ from antares.craft.service.local_services.services.utils import (
     remove_object_from_scenario_builder,
 )
 from antares.craft.tools.contents_tool import transform_name_to_id
-from antares.craft.tools.matrix_tool import read_timeseries, write_timeseries
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, read_timeseries, write_timeseries
 from antares.craft.tools.prepro_folder import PreproFolder
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
@@ -170,9 +170,36 @@ class AreaLocalService(BaseAreaService):
         default_modulation_matrix[:, 3] = 0
         modulation = pd.DataFrame(default_modulation_matrix)
 
-        write_timeseries(self.config.study_path, prepro, TimeSeriesFileType.THERMAL_DATA, area_id, cluster_id)
-        write_timeseries(self.config.study_path, modulation, TimeSeriesFileType.THERMAL_MODULATION, area_id, cluster_id)
-        write_timeseries(self.config.study_path, None, TimeSeriesFileType.THERMAL_SERIES, area_id, cluster_id)
+        write_timeseries(
+            self.config.study_path,
+            prepro,
+            TimeSeriesFileType.THERMAL_DATA,
+            area_id,
+            cluster_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
+        write_timeseries(
+            self.config.study_path,
+            modulation,
+            TimeSeriesFileType.THERMAL_MODULATION,
+            area_id,
+            cluster_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
+        write_timeseries(
+            self.config.study_path,
+            None,
+            TimeSeriesFileType.THERMAL_SERIES,
+            area_id,
+            cluster_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
         # Round trip around properties for the groups.
         final_props = parse_thermal_cluster_local(self.study_version, content)
@@ -223,7 +250,10 @@ class AreaLocalService(BaseAreaService):
             None,
             TimeSeriesFileType.RENEWABLE_SERIES,
             area_id,
-            cluster_id=transform_name_to_id(renewable_name),
+            cluster_id=renewable_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
         )
 
         # Round trip around properties for the groups.
@@ -232,7 +262,15 @@ class AreaLocalService(BaseAreaService):
 
     @override
     def set_load(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.LOAD, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.LOAD,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
         PreproFolder.LOAD.save(self.config.study_path, area_id)
 
     @override
@@ -271,33 +309,75 @@ class AreaLocalService(BaseAreaService):
         # Create matrices
         cluster_id = storage.id
         empty_matrix = pd.DataFrame()
-        # fmt: off
-        write_timeseries(self.config.study_path, empty_matrix, TimeSeriesFileType.ST_STORAGE_PMAX_INJECTION, area_id, cluster_id=cluster_id)
-        write_timeseries(self.config.study_path, empty_matrix, TimeSeriesFileType.ST_STORAGE_PMAX_WITHDRAWAL, area_id, cluster_id=cluster_id)
-        write_timeseries(self.config.study_path, empty_matrix, TimeSeriesFileType.ST_STORAGE_INFLOWS, area_id, cluster_id=cluster_id)
-        write_timeseries(self.config.study_path, empty_matrix, TimeSeriesFileType.ST_STORAGE_LOWER_RULE_CURVE, area_id, cluster_id=cluster_id)
-        write_timeseries(self.config.study_path, empty_matrix, TimeSeriesFileType.ST_STORAGE_UPPER_RULE_CURVE, area_id, cluster_id=cluster_id)
-        # fmt: on
+        for ts_file_type in [
+            TimeSeriesFileType.ST_STORAGE_PMAX_INJECTION,
+            TimeSeriesFileType.ST_STORAGE_PMAX_WITHDRAWAL,
+            TimeSeriesFileType.ST_STORAGE_INFLOWS,
+            TimeSeriesFileType.ST_STORAGE_LOWER_RULE_CURVE,
+            TimeSeriesFileType.ST_STORAGE_UPPER_RULE_CURVE,
+        ]:
+            write_timeseries(
+                self.config.study_path,
+                empty_matrix,
+                ts_file_type,
+                area_id,
+                cluster_id=cluster_id,
+                cache=self.config.matrix_cache,
+                memory_cache=self.config.matrix_memory_cache,
+                store=self.config.matrix_store,
+            )
 
         return storage
 
     @override
     def set_wind(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.WIND, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.WIND,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
         PreproFolder.WIND.save(self.config.study_path, area_id)
 
     @override
     def set_reserves(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.RESERVES, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.RESERVES,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_solar(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.SOLAR, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.SOLAR,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
         PreproFolder.SOLAR.save(self.config.study_path, area_id)
 
     @override
     def set_misc_gen(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.MISC_GEN, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.MISC_GEN,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def create_area(
@@ -417,7 +497,15 @@ class AreaLocalService(BaseAreaService):
                 TimeSeriesFileType.HYDRO_MINGEN,
                 TimeSeriesFileType.HYDRO_ENERGY,
             ]:
-                write_timeseries(study_path, pd.DataFrame(), ts, area_id=area_id)
+                write_timeseries(
+                    study_path,
+                    pd.DataFrame(),
+                    ts,
+                    area_id=area_id,
+                    cache=self.config.matrix_cache,
+                    memory_cache=self.config.matrix_memory_cache,
+                    store=self.config.matrix_store,
+                )
 
         except Exception as e:
             raise AreaCreationError(area_name, f"{e}") from e
@@ -562,24 +650,74 @@ class AreaLocalService(BaseAreaService):
         remove_object_from_scenario_builder(self.config.study_path, clean_sts)
 
     @override
-    def get_load_matrix(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.LOAD, self.config.study_path, area_id=area_id)
+    def get_load_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.LOAD,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_solar_matrix(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.SOLAR, self.config.study_path, area_id=area_id)
+    def get_solar_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.SOLAR,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_wind_matrix(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.WIND, self.config.study_path, area_id=area_id)
+    def get_wind_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.WIND,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_reserves_matrix(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.RESERVES, self.config.study_path, area_id=area_id)
+    def get_reserves_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.RESERVES,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_misc_gen_matrix(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.MISC_GEN, self.config.study_path, area_id=area_id)
+    def get_misc_gen_matrix(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.MISC_GEN,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
     def update_areas_properties(self, dict_areas: Dict[Area, AreaPropertiesUpdate]) -> Dict[str, AreaProperties]:
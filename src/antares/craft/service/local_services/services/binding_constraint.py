@@ -12,7 +12,7 @@
 import copy
 import shutil
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -41,7 +41,13 @@ from antares.craft.service.local_services.services.utils import (
     remove_object_from_scenario_builder,
 )
 from antares.craft.tools.contents_tool import transform_name_to_id
-from antares.craft.tools.matrix_tool import read_timeseries, write_timeseries
+from antares.craft.tools.matrix_tool import (
+    Matrix,
+    MatrixFormat,
+    convert_numpy_matrix,
+    read_timeseries,
+    write_timeseries,
+)
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
@@ -184,12 +190,26 @@ class BindingConstraintLocalService(BaseBindingConstraintService):
         self._save_ini(current_ini_content)
 
     @override
-    def get_constraint_matrix(self, constraint: BindingConstraint, matrix_name: ConstraintMatrixName) -> pd.DataFrame:
-        df = read_timeseries(MAPPING[matrix_name], self.config.study_path, constraint_id=constraint.id)
-        if not df.empty:
-            return df
+    def get_constraint_matrix(
+        self,
+        constraint: BindingConstraint,
+        matrix_name: ConstraintMatrixName,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
+        matrix = read_timeseries(
+            MAPPING[matrix_name],
+            self.config.study_path,
+            constraint_id=constraint.id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
+        if 0 not in matrix.shape:
+            return matrix
         default_matrix_shape = DEFAULT_VALUE_MAPPING[constraint.properties.time_step]
-        return pd.DataFrame(np.zeros(default_matrix_shape))
+        return convert_numpy_matrix(np.zeros(default_matrix_shape), output_format, columns)
 
     @override
     def set_constraint_matrix(
@@ -203,6 +223,9 @@ class BindingConstraintLocalService(BaseBindingConstraintService):
             matrix,
             MAPPING[matrix_name],
             constraint_id=constraint.id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
         )
 
     @override
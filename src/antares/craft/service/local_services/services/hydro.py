@@ -10,7 +10,7 @@
 #
 # This file is part of the Antares project.
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Sequence
 
 import pandas as pd
 
@@ -29,7 +29,7 @@ from antares.craft.service.local_services.models.hydro import (
     serialize_hydro_properties_local,
 )
 from antares.craft.tools.contents_tool import transform_name_to_id
-from antares.craft.tools.matrix_tool import read_timeseries, write_timeseries
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, read_timeseries, write_timeseries
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
@@ -97,76 +97,238 @@ class HydroLocalService(BaseHydroService):
         return HydroInflowStructureLocal.model_validate(prepro_dict).to_user_model()
 
     @override
-    def get_maxpower(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_MAX_POWER, self.config.study_path, area_id=area_id)
+    def get_maxpower(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_MAX_POWER,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_reservoir(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_RESERVOIR, self.config.study_path, area_id=area_id)
+    def get_reservoir(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_RESERVOIR,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_inflow_pattern(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_INFLOW_PATTERN, self.config.study_path, area_id=area_id)
+    def get_inflow_pattern(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_INFLOW_PATTERN,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_credit_modulations(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_CREDITS_MODULATION, self.config.study_path, area_id=area_id)
+    def get_credit_modulations(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_CREDITS_MODULATION,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_water_values(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_WATER_VALUES, self.config.study_path, area_id=area_id)
+    def get_water_values(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_WATER_VALUES,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_ror_series(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_ROR, self.config.study_path, area_id=area_id)
+    def get_ror_series(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_ROR,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_mod_series(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_MOD, self.config.study_path, area_id=area_id)
+    def get_mod_series(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_MOD,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_mingen(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_MINGEN, self.config.study_path, area_id=area_id)
+    def get_mingen(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_MINGEN,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
-    def get_energy(self, area_id: str) -> pd.DataFrame:
-        return read_timeseries(TimeSeriesFileType.HYDRO_ENERGY, self.config.study_path, area_id=area_id)
+    def get_energy(
+        self, area_id: str, columns: Optional[Sequence[int]] = None, output_format: MatrixFormat = MatrixFormat.PANDAS
+    ) -> Matrix:
+        return read_timeseries(
+            TimeSeriesFileType.HYDRO_ENERGY,
+            self.config.study_path,
+            area_id=area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
     def set_maxpower(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_MAX_POWER, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_MAX_POWER,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_reservoir(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_RESERVOIR, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_RESERVOIR,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_inflow_pattern(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_INFLOW_PATTERN, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_INFLOW_PATTERN,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_credits_modulation(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_CREDITS_MODULATION, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_CREDITS_MODULATION,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_water_values(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_WATER_VALUES, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_WATER_VALUES,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_ror_series(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_ROR, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_ROR,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_mod_series(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_MOD, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_MOD,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_mingen(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_MINGEN, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_MINGEN,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def set_energy(self, area_id: str, series: pd.DataFrame) -> None:
-        write_timeseries(self.config.study_path, series, TimeSeriesFileType.HYDRO_ENERGY, area_id)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            TimeSeriesFileType.HYDRO_ENERGY,
+            area_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     def edit_hydro_properties(self, area_id: str, properties: HydroPropertiesUpdate, creation: bool) -> None:
         current_content = self.read_hydro_ini()
@@ -9,7 +9,7 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 import pandas as pd
 
@@ -29,7 +29,7 @@ from antares.craft.service.local_services.services.utils import (
     checks_matrix_dimensions,
     remove_object_from_scenario_builder,
 )
-from antares.craft.tools.matrix_tool import read_timeseries, write_timeseries
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, read_timeseries, write_timeseries
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
@@ -93,7 +93,16 @@ class LinkLocalService(BaseLinkService):
             TimeSeriesFileType.LINKS_CAPACITIES_INDIRECT,
             TimeSeriesFileType.LINKS_CAPACITIES_DIRECT,
         ]:
-            write_timeseries(self.config.study_path, series, ts, area_id=area_from, second_area_id=area_to)
+            write_timeseries(
+                self.config.study_path,
+                series,
+                ts,
+                area_id=area_from,
+                second_area_id=area_to,
+                cache=self.config.matrix_cache,
+                memory_cache=self.config.matrix_memory_cache,
+                store=self.config.matrix_store,
+            )
 
         return Link(
             area_from=area_from,
@@ -156,6 +165,9 @@ class LinkLocalService(BaseLinkService):
             TimeSeriesFileType.LINKS_PARAMETERS,
             area_id=area_from,
             second_area_id=area_to,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
         )
 
     @override
@@ -167,6 +179,9 @@ class LinkLocalService(BaseLinkService):
             TimeSeriesFileType.LINKS_CAPACITIES_DIRECT,
             area_id=area_from,
             second_area_id=area_to,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
         )
 
     @override
@@ -178,6 +193,9 @@ class LinkLocalService(BaseLinkService):
             TimeSeriesFileType.LINKS_CAPACITIES_INDIRECT,
             area_id=area_from,
             second_area_id=area_to,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
         )
 
     @override
@@ -185,12 +203,18 @@ class LinkLocalService(BaseLinkService):
         self,
         area_from: str,
         area_to: str,
-    ) -> pd.DataFrame:
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         return read_timeseries(
             TimeSeriesFileType.LINKS_CAPACITIES_DIRECT,
             self.config.study_path,
             area_id=area_from,
             second_area_id=area_to,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
         )
 
     @override
@@ -198,12 +222,18 @@ class LinkLocalService(BaseLinkService):
         self,
         area_from: str,
         area_to: str,
-    ) -> pd.DataFrame:
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         return read_timeseries(
             TimeSeriesFileType.LINKS_CAPACITIES_INDIRECT,
             self.config.study_path,
             area_id=area_from,
             second_area_id=area_to,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
         )
 
     @override
@@ -211,9 +241,18 @@ class LinkLocalService(BaseLinkService):
         self,
         area_from: str,
         area_to: str,
-    ) -> pd.DataFrame:
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         return read_timeseries(
-            TimeSeriesFileType.LINKS_PARAMETERS, self.config.study_path, area_id=area_from, second_area_id=area_to
+            TimeSeriesFileType.LINKS_PARAMETERS,
+            self.config.study_path,
+            area_id=area_from,
+            second_area_id=area_to,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
         )
 
     @override
@@ -0,0 +1,267 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import itertools
+import json
+import logging
+import os
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+import polars as pl
+
+from antares.craft.model.output import Frequency, MCIndAreasDataType, MCIndLinksDataType
+from antares.craft.service.local_services.services.output.output_aggregation import (
+    AREA_COL,
+    CLUSTER_ID_COL,
+    LINK_COL,
+    MCYEAR_COL,
+    TIME_ID_COL,
+    AggregatorManager,
+)
+from antares.craft.service.local_services.services.output.output_catalog import SIMULATION_END_FILE_NAME, OutputCatalog
+from antares.craft.service.local_services.services.output.utils import MCRoot
+
+LEDGER_FILE_NAME = "ingested.json"
+"""Name of the file listing the output files already ingested, inside the parquet store."""
+LEDGER_VERSION = 1
+SETTLE_TIME = 10.0
+"""Seconds without any modification after which the files of a Monte Carlo year are considered complete."""
+
+_MC_YEAR_PART = 2
+"""Index of the Monte Carlo year in the parts of a file path relative to the output folder."""
+_STRING_COLUMNS = {AREA_COL, LINK_COL, CLUSTER_ID_COL}
+_INTEGER_COLUMNS = {MCYEAR_COL, TIME_ID_COL}
+
+logger = logging.getLogger(__name__)
+
+
+def _column_type(column: str) -> pl.DataType:
+    if column in _STRING_COLUMNS:
+        return pl.String()
+    if column in _INTEGER_COLUMNS:
+        return pl.Int64()
+    return pl.Float64()
+
+
+def _write_atomically(path: Path, write: Callable[[Path], object]) -> None:
+    # A crash while writing never leaves a truncated file: the previous one is kept.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+class IncrementalAggregator:
+    """Aggregation of individual results to a parquet store, kept up to date while the simulation runs.
+
+    The simulator writes the Monte Carlo years one after the other. Each update only parses the years
+    completed since the previous one: the store remembers every ingested file, i.e. every (year, area or link, file)
+    tuple, along with its size and modification time. A year is rewritten as a whole if one of its files changed.
+
+    A year is complete once the simulation ended, or once its files were not modified for `settle_time` seconds.
+
+    The store is a hive partitioned parquet dataset, with one `mcYear=<year>` folder per ingested year.
+    It can be read at any time with `scan`, e.g. by a dashboard, while the simulation goes on.
+
+    Only unzipped outputs can be followed, as the simulator writes archives at the end of the simulation.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        store_path: Path,
+        query_file: MCIndAreasDataType | MCIndLinksDataType,
+        frequency: Frequency,
+        ids_to_consider: Sequence[str] = (),
+        columns_names: Sequence[str] = (),
+        mc_years: Optional[Sequence[int]] = None,
+        max_workers: int = 1,
+        settle_time: float = SETTLE_TIME,
+    ) -> None:
+        """
+        Args:
+            output_path: Folder of the output being written.
+            store_path: Folder of the parquet store. It should not exist, be empty, or hold a previous
+                update of the same aggregation.
+            query_file: Type of the aggregated files.
+            frequency: Frequency of the aggregated files.
+            ids_to_consider: Areas or links to aggregate, all of them if empty.
+            columns_names: Columns to keep, all of them if empty.
+            mc_years: Monte Carlo years to aggregate, all of them if not given.
+            max_workers: Number of files parsed in parallel.
+            settle_time: Seconds without any modification after which a year is considered complete.
+
+        Raises:
+            FileExistsError: If the store folder holds something else.
+            ValueError: If the store holds another aggregation.
+        """
+        self.output_path = output_path
+        self.store_path = store_path
+        self.query_file = query_file
+        self.frequency = frequency
+        self.ids_to_consider = list(ids_to_consider)
+        self.columns_names = list(columns_names)
+        self.mc_years = list(mc_years) if mc_years else None
+        self.max_workers = max_workers
+        self.settle_time = settle_time
+        self._query = {
+            "output": output_path.name,
+            "data_type": query_file.value,
+            "output_type": "areas" if isinstance(query_file, MCIndAreasDataType) else "links",
+            "frequency": frequency.value,
+            "ids": self.ids_to_consider,
+            "columns": self.columns_names,
+            "mc_years": self.mc_years,
+        }
+        self._columns: list[str] = []
+        self._files: dict[str, list[int]] = {}
+        self._load_ledger()
+
+    @property
+    def _ledger_path(self) -> Path:
+        return self.store_path / LEDGER_FILE_NAME
+
+    def _load_ledger(self) -> None:
+        if not self._ledger_path.exists():
+            if self.store_path.exists() and any(self.store_path.iterdir()):
+                raise FileExistsError(f"The folder {self.store_path} already exists and is not empty")
+            return
+        content: dict[str, Any] = json.loads(self._ledger_path.read_text())
+        if content.get("version") != LEDGER_VERSION or content.get("query") != self._query:
+            raise ValueError(f"The store {self.store_path} holds another aggregation")
+        self._columns = content["columns"]
+        self._files = content["files"]
+
+    def _save_ledger(self) -> None:
+        content = {"version": LEDGER_VERSION, "query": self._query, "columns": self._columns, "files": self._files}
+        _write_atomically(self._ledger_path, lambda path: path.write_text(json.dumps(content)))
+
+    def ingested_years(self) -> list[int]:
+        """Monte Carlo years held by the store."""
+        return sorted({int(Path(relative_path).parts[_MC_YEAR_PART]) for relative_path in self._files})
+
+    def _aggregator_manager(self, catalog: OutputCatalog, mc_years: Optional[Sequence[int]]) -> AggregatorManager:
+        return AggregatorManager(
+            self.output_path,
+            self.query_file,
+            self.frequency,
+            self.ids_to_consider,
+            self.columns_names,
+            mc_years,
+            max_workers=self.max_workers,
+            catalog=catalog,
+        )
+
+    def _simulation_ended(self) -> bool:
+        return (self.output_path / SIMULATION_END_FILE_NAME).exists()
+
+    def _years_to_ingest(self, files: Sequence[Path]) -> dict[int, dict[str, list[int]]]:
+        # Files of each year, along with their size and modification time
+        years: dict[int, dict[str, list[int]]] = {}
+        for file_path in files:
+            relative_path = file_path.relative_to(self.output_path).as_posix()
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            mc_year = int(Path(relative_path).parts[_MC_YEAR_PART])
+            years.setdefault(mc_year, {})[relative_path] = [stat.st_size, stat.st_mtime_ns]
+
+        simulation_ended = self._simulation_ended()
+        settled_before = time.time_ns() - int(self.settle_time * 1e9)
+        to_ingest: dict[int, dict[str, list[int]]] = {}
+        for mc_year, year_files in years.items():
+            if all(self._files.get(relative_path) == state for relative_path, state in year_files.items()):
+                continue
+            if simulation_ended or all(mtime <= settled_before for _, mtime in year_files.values()):
+                to_ingest[mc_year] = year_files
+        return to_ingest
+
+    def _write_year(self, mc_year: int, year_df: pl.DataFrame) -> None:
+        for column in year_df.columns:
+            if column not in self._columns:
+                self._columns.append(column)
+        # The year is given by the partition folder
+        year_df = year_df.drop(MCYEAR_COL)
+        year_df = year_df.cast({column: _column_type(column) for column in year_df.columns})
+        partition_path = self.store_path / f"{MCYEAR_COL}={mc_year}"
+        partition_path.mkdir(parents=True, exist_ok=True)
+        _write_atomically(partition_path / "part-0.parquet", year_df.write_parquet)
+
+    def _record_year(self, mc_year: int, year_files: dict[str, list[int]]) -> None:
+        # The ledger is saved after each year, so that an interrupted update resumes where it stopped.
+        self._files = {
+            relative_path: state
+            for relative_path, state in self._files.items()
+            if int(Path(relative_path).parts[_MC_YEAR_PART]) != mc_year
+        }
+        self._files.update(year_files)
+        self._save_ledger()
+
+    def update(self) -> list[int]:
+        """Ingests the Monte Carlo years completed since the previous update.
+
+        Returns:
+            The ingested years, or an empty list if no year was completed since then.
+        """
+        # The output is being written: its catalog is built again instead of being persisted.
+        catalog = OutputCatalog.build(self.output_path)
+        if not catalog.has_folder(f"economy/{MCRoot.MC_IND.value}"):
+            return []
+        files = self._aggregator_manager(catalog, self.mc_years).list_output_files()
+        to_ingest = self._years_to_ingest(files)
+        if not to_ingest:
+            return []
+
+        logger.info(f"Ingesting the Monte Carlo years {sorted(to_ingest)} of the output {self.output_path.name}")
+        self.store_path.mkdir(parents=True, exist_ok=True)
+        tables = self._aggregator_manager(catalog, sorted(to_ingest)).aggregate_output_tables()
+        # Files without any row, e.g. just created ones, hold nothing to write
+        non_empty_tables = (df for df in tables if not df.is_empty())
+        written_years: set[int] = set()
+        for mc_year, year_dfs in itertools.groupby(non_empty_tables, key=lambda df: int(df[MCYEAR_COL][0])):
+            self._write_year(mc_year, pl.concat(list(year_dfs), how="diagonal_relaxed"))
+            self._record_year(mc_year, to_ingest[mc_year])
+            written_years.add(mc_year)
+        for mc_year in sorted(to_ingest.keys() - written_years):
+            # The year holds no row yet: the rows of a previous update are outdated as well
+            (self.store_path / f"{MCYEAR_COL}={mc_year}" / "part-0.parquet").unlink(missing_ok=True)
+            self._record_year(mc_year, to_ingest[mc_year])
+        return sorted(to_ingest)
+
+    def watch(self, is_running: Callable[[], bool], poll_interval: float = SETTLE_TIME) -> list[int]:
+        """Updates the store every `poll_interval` seconds while the simulation runs, then a last time.
+
+        Args:
+            is_running: Whether the simulation still runs.
+            poll_interval: Seconds between two updates.
+
+        Returns:
+            Every ingested year.
+        """
+        ingested_years: list[int] = []
+        while is_running():
+            ingested_years += self.update()
+            time.sleep(poll_interval)
+        ingested_years += self.update()
+        return sorted(set(ingested_years))
+
+    def scan(self) -> pl.LazyFrame:
+        """Scans the store, with the columns of the aggregation. Years not ingested yet are missing."""
+        schema = pl.Schema({column: _column_type(column) for column in self._columns})
+        # Every ingested year may hold no row yet
+        if not any(self.store_path.glob("*/*.parquet")):
+            return pl.LazyFrame(schema=schema)
+        return pl.scan_parquet(
+            self.store_path / "*" / "*.parquet", hive_partitioning=True, schema=schema, missing_columns="insert"
+        )
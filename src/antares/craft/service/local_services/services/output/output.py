@@ -9,19 +9,39 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Mapping, Optional, Sequence
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import polars as pl
 
 from typing_extensions import override
 
 from antares.craft.config.local_configuration import LocalConfiguration
-from antares.craft.exceptions.exceptions import OutputDataRetrievalError, XpansionOutputParsingError
-from antares.craft.model.output import AggregationEntry, Frequency, XpansionResult, XpansionSensitivityResult
+from antares.craft.exceptions.exceptions import OutputDataRetrievalError, OutputNotFound, XpansionOutputParsingError
+from antares.craft.model.output import (
+    AggregatedData,
+    AggregationEntry,
+    AggregationFormat,
+    Frequency,
+    MCStatistic,
+    OutputCube,
+    ParquetCompression,
+    TsNumbersKind,
+    XpansionResult,
+    XpansionSensitivityResult,
+)
 from antares.craft.service.base_services import BaseOutputService
 from antares.craft.service.local_services.services.output.output_aggregation import AggregatorManager, export_df_chunks
+from antares.craft.service.local_services.services.output.output_catalog import OutputCatalog
+from antares.craft.service.local_services.services.output.output_store import OutputStore, convert_output
+from antares.craft.service.mc_statistics import compute_mc_statistics, split_by_year
 from antares.craft.service.output_matrix_parsing import read_output_matrix
-from antares.craft.service.utils import read_ts_numbers_file
+from antares.craft.service.parquet_dataset import write_parquet_dataset
+from antares.craft.service.utils import build_ts_numbers_dataframe, parse_ts_numbers, read_ts_numbers_file
 from antares.craft.service.xpansion_output_parsing import parse_xpansion_out_json, parse_xpansion_sensitivity_out_json
 
 
@@ -29,31 +49,162 @@ class OutputLocalService(BaseOutputService):
     def __init__(self, config: LocalConfiguration, study_name: str) -> None:
         self.config = config
         self.study_name = study_name
+        self._catalogs: dict[str, OutputCatalog] = {}
+        self._stores: dict[str, Optional[OutputStore]] = {}
+
+    @property
+    def _cache_dir(self) -> Optional[Path]:
+        # Catalogs and parquet conversions of the outputs are recorded along with the matrix cache
+        matrix_cache = self.config.matrix_cache
+        return matrix_cache.cache_dir if matrix_cache else None
+
+    def _get_catalog(self, output_id: str) -> OutputCatalog:
+        # Resolved once per call and handed down: checking the catalog only costs a few `stat` calls.
+        catalog = self._catalogs.get(output_id)
+        if catalog is None or not catalog.is_up_to_date():
+            if catalog is not None:
+                # The outdated catalog may keep its archive open
+                catalog.close()
+            catalog = OutputCatalog.load(self.config.study_path / "output" / output_id, self._cache_dir)
+            self._catalogs[output_id] = catalog
+        return catalog
+
+    @staticmethod
+    def _refresh_catalog(catalog: OutputCatalog, relative_paths: Sequence[str]) -> None:
+        """Looks again for the given files if they're missing from the catalog.
+
+        A running simulation adds files to the folders already listed by the catalog: only the folders
+        of the missing files are listed again.
+        """
+        missing_paths = [relative_path for relative_path in relative_paths if not catalog.has_file(relative_path)]
+        if missing_paths and not catalog.complete:
+            catalog.refresh(missing_paths)
+
+    @staticmethod
+    def _check_matrix_files(output_id: str, catalog: OutputCatalog, relative_paths: Sequence[str]) -> None:
+        for relative_path in relative_paths:
+            if not catalog.has_file(relative_path):
+                raise OutputDataRetrievalError(output_id, f"The file {relative_path} does not exist")
+
+    def _get_store(self, output_id: str, catalog: OutputCatalog) -> Optional[OutputStore]:
+        if output_id not in self._stores:
+            self._stores[output_id] = OutputStore.find(catalog.output_path, self._cache_dir)
+        store = self._stores[output_id]
+        # The store of an output modified since its conversion is outdated
+        if store is None or store.signature != catalog.signature:
+            return None
+        return store
+
+    @staticmethod
+    def _read_matrix(
+        catalog: OutputCatalog, store: Optional[OutputStore], relative_path: str, frequency: Frequency
+    ) -> pd.DataFrame:
+        df = store.read_matrix(relative_path) if store is not None else None
+        if df is None:
+            df = read_output_matrix(catalog.file_source(relative_path), frequency)
+        return df
 
     @override
     def get_matrix(self, output_id: str, file_path: str, frequency: Frequency) -> pd.DataFrame:
-        full_path = self.config.study_path / "output" / output_id / "economy" / f"{file_path}.txt"
-        return read_output_matrix(full_path, frequency)
+        relative_path = f"economy/{file_path}.txt"
+        catalog = self._get_catalog(output_id)
+        self._refresh_catalog(catalog, [relative_path])
+        self._check_matrix_files(output_id, catalog, [relative_path])
+        return self._read_matrix(catalog, self._get_store(output_id, catalog), relative_path, frequency)
 
     @override
-    def aggregate_values(
-        self, output_id: str, aggregation_entry: AggregationEntry, object_type: str, mc_type: str
-    ) -> pd.DataFrame:
+    def get_matrices(self, output_id: str, file_paths: Sequence[str], frequency: Frequency) -> list[pd.DataFrame]:
+        # Every file is checked before reading any of them
+        relative_paths = [f"economy/{file_path}.txt" for file_path in file_paths]
+        catalog = self._get_catalog(output_id)
+        self._refresh_catalog(catalog, relative_paths)
+        self._check_matrix_files(output_id, catalog, relative_paths)
+        store = self._get_store(output_id, catalog)
+
+        def read(relative_path: str) -> pd.DataFrame:
+            return self._read_matrix(catalog, store, relative_path, frequency)
+
+        with ThreadPoolExecutor(max_workers=self.config.output_aggregation_workers) as executor:
+            return list(executor.map(read, relative_paths))
+
+    def _aggregator_manager(self, output_id: str, aggregation_entry: AggregationEntry) -> AggregatorManager:
         type_ids = aggregation_entry.type_ids or []
         columns_names = aggregation_entry.columns_names or []
         mc_years = [int(mc_year) for mc_year in aggregation_entry.mc_years] if aggregation_entry.mc_years else []
+        catalog = self._get_catalog(output_id)
 
-        aggregator_manager = AggregatorManager(
+        return AggregatorManager(
             self.config.study_path / "output" / output_id,
             aggregation_entry.data_type,
             aggregation_entry.frequency,
             type_ids,
             columns_names,
             mc_years,
+            max_workers=self.config.output_aggregation_workers,
+            catalog=catalog,
+            store=self._get_store(output_id, catalog),
         )
 
-        dfs = aggregator_manager.aggregate_output_data()
-        return export_df_chunks(self.config.study_path.parent, dfs)
+    @override
+    def aggregate_values(
+        self, output_id: str, aggregation_entry: AggregationEntry, object_type: str, mc_type: str
+    ) -> AggregatedData:
+        aggregator_manager = self._aggregator_manager(output_id, aggregation_entry)
+
+        if aggregation_entry.output_format == AggregationFormat.PANDAS:
+            dfs = aggregator_manager.aggregate_output_data()
+            return export_df_chunks(self.config.study_path.parent, dfs)
+
+        table = aggregator_manager.aggregate_output_table()
+        return table if aggregation_entry.output_format == AggregationFormat.POLARS else table.to_arrow()
+
+    @override
+    def aggregate_values_to_parquet(
+        self,
+        output_id: str,
+        aggregation_entry: AggregationEntry,
+        object_type: str,
+        mc_type: str,
+        path: Path,
+        partition_by: Sequence[str],
+    ) -> pl.LazyFrame:
+        aggregator_manager = self._aggregator_manager(output_id, aggregation_entry)
+        return write_parquet_dataset(path, aggregator_manager.aggregate_output_tables(), partition_by)
+
+    @override
+    def compute_mc_statistics(
+        self,
+        output_id: str,
+        aggregation_entry: AggregationEntry,
+        object_type: str,
+        stats: Sequence[MCStatistic],
+        quantiles: Sequence[float],
+        weights: Optional[Mapping[int, float]],
+    ) -> pd.DataFrame:
+        aggregator_manager = self._aggregator_manager(output_id, aggregation_entry)
+        # Files are parsed in parallel by the aggregation workers but gathered one year at a time
+        year_dfs = split_by_year(aggregator_manager.aggregate_output_tables())
+        return compute_mc_statistics(year_dfs, stats, quantiles, weights).to_pandas()
+
+    @override
+    def to_cube(
+        self,
+        output_id: str,
+        aggregation_entry: AggregationEntry,
+        object_type: str,
+        dtype: npt.DTypeLike,
+        memmap_dir: Optional[Path],
+    ) -> OutputCube:
+        return self._aggregator_manager(output_id, aggregation_entry).build_cube(dtype, memmap_dir)
+
+    @override
+    def convert_to_parquet(self, output_id: str, dest: Path, compression: ParquetCompression) -> None:
+        catalog = self._get_catalog(output_id)
+        if not catalog.output_path.exists():
+            raise OutputNotFound(output_id)
+        self._stores[output_id] = convert_output(
+            catalog, dest, compression, self.config.output_aggregation_workers, self._cache_dir
+        )
 
     @override
     def get_xpansion_result(self, output_id: str) -> XpansionResult:
@@ -71,63 +222,76 @@ class OutputLocalService(BaseOutputService):
         except Exception as e:
             raise XpansionOutputParsingError(self.study_name, output_id, "sensitivity_out.json", e.args[0])
 
-    def _get_ts_numbers_path(self, output_id: str) -> Path:
-        ts_numbers_path = self.config.study_path / "output" / output_id / "ts-numbers"
-        if not ts_numbers_path.exists():
+    def _read_ts_numbers_file(self, output_id: str, relative_path: str) -> dict[int, int]:
+        catalog = self._get_catalog(output_id)
+        if not catalog.has_folder("ts-numbers"):
             raise OutputDataRetrievalError(output_id, "The `ts-numbers` folder does not exist")
-        return ts_numbers_path
-
-    @staticmethod
-    def _read_ts_numbers_file(file_path: Path, output_id: str) -> dict[int, int]:
-        if not file_path.exists():
-            raise OutputDataRetrievalError(output_id, f"The file {file_path} does not exist")
-        return read_ts_numbers_file(file_path)
+        file_path = f"ts-numbers/{relative_path}"
+        self._refresh_catalog(catalog, [file_path])
+        if not catalog.has_file(file_path):
+            raise OutputDataRetrievalError(output_id, f"The file {catalog.output_path / file_path} does not exist")
+        store = self._get_store(output_id, catalog)
+        if store is not None:
+            kind, _, object_id = relative_path.removesuffix(".txt").partition("/")
+            ts_numbers = store.read_ts_numbers(kind, object_id)
+            if ts_numbers is not None:
+                return {k + 1: int(value) for k, value in enumerate(ts_numbers[object_id])}
+        return read_ts_numbers_file(catalog.file_source(file_path))
 
     @override
     def get_solar_ts_numbers(self, area_id: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "solar" / f"{area_id}.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"solar/{area_id}.txt")
 
     @override
     def get_wind_ts_numbers(self, area_id: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "wind" / f"{area_id}.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"wind/{area_id}.txt")
 
     @override
     def get_load_ts_numbers(self, area_id: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "load" / f"{area_id}.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"load/{area_id}.txt")
 
     @override
     def get_hydro_ts_numbers(self, area_id: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "hydro" / f"{area_id}.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"hydro/{area_id}.txt")
 
     @override
     def get_link_ts_numbers(self, area_from: str, area_to: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "ntc" / area_from / f"{area_to}.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"ntc/{area_from}/{area_to}.txt")
 
     @override
     def get_binding_constraint_ts_numbers(self, group_id: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "bindingconstraints" / f"{group_id}.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"bindingconstraints/{group_id}.txt")
 
     @override
     def get_thermal_ts_numbers(self, area_id: str, thermal_id: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "thermal" / area_id / f"{thermal_id}.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"thermal/{area_id}/{thermal_id}.txt")
 
     @override
     def get_st_storage_inflows_numbers(self, area_id: str, st_storage_id: str, output_id: str) -> dict[int, int]:
-        file_path = self._get_ts_numbers_path(output_id) / "st-storage" / area_id / st_storage_id / "inflows.txt"
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"st-storage/{area_id}/{st_storage_id}/inflows.txt")
 
     @override
     def get_st_storage_additional_constraints_numbers(
         self, area_id: str, st_storage_id: str, constraint_id: str, output_id: str
     ) -> dict[int, int]:
-        file_path = (
-            self._get_ts_numbers_path(output_id) / "st-storage" / area_id / st_storage_id / f"{constraint_id}.txt"
-        )
-        return self._read_ts_numbers_file(file_path, output_id)
+        return self._read_ts_numbers_file(output_id, f"st-storage/{area_id}/{st_storage_id}/{constraint_id}.txt")
+
+    @override
+    def get_all_ts_numbers(self, kind: TsNumbersKind, output_id: str) -> pd.DataFrame:
+        catalog = self._get_catalog(output_id)
+        folder = f"ts-numbers/{kind.value}"
+        if not catalog.has_folder(folder):
+            raise OutputDataRetrievalError(output_id, f"The folder {catalog.output_path / folder} does not exist")
+        store = self._get_store(output_id, catalog)
+        stored_ts_numbers = store.read_ts_numbers(kind.value) if store is not None else None
+        if stored_ts_numbers is not None:
+            return build_ts_numbers_dataframe(stored_ts_numbers)
+        files = [file_path for file_path in catalog.list_files(folder) if file_path.endswith(".txt")]
+
+        def parse(file_path: str) -> np.ndarray:
+            return parse_ts_numbers(catalog.file_source(file_path))
+
+        with ThreadPoolExecutor(max_workers=self.config.output_aggregation_workers) as executor:
+            ts_numbers = executor.map(parse, files)
+            object_ids = [file_path.removeprefix(f"{folder}/").removesuffix(".txt") for file_path in files]
+            return build_ts_numbers_dataframe(dict(zip(object_ids, ts_numbers)))
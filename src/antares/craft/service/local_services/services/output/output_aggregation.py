@@ -10,19 +10,19 @@
 #
 # This file is part of the Antares project.
 
+import itertools
 import logging
 import tempfile
-import warnings
 
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterator, List, MutableSequence, Optional, Sequence
+from typing import Callable, Iterator, List, Optional, Sequence, TypeVar, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import polars as pl
 
-from polars.exceptions import ComputeError
-
 from antares.craft.exceptions.exceptions import (
     MCRootNotHandled,
     OutputAggregationError,
@@ -35,17 +35,34 @@ from antares.craft.model.output import (
     MCAllLinksDataType,
     MCIndAreasDataType,
     MCIndLinksDataType,
+    OutputCube,
+)
+from antares.craft.service.local_services.services.output.output_catalog import OutputCatalog
+from antares.craft.service.local_services.services.output.output_store import (
+    OutputStore,
+    StoredFile,
+    StoredOutputs,
+    locate_output_file,
 )
 from antares.craft.service.local_services.services.output.parquet_writer import (
     write_dataframes_in_parquet_format_by_column_sets,
     yield_dataframes_from_parquet,
 )
-from antares.craft.service.local_services.services.output.utils import MCRoot, normalize_df_column_names
-from antares.craft.service.output_matrix_parsing import get_start_column, parse_headers
-
-# We use pandas.DataFrame.stack() without the `future_stack` keyword as its 2 times faster
-# But it logs a FutureWarning every time so we silence it here.
-warnings.simplefilter(action="ignore", category=FutureWarning)
+from antares.craft.service.local_services.services.output.utils import (
+    MCRoot,
+    map_in_order,
+    normalize_df_column_names,
+)
+from antares.craft.service.output_cube import allocate_cube_values, variables_by_column
+from antares.craft.service.output_matrix_parsing import (
+    HeaderCache,
+    MultipleOutputHeaders,
+    OutputDataFrame,
+    OutputHeaders,
+    get_start_column,
+    parse_output_file,
+    reshape_details_output,
+)
 
 # noinspection SpellCheckingInspection
 MCYEAR_COL = "mcYear"
@@ -68,6 +85,9 @@ ACTUAL_COLUMN_COMPONENT = 1
 
 logger = logging.getLogger(__name__)
 
+_DataFrameT = TypeVar("_DataFrameT", pd.DataFrame, pl.DataFrame)
+_ResultT = TypeVar("_ResultT")
+
 
 def _columns_ordering(df_cols: List[str], column_name: str, is_details: bool, mc_root: MCRoot) -> Sequence[str]:
     # original columns
@@ -87,19 +107,6 @@ def _columns_ordering(df_cols: List[str], column_name: str, is_details: bool, mc
     return new_column_order
 
 
-def _filtered_files_listing(
-    folders_to_check: List[Path],
-    query_file: str,
-    frequency: str,
-) -> Dict[str, MutableSequence[str]]:
-    filtered_files: Dict[str, MutableSequence[str]] = {}
-    for folder_path in folders_to_check:
-        for file in folder_path.iterdir():
-            if file.stem == f"{query_file}-{frequency}":
-                filtered_files.setdefault(folder_path.name, []).append(file.name)
-    return filtered_files
-
-
 class AggregatorManager:
     def __init__(
         self,
@@ -109,6 +116,9 @@ class AggregatorManager:
         ids_to_consider: Sequence[str],
         columns_names: Sequence[str],
         mc_years: Optional[Sequence[int]] = None,
+        max_workers: int = 1,
+        catalog: Optional[OutputCatalog] = None,
+        store: Optional[OutputStore] = None,
     ):
         self.output_path = output_path
         self.output_id = self.output_path.name
@@ -130,111 +140,119 @@ class AggregatorManager:
             else MCRoot.MC_ALL
         )
         self._output_first_column = get_start_column(self.frequency)
+        self.max_workers = max_workers
+        self._catalog = catalog
+        # Files share a few distinct headers: they are parsed once, along with the columns selection.
+        self._header_cache = HeaderCache()
+        self._column_selectors = {
+            is_details: partial(self._selected_columns, is_details=is_details) for is_details in [False, True]
+        }
+        # Files of an output converted to parquet are read from its store instead
+        self._store = store
+        self._stored_outputs = StoredOutputs(store, ids_to_consider or None, max_workers) if store is not None else None
+
+    @property
+    def catalog(self) -> OutputCatalog:
+        if self._catalog is None:
+            self._catalog = OutputCatalog.load(self.output_path)
+        return self._catalog
+
+    def _file_source(self, file_path: Path) -> Path | bytes:
+        # Archived outputs are read straight from the archive
+        return self.catalog.file_source(file_path.relative_to(self.output_path).as_posix())
+
+    def _selected_columns(self, headers: MultipleOutputHeaders, is_details: bool) -> list[int]:
+        # The requested columns are resolved from the headers, so that only those are parsed.
+        if is_details:
+            names = [header[ACTUAL_COLUMN_COMPONENT] for header in headers]
+        else:
+            names = normalize_df_column_names(self.mc_root, headers)
+        kept_names = set(self._filter_columns(names, is_details))
+        return [k for k, name in enumerate(names) if name in kept_names]
+
+    def _parse_file(self, file_path: Path, is_details: bool) -> OutputDataFrame:
+        select_columns = self._column_selectors[is_details] if self.columns_names else None
+        if self._stored_outputs is not None:
+            relative_path = file_path.relative_to(self.output_path).as_posix()
+            output = self._stored_outputs.get(relative_path, select_columns)
+            if output is not None:
+                return output
+        return parse_output_file(
+            self._file_source(file_path), self._output_first_column, select_columns, self._header_cache
+        )
 
-    def _parse_output_file(self, file_path: Path, normalize_column_names: bool) -> pd.DataFrame:
-        content = file_path.read_text(encoding="utf-8")
-        output_headers = parse_headers(content, self._output_first_column)
-        try:
-            polars_df = pl.read_csv(
-                file_path, skip_lines=7, separator="\t", has_header=False, null_values="N/A", n_threads=1
-            )
-        except ComputeError:
-            # Happens if polars wrongly inferred the schema. If so, we specify that he shouldn't try.
-            # This way the parsing does not fail, but it is significantly slower.
-            # This case does not seem to happen very often.
-            polars_df = pl.read_csv(
-                file_path,
-                skip_lines=7,
-                separator="\t",
-                has_header=False,
-                null_values="N/A",
-                infer_schema=False,
-                n_threads=1,
-            )
-
-        df = polars_df[polars_df.columns[self._output_first_column :]].to_pandas().astype(np.float64)
+    def _normalized_column_names(self, output_headers: OutputHeaders) -> list[str]:
+        return output_headers.get_or_build(
+            ("normalized_names", self.mc_root), partial(normalize_df_column_names, self.mc_root)
+        )
 
-        df.columns = pd.MultiIndex.from_tuples(output_headers)  # type: ignore
+    def _parse_output_file(self, file_path: Path, normalize_column_names: bool) -> pd.DataFrame:
+        output = self._parse_file(file_path, is_details=not normalize_column_names)
+        df = output.data.to_pandas()
 
         if normalize_column_names:
-            df.columns = pd.Index(normalize_df_column_names(self.mc_root, output_headers))
+            df.columns = output.output_headers.get_or_build(
+                ("normalized_index", self.mc_root),
+                lambda _: pd.Index(self._normalized_column_names(output.output_headers)),
+            )
+        else:
+            df.columns = output.output_headers.multi_index()
 
         return df
 
-    def _filter_ids(self, folder_path: Path) -> List[str]:
-        if self.output_type == "areas":
-            # Areas names filtering
-            areas_ids = sorted([d.name for d in folder_path.iterdir()])
-            if self.ids_to_consider:
-                areas_ids = [area_id for area_id in areas_ids if area_id in self.ids_to_consider]
-            return areas_ids
-
-        # Links names filtering
-        links_ids = sorted(d.name for d in folder_path.iterdir())
+    def _filter_ids(self, folder: str) -> List[str]:
+        # Areas or links names filtering
+        ids = sorted(self.catalog.list_folder(folder))
         if self.ids_to_consider:
-            return [link for link in links_ids if link in self.ids_to_consider]
-        return links_ids
+            return [id for id in ids if id in self.ids_to_consider]
+        return ids
+
+    def _filtered_files_listing(self, folder: str) -> List[str]:
+        # Frequency and query file filtering
+        file_stem = f"{self.query_file.value}-{self.frequency.value}"
+        return [
+            f"{folder}/{id}/{file}"
+            for id in self._filter_ids(folder)
+            for file in self.catalog.list_folder(f"{folder}/{id}")
+            if Path(file).stem == file_stem
+        ]
 
     def _gather_all_files_to_consider(self) -> Sequence[Path]:
         if self.mc_root == MCRoot.MC_IND:
             # Monte Carlo years filtering
-            all_mc_years = [d.name for d in self.mc_ind_path.iterdir()]
+            all_mc_years = self.catalog.list_folder(f"economy/{MCRoot.MC_IND.value}")
             if self.mc_years:
                 all_mc_years = [year for year in all_mc_years if int(year) in self.mc_years]
-            if not all_mc_years:
-                return []
-
-            # Links / Areas ids filtering
 
-            # The list of areas and links is the same whatever the MC year under consideration:
-            # Therefore we choose the first year by default avoiding useless scanning directory operations.
-            first_mc_year = all_mc_years[0]
-            areas_or_links_ids = self._filter_ids(self.mc_ind_path / first_mc_year / self.output_type)
-
-            # Frequency and query file filtering
-            folders_to_check = [self.mc_ind_path / first_mc_year / self.output_type / id for id in areas_or_links_ids]
-            filtered_files = _filtered_files_listing(folders_to_check, self.query_file.value, self.frequency.value)
-
-            # Loop on MC years to return the whole list of files
-            all_output_files = [
-                self.mc_ind_path / mc_year / self.output_type / area_or_link / file
+            # The output catalog lists each folder once, and only the folders of the requested years are listed.
+            return [
+                self.output_path / file
                 for mc_year in all_mc_years
-                for area_or_link, files in filtered_files.items()
-                for file in files
+                for file in self._filtered_files_listing(f"economy/{MCRoot.MC_IND.value}/{mc_year}/{self.output_type}")
             ]
         elif self.mc_root == MCRoot.MC_ALL:
-            # Links / Areas ids filtering
-            areas_or_links_ids = self._filter_ids(self.mc_all_path / self.output_type)
-
-            # Frequency and query file filtering
-            folders_to_check = [self.mc_all_path / self.output_type / id for id in areas_or_links_ids]
-            filtered_files = _filtered_files_listing(folders_to_check, self.query_file.value, self.frequency.value)
-
-            # Loop to return the whole list of files
-            all_output_files = [
-                self.mc_all_path / self.output_type / area_or_link / file
-                for area_or_link, files in filtered_files.items()
-                for file in files
+            return [
+                self.output_path / file
+                for file in self._filtered_files_listing(f"economy/{MCRoot.MC_ALL.value}/{self.output_type}")
             ]
-        else:
-            raise MCRootNotHandled(f"Unknown Monte Carlo root: {self.mc_root}")
-        return all_output_files
+        raise MCRootNotHandled(f"Unknown Monte Carlo root: {self.mc_root}")
+
+    def _filter_columns(self, columns: List[str], is_details: bool) -> List[str]:
+        lower_case_columns = [c.lower() for c in self.columns_names]
+        if not lower_case_columns:
+            return columns
+        if is_details:
+            return [CLUSTER_ID_COL, TIME_ID_COL] + [
+                c for c in columns if any(regex in c.lower() for regex in lower_case_columns)
+            ]
+        elif self.mc_root == MCRoot.MC_ALL:
+            return [c for c in columns if any(regex in c.lower() for regex in lower_case_columns)]
+        return [c for c in columns if c.lower() in lower_case_columns]
 
     def columns_filtering(self, df: pd.DataFrame, is_details: bool) -> pd.DataFrame:
         # columns filtering
-        lower_case_columns = [c.lower() for c in self.columns_names]
-        if lower_case_columns:
-            if is_details:
-                filtered_columns = [CLUSTER_ID_COL, TIME_ID_COL] + [
-                    c for c in df.columns.tolist() if any(regex in c.lower() for regex in lower_case_columns)
-                ]
-            elif self.mc_root == MCRoot.MC_ALL:
-                filtered_columns = [
-                    c for c in df.columns.tolist() if any(regex in c.lower() for regex in lower_case_columns)
-                ]
-            else:
-                filtered_columns = [c for c in df.columns.tolist() if c.lower() in lower_case_columns]
-            df = df.loc[:, filtered_columns]
+        if self.columns_names:
+            df = df.loc[:, self._filter_columns(df.columns.tolist(), is_details)]
         return df
 
     def _process_df(self, file_path: Path, is_details: bool) -> pd.DataFrame:
@@ -254,30 +272,74 @@ class AggregatorManager:
             the DataFrame with the correct columns and values
         """
 
-        df = self._parse_output_file(file_path, normalize_column_names=not is_details)
+        if is_details:
+            return reshape_details_output(self._parse_file(file_path, is_details)).to_pandas()
+        return self._parse_output_file(file_path, normalize_column_names=True)
+
+    def _build_dataframe(self, file_path: Path, is_details: bool) -> pd.DataFrame:
+        df = self._process_df(file_path, is_details)
+
+        # columns filtering
+        df = self.columns_filtering(df, is_details)
+
+        column_name = AREA_COL if self.output_type == "areas" else LINK_COL
+        new_column_order = _columns_ordering(df.columns.tolist(), column_name, is_details, self.mc_root)
+
+        if self.mc_root == MCRoot.MC_IND:
+            # add column for links/areas
+            relative_path_parts = file_path.relative_to(self.mc_ind_path).parts
+            df[column_name] = relative_path_parts[AREA_OR_LINK_INDEX__IND]
+            # add column to record the Monte Carlo year
+            df[MCYEAR_COL] = int(relative_path_parts[MC_YEAR_INDEX])
+        else:
+            # add column for links/areas
+            relative_path_parts = file_path.relative_to(self.mc_all_path).parts
+            df[column_name] = relative_path_parts[AREA_OR_LINK_INDEX__ALL]
+
+        # add a column for the time id
         if not is_details:
-            return df
+            df[TIME_ID_COL] = range(1, len(df) + 1)
 
-        nb_clusters = df.columns.get_level_values(CLUSTER_ID_COMPONENT).nunique()
-        # actual columns without the cluster id (NODU, production etc.)
-        actual_cols = sorted(df.columns.get_level_values(ACTUAL_COLUMN_COMPONENT).unique())
+        # Reorganize the columns
+        return df.reindex(columns=pd.Index(new_column_order))
 
-        # First perform the stack / unstack operation to have the final shape
-        final_df = df.stack(level=[CLUSTER_ID_COMPONENT, ACTUAL_COLUMN_COMPONENT]).unstack()
+    def _process_polars_df(self, file_path: Path, is_details: bool) -> pl.DataFrame:
+        output = self._parse_file(file_path, is_details)
+        if not is_details:
+            return output.data.rename(
+                dict(zip(output.data.columns, self._normalized_column_names(output.output_headers)))
+            )
 
-        # Reset the index, drop the first column and rename the columns accordingly
-        final_df.reset_index(inplace=True)
-        final_df.drop(final_df.columns[0], axis=1, inplace=True)
-        final_df.columns = pd.Index([CLUSTER_ID_COL] + actual_cols, dtype="str")
+        return reshape_details_output(output)
 
-        # Add the TIME_ID column and reindex to have the columns in the right order
-        final_df[TIME_ID_COL] = (final_df.index // nb_clusters) + 1
-        return final_df.reindex(columns=[CLUSTER_ID_COL, TIME_ID_COL] + list(actual_cols))  # type: ignore
+    def _build_polars_dataframe(self, file_path: Path, is_details: bool) -> pl.DataFrame:
+        df = self._process_polars_df(file_path, is_details)
+        # The filtering may remove every column, the row count is kept to build the added columns.
+        height = df.height
+        df = df.select(self._filter_columns(df.columns, is_details))
 
-    def _build_dataframes(self, files: Sequence[Path]) -> Iterator[pd.DataFrame]:
+        column_name = AREA_COL if self.output_type == "areas" else LINK_COL
+        new_column_order = _columns_ordering(df.columns, column_name, is_details, self.mc_root)
+
+        if self.mc_root == MCRoot.MC_IND:
+            relative_path_parts = file_path.relative_to(self.mc_ind_path).parts
+            df = df.with_columns(
+                pl.repeat(relative_path_parts[AREA_OR_LINK_INDEX__IND], height).alias(column_name),
+                pl.repeat(int(relative_path_parts[MC_YEAR_INDEX]), height, dtype=pl.Int64).alias(MCYEAR_COL),
+            )
+        else:
+            relative_path_parts = file_path.relative_to(self.mc_all_path).parts
+            df = df.with_columns(pl.repeat(relative_path_parts[AREA_OR_LINK_INDEX__ALL], height).alias(column_name))
+
+        if not is_details:
+            df = df.with_columns(pl.int_range(1, height + 1, dtype=pl.Int64).alias(TIME_ID_COL))
+
+        return df.select(new_column_order)
+
+    def _is_details(self) -> bool:
         if self.mc_root not in [MCRoot.MC_IND, MCRoot.MC_ALL]:
             raise MCRootNotHandled(f"Unknown Monte Carlo root: {self.mc_root}")
-        is_details = self.query_file in [
+        return self.query_file in [
             MCIndAreasDataType.DETAILS,
             MCAllAreasDataType.DETAILS,
             MCIndAreasDataType.DETAILS_ST_STORAGE,
@@ -286,50 +348,26 @@ class AggregatorManager:
             MCAllAreasDataType.DETAILS_RES,
         ]
 
-        for k, file_path in enumerate(files):
-            df = self._process_df(file_path, is_details)
-
-            # columns filtering
-            df = self.columns_filtering(df, is_details)
-
-            column_name = AREA_COL if self.output_type == "areas" else LINK_COL
-            new_column_order = _columns_ordering(df.columns.tolist(), column_name, is_details, self.mc_root)
-
-            if self.mc_root == MCRoot.MC_IND:
-                # add column for links/areas
-                relative_path_parts = file_path.relative_to(self.mc_ind_path).parts
-                df[column_name] = relative_path_parts[AREA_OR_LINK_INDEX__IND]
-                # add column to record the Monte Carlo year
-                df[MCYEAR_COL] = int(relative_path_parts[MC_YEAR_INDEX])
-            else:
-                # add column for links/areas
-                relative_path_parts = file_path.relative_to(self.mc_all_path).parts
-                df[column_name] = relative_path_parts[AREA_OR_LINK_INDEX__ALL]
-
-            # add a column for the time id
-            if not is_details:
-                df[TIME_ID_COL] = range(1, len(df) + 1)
-
-            # Reorganize the columns
-            df = df.reindex(columns=pd.Index(new_column_order))
+    def _build_dataframes(self, files: Sequence[Path]) -> Iterator[pd.DataFrame]:
+        return self._map_files(self._build_dataframe, files, self._is_details())
 
-            yield df
+    def _map_files(
+        self, build: Callable[[Path, bool], _ResultT], files: Sequence[Path], is_details: bool
+    ) -> Iterator[_ResultT]:
+        # Files are parsed by a pool of workers but yielded in the files order.
+        return map_in_order(lambda file_path: build(file_path, is_details), files, self.max_workers)
 
     def _check_mc_root_folder_exists(self) -> None:
-        if self.mc_root == MCRoot.MC_IND:
-            if not self.mc_ind_path.exists():
-                raise OutputSubFolderNotFound(self.output_id, f"economy/{MCRoot.MC_IND.value}")
-        elif self.mc_root == MCRoot.MC_ALL:
-            if not self.mc_all_path.exists():
-                raise OutputSubFolderNotFound(self.output_id, f"economy/{MCRoot.MC_ALL.value}")
-        else:
+        if self.mc_root not in [MCRoot.MC_IND, MCRoot.MC_ALL]:
             raise MCRootNotHandled(f"Unknown Monte Carlo root: {self.mc_root}")
+        if not self.catalog.has_folder(f"economy/{self.mc_root.value}"):
+            raise OutputSubFolderNotFound(self.output_id, f"economy/{self.mc_root.value}")
 
-    def aggregate_output_data(self) -> Iterator[pd.DataFrame]:
-        """
-        Aggregates the output data of a study and returns it as a DataFrame
-        """
+    def list_output_files(self) -> List[Path]:
+        """Sorted paths of the output files matching the aggregation criteria, which may be empty."""
+        return sorted(self._gather_all_files_to_consider())
 
+    def _gather_sorted_files(self) -> List[Path]:
         output_folder = (self.mc_ind_path or self.mc_all_path).parent.parent
 
         # checks if the output folder exists
@@ -340,7 +378,7 @@ class AggregatorManager:
         self._check_mc_root_folder_exists()
 
         # filters files to consider
-        all_output_files = sorted(self._gather_all_files_to_consider())
+        all_output_files = self.list_output_files()
 
         if not all_output_files:
             raise OutputAggregationError(self.output_id, "No output files matching the criteria were found.")
@@ -349,8 +387,120 @@ class AggregatorManager:
             f"Parsing {len(all_output_files)} {self.frequency.value} files"
             f"to build the aggregated output {self.output_id}"
         )
+        return all_output_files
+
+    def _stored_locations(self, files: Sequence[Path]) -> Optional[list[StoredFile]]:
+        # Values files are read from the store at once, the details ones still need to be reshaped one at a time.
+        if self._store is None or self._is_details():
+            return None
+        locations = [locate_output_file(file_path.relative_to(self.output_path).as_posix()) for file_path in files]
+        if any(location is None or not self._store.has_dataset(location.dataset) for location in locations):
+            return None
+        return cast(list[StoredFile], locations)
+
+    def _read_stored_table(
+        self, store: OutputStore, dataset: str, mc_year: Optional[int], object_ids: list[str]
+    ) -> pl.DataFrame:
+        # Same columns as the tables of `_build_polars_dataframe` gathered, but read with a single scan
+        stored_columns: dict[str, list[str]] = {}
+        for object_id in object_ids:
+            layout = cast(list[str], store.layout(dataset, object_id))
+            names = self._normalized_column_names(store.output_headers(dataset, layout))
+            kept_names = set(self._filter_columns(names, False))
+            for stored_column, name in zip(layout, names):
+                if name in kept_names and stored_column not in stored_columns.setdefault(name, []):
+                    stored_columns[name].append(stored_column)
+
+        column_name = AREA_COL if self.output_type == "areas" else LINK_COL
+        key_columns = [pl.col(column_name), pl.col(TIME_ID_COL)]
+        if self.mc_root == MCRoot.MC_IND:
+            key_columns.insert(1, pl.lit(mc_year, dtype=pl.Int64).alias(MCYEAR_COL))
+        # Areas may have different units for the same column, each one being a distinct stored column
+        value_columns = [pl.coalesce(columns).alias(name) for name, columns in stored_columns.items()]
+        return store.scan(dataset, mc_year, object_ids).select(*key_columns, *value_columns).collect()
+
+    def _build_stored_tables(
+        self, store: OutputStore, files: Sequence[Path], locations: list[StoredFile]
+    ) -> Iterator[pl.DataFrame]:
+        # Files are sorted by year then area or link, as the rows of the store: each batch of files is one scan.
+        for (dataset, mc_year), group in itertools.groupby(
+            zip(files, locations), key=lambda item: (item[1].dataset, item[1].mc_year)
+        ):
+            year_files = list(group)
+            batch_size = store.batch_size(dataset)
+            for start in range(0, len(year_files), batch_size):
+                batch = year_files[start : start + batch_size]
+                object_ids = [location.object_id for _, location in batch]
+                if all(store.layout(dataset, object_id) is not None for object_id in object_ids):
+                    yield self._read_stored_table(store, dataset, mc_year, object_ids)
+                else:
+                    yield from self._map_files(
+                        self._build_polars_dataframe, [file_path for file_path, _ in batch], False
+                    )
+
+    def aggregate_output_data(self) -> Iterator[pd.DataFrame]:
+        """
+        Aggregates the output data of a study and returns it as a DataFrame
+        """
+        files = self._gather_sorted_files()
+        locations = self._stored_locations(files)
+        if self._store is not None and locations is not None:
+            # Both aggregations give the same values files dataframes
+            return (table.to_pandas() for table in self._build_stored_tables(self._store, files, locations))
         # builds final dataframe
-        return self._build_dataframes(all_output_files)
+        return self._build_dataframes(files)
+
+    def aggregate_output_table(self) -> pl.DataFrame:
+        """
+        Aggregates the output data of a study with polars only, without any pandas conversion.
+
+        The result has the same columns, in the same order, as the pandas aggregation.
+        """
+        # Files may not share the same columns: the missing ones are filled with nulls.
+        return pl.concat(list(self.aggregate_output_tables()), how="diagonal_relaxed", rechunk=False)
+
+    def aggregate_output_tables(self) -> Iterator[pl.DataFrame]:
+        """
+        Yields the polars dataframe of each output file, in the aggregation order, without concatenating them.
+
+        Values files of an output converted to parquet are read by batches instead, each dataframe then holding
+        several files of the same Monte Carlo year.
+        """
+        files = self._gather_sorted_files()
+        locations = self._stored_locations(files)
+        if self._store is not None and locations is not None:
+            return self._build_stored_tables(self._store, files, locations)
+        return self._map_files(self._build_polars_dataframe, files, self._is_details())
+
+    def build_cube(self, dtype: npt.DTypeLike, memmap_dir: Optional[Path] = None) -> OutputCube:
+        """
+        Gathers the requested columns of individual values files in one (year, time, area/link) array per column.
+
+        The files are parsed by the workers while the arrays are filled in the files order.
+        """
+        if self.mc_root != MCRoot.MC_IND or self._is_details():
+            raise OutputAggregationError(self.output_id, "Only individual values can be gathered in a cube.")
+        files = self._gather_sorted_files()
+        locations = [file_path.relative_to(self.mc_ind_path).parts for file_path in files]
+        mc_years = sorted({int(parts[MC_YEAR_INDEX]) for parts in locations})
+        ids = sorted({parts[AREA_OR_LINK_INDEX__IND] for parts in locations})
+        year_indexes = {mc_year: k for k, mc_year in enumerate(mc_years)}
+        id_indexes = {type_id: k for k, type_id in enumerate(ids)}
+        requested_variables = variables_by_column(self.columns_names)
+
+        values: dict[str, np.ndarray] = {}
+        for parts, output in zip(locations, self._map_files(self._parse_file, files, False)):
+            if not values:
+                shape = (len(mc_years), output.data.height, len(ids))
+                values = allocate_cube_values(self.columns_names, shape, dtype, memmap_dir)
+            data = output.data.to_numpy()
+            year_index = year_indexes[int(parts[MC_YEAR_INDEX])]
+            id_index = id_indexes[parts[AREA_OR_LINK_INDEX__IND]]
+            for k, name in enumerate(self._normalized_column_names(output.output_headers)):
+                variable = requested_variables.get(name.lower())
+                if variable is not None:
+                    values[variable][year_index, :, id_index] = data[:, k]
+        return OutputCube(mc_years=mc_years, ids=ids, values=values)
 
 
 def export_df_chunks(tmp_path: Path, df_chunks: Iterator[pd.DataFrame]) -> pd.DataFrame:
@@ -0,0 +1,321 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import hashlib
+import json
+import logging
+import os
+import threading
+import zipfile
+
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from antares.craft.service.local_services.services.output.utils import MCRoot
+
+CATALOG_VERSION = 5
+SIMULATION_END_FILE_NAME = "execution_info.ini"
+"""File written by the simulator at the end of a successful simulation."""
+
+logger = logging.getLogger(__name__)
+
+
+def output_cache_path(cache_dir: Path, output_path: Path, suffix: str) -> Path:
+    """Path of a file of the cache folder dedicated to the given output, e.g. its persisted catalog."""
+    key = hashlib.sha1(str(output_path.absolute()).encode("utf-8")).hexdigest()
+    return cache_dir / "outputs" / f"{key}{suffix}"
+
+
+def _is_archive(output_path: Path) -> bool:
+    return output_path.suffix == ".zip" and output_path.is_file()
+
+
+def _catalog_signature(output_path: Path) -> list[Optional[int]]:
+    if _is_archive(output_path):
+        stat = output_path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+    economy_path = output_path / "economy"
+    # A new Monte Carlo year, the synthesis folder or the end of the simulation change one of these.
+    # Files added to the existing folders of a running simulation are detected when they're looked up instead.
+    paths = [
+        economy_path,
+        economy_path / MCRoot.MC_IND.value,
+        economy_path / MCRoot.MC_ALL.value,
+        output_path / SIMULATION_END_FILE_NAME,
+    ]
+    signature: list[Optional[int]] = []
+    for path in paths:
+        try:
+            signature.append(path.stat().st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return signature
+
+
+def _scan_folder(folder: Path) -> dict[str, bool]:
+    """Names of the entries of the folder, mapped to whether they are folders. Empty if the folder does not exist."""
+    try:
+        with os.scandir(folder) as entries:
+            # The type of the entries is given by the listing itself, files are not `stat`-ed.
+            return {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _archive_prefix(names: list[str]) -> str:
+    # Some archives hold the output folder itself instead of its content
+    top_levels = {name.split("/", 1)[0] for name in names}
+    if len(top_levels) == 1 and all("/" in name for name in names):
+        return f"{top_levels.pop()}/"
+    return ""
+
+
+class OutputCatalog:
+    """Index of the files of a simulation output.
+
+    Files are indexed by their path relative to the output folder, e.g. `economy/mc-ind/00001/areas/fr/values-hourly.txt`.
+    Each folder is listed the first time it is looked into, so reading a few files of a large output only lists
+    the folders leading to them. Listings and existence checks are then served from memory instead of listing
+    folders again, which is slow on network file systems.
+
+    The output may also be a `.zip` archive: it is then indexed at once from its central directory
+    and files are read straight from the archive, without extracting it.
+
+    If a cache folder is given, the whole output is listed once and the catalog is persisted inside it,
+    so that the next sessions reuse it. Output folders are never modified.
+
+    Checking whether the catalog is up to date only looks at a few top-level folders. The folders of an output
+    without `execution_info.ini`, e.g. one still being written, may also receive new files: see `complete`
+    and `refresh`.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        listings: dict[str, dict[str, bool]],
+        signature: list[Optional[int]],
+        archive_prefix: str = "",
+        sizes: Optional[dict[str, int]] = None,
+    ) -> None:
+        self._output_path = output_path
+        # Names of the entries of the folders listed so far, mapped to whether they are folders
+        self._listings = listings
+        self._signature = signature
+        self._archive_prefix = archive_prefix
+        self._archived = _is_archive(output_path)
+        # Sizes of the files of an archive, given by its central directory
+        self._sizes = sizes or {}
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._lock = threading.Lock()
+
+    @property
+    def output_path(self) -> Path:
+        """Folder or archive of the indexed output."""
+        return self._output_path
+
+    @property
+    def signature(self) -> list[Optional[int]]:
+        """Modification times (and size of an archive) of the output when the catalog was built."""
+        return self._signature
+
+    @property
+    def archived(self) -> bool:
+        """Whether the output is a `.zip` archive."""
+        return self._archived
+
+    @property
+    def complete(self) -> bool:
+        """Whether the output is an ended simulation, whose folders no longer receive new files."""
+        return self.archived or self.has_file(SIMULATION_END_FILE_NAME)
+
+    @classmethod
+    def build(cls, output_path: Path) -> "OutputCatalog":
+        """Builds the catalog of the output.
+
+        The central directory of an archive is read at once, whereas the folders of an output folder
+        are only listed when they're looked into.
+        """
+        signature = _catalog_signature(output_path)
+        if not _is_archive(output_path):
+            return cls(output_path, {}, signature)
+
+        with zipfile.ZipFile(output_path) as archive:
+            infos = archive.infolist()
+        prefix = _archive_prefix([info.filename for info in infos])
+        listings: dict[str, dict[str, bool]] = {"": {}}
+        sizes: dict[str, int] = {}
+        for info in infos:
+            relative_path = info.filename.removeprefix(prefix).rstrip("/")
+            if not relative_path:
+                continue
+            is_folder = info.is_dir()
+            if not is_folder:
+                sizes[relative_path] = info.file_size
+            # Archives may not list the intermediate folders: every parent folder of an entry is registered.
+            while relative_path:
+                parent, _, name = relative_path.rpartition("/")
+                listing = listings.setdefault(parent, {})
+                registered = name in listing
+                listing[name] = is_folder
+                if registered:
+                    break
+                relative_path, is_folder = parent, True
+        return cls(output_path, listings, signature, prefix, sizes)
+
+    @staticmethod
+    def _catalog_path(output_path: Path, cache_dir: Optional[Path]) -> Optional[Path]:
+        if cache_dir is None:
+            return None
+        return output_cache_path(cache_dir, output_path, ".json")
+
+    @classmethod
+    def load(cls, output_path: Path, cache_dir: Optional[Path] = None) -> "OutputCatalog":
+        """Returns the persisted catalog of the output if it is up to date, builds and persists it otherwise.
+
+        Args:
+            output_path: Folder or archive of the output.
+            cache_dir: Folder where the catalogs are persisted. If not given, they are built each time they're loaded.
+        """
+        catalog_path = cls._catalog_path(output_path, cache_dir)
+        if catalog_path is None:
+            return cls.build(output_path)
+        try:
+            content: dict[str, Any] = json.loads(catalog_path.read_text())
+            if content["version"] == CATALOG_VERSION and content["signature"] == _catalog_signature(output_path):
+                return cls(output_path, content["listings"], content["signature"], content["prefix"], content["sizes"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        catalog = cls.build(output_path)
+        # Every folder is listed so that the persisted catalog spares the next sessions from listing them.
+        catalog.list_files("")
+        catalog._save(catalog_path)
+        return catalog
+
+    def _save(self, catalog_path: Path) -> None:
+        if not self._output_path.exists():
+            return
+        content = {
+            "version": CATALOG_VERSION,
+            "signature": self._signature,
+            "prefix": self._archive_prefix,
+            "listings": self._listings,
+            "sizes": self._sizes,
+        }
+        tmp_path = catalog_path.with_name(f"{catalog_path.name}.{os.getpid()}.tmp")
+        try:
+            catalog_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(content))
+            os.replace(tmp_path, catalog_path)
+        except OSError as e:
+            # The catalog still works in memory, it will just be built again next time.
+            logger.debug(f"Could not persist the catalog of the output {self._output_path}: {e}")
+
+    def is_up_to_date(self) -> bool:
+        """Whether the output did not change since the catalog was built."""
+        try:
+            return self._signature == _catalog_signature(self._output_path)
+        except OSError:
+            return False
+
+    def _listing(self, relative_path: str) -> dict[str, bool]:
+        listing = self._listings.get(relative_path)
+        if listing is None:
+            # Archives are fully indexed: a folder missing from their index does not exist.
+            listing = {} if self._archived else _scan_folder(self._output_path / relative_path)
+            self._listings[relative_path] = listing
+        return listing
+
+    def _is_folder(self, relative_path: str) -> Optional[bool]:
+        # Whether the entry is a folder or a file, `None` if it does not exist
+        parent, _, name = relative_path.rpartition("/")
+        return self._listing(parent).get(name)
+
+    def refresh(self, relative_paths: Iterable[str]) -> None:
+        """Lists again the folders of the given files, which may have been added since by a running simulation."""
+        if self._archived:
+            return
+        for relative_path in relative_paths:
+            folder = relative_path.rpartition("/")[0]
+            self._listings.pop(folder, None)
+            # A new folder is also missing from the listing of its parent, which is listed again as well
+            while folder:
+                folder, _, name = folder.rpartition("/")
+                listing = self._listings.get(folder)
+                if listing is None or name in listing:
+                    break
+                del self._listings[folder]
+
+    def has_folder(self, relative_path: str) -> bool:
+        """Whether the given folder, relative to the output folder, exists."""
+        return not relative_path or self._is_folder(relative_path) is True
+
+    def has_file(self, relative_path: str) -> bool:
+        """Whether the given file, relative to the output folder, exists."""
+        return self._is_folder(relative_path) is False
+
+    def file_size(self, relative_path: str) -> Optional[int]:
+        """Size of the given file, relative to the output folder, or `None` if it does not exist."""
+        if not self.has_file(relative_path):
+            return None
+        if self._archived:
+            return self._sizes.get(relative_path)
+        try:
+            return (self._output_path / relative_path).stat().st_size
+        except OSError:
+            return None
+
+    def list_folder(self, relative_path: str) -> list[str]:
+        """Names of the files and folders inside the given folder, relative to the output folder."""
+        return list(self._listing(relative_path))
+
+    def list_files(self, relative_path: str) -> list[str]:
+        """Paths of every file inside the given folder and its sub-folders, relative to the output folder."""
+        files: list[str] = []
+        self._append_files(relative_path, files)
+        return files
+
+    def _append_files(self, folder: str, files: list[str]) -> None:
+        for name, is_folder in self._listing(folder).items():
+            relative_path = f"{folder}/{name}" if folder else name
+            if is_folder:
+                self._append_files(relative_path, files)
+            else:
+                files.append(relative_path)
+
+    def mc_years(self) -> list[int]:
+        """Monte Carlo years having individual results."""
+        years = self.list_folder(f"economy/{MCRoot.MC_IND.value}")
+        return sorted(int(year) for year in years if year.isdigit())
+
+    def file_source(self, relative_path: str) -> Path | bytes:
+        """Source of the given file for the output parsers.
+
+        Returns:
+            The path of the file, or its content if the output is archived.
+        """
+        if not self.archived:
+            return self._output_path / relative_path
+        with self._lock:
+            # The archive is kept open, this way its central directory is only read once.
+            if self._archive is None:
+                self._archive = zipfile.ZipFile(self._output_path)
+            member = self._archive.open(f"{self._archive_prefix}{relative_path}")
+        # The archive serialises the raw reads of its members itself, so several members are decompressed at once.
+        with member:
+            return member.read()
+
+    def close(self) -> None:
+        """Closes the archive of the output if it was opened. It's opened again if a file is read afterwards."""
+        with self._lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
@@ -0,0 +1,577 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import itertools
+import json
+import logging
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Collection, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
+
+from antares.craft.model.output import Frequency, ParquetCompression
+from antares.craft.service.local_services.services.output.output_catalog import OutputCatalog, output_cache_path
+from antares.craft.service.local_services.services.output.utils import map_in_order
+from antares.craft.service.output_matrix_parsing import (
+    ColumnSelector,
+    HeaderCache,
+    MultipleOutputHeaders,
+    OutputDataFrame,
+    OutputHeaders,
+    get_start_column,
+    parse_output_file,
+)
+from antares.craft.service.parquet_dataset import PARQUET_CHUNK_ROWS
+from antares.craft.service.utils import parse_ts_numbers
+
+MANIFEST_FILE_NAME = "manifest.json"
+"""Name of the manifest of a store, written once the whole output is converted."""
+STORE_VERSION = 1
+STORE_POINTER_SUFFIX = ".parquet.json"
+"""Suffix of the file recording, inside the `outputs` folder of the cache folder, where an output was converted.
+The matrix cache leaves it in place when it is purged."""
+ROW_GROUP_ROWS = 8_000
+"""Minimal number of rows of a row group. Row groups hold whole files, so hourly files get their own ones:
+filtering an area or a link then skips the row groups of the others."""
+TS_NUMBERS_DATASET = "ts-numbers"
+"""Dataset of the time series numbers, with the `kind`, `object`, `mcYear` and `tsNumber` columns."""
+MC_YEAR_COL = "mcYear"
+TIME_ID_COL = "timeId"
+
+_ID_COLUMNS = {"areas": "area", "links": "link", "binding_constraints": None}
+_FREQUENCIES = {frequency.value: frequency for frequency in Frequency}
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """Location of an output file inside a store.
+
+    Attributes:
+        dataset: The dataset gathering the files of the same kind, e.g. `mc-ind/areas/values-hourly`.
+        mc_year: The Monte Carlo year of individual results, `None` for synthetic ones.
+        object_id: The area or link of the file, empty for binding constraints.
+        frequency: The time step of the file.
+    """
+
+    dataset: str
+    mc_year: Optional[int]
+    object_id: str
+    frequency: Frequency
+
+    @property
+    def id_column(self) -> Optional[str]:
+        return _ID_COLUMNS[self.dataset.split("/")[1]]
+
+
+def locate_output_file(relative_path: str) -> Optional[StoredFile]:
+    """Location in a store of the given file, relative to the output folder, or `None` if it's not converted.
+
+    For instance, `economy/mc-ind/00001/areas/fr/values-hourly.txt` is the area `fr` of the year 1
+    inside the `mc-ind/areas/values-hourly` dataset.
+    """
+    if not relative_path.endswith(".txt"):
+        return None
+    parts = relative_path.removesuffix(".txt").split("/")
+    if len(parts) < 4 or parts[0] != "economy":
+        return None
+
+    mc_year: Optional[int] = None
+    if parts[1] == "mc-ind" and parts[2].isdigit():
+        mc_year = int(parts[2])
+        object_type, *object_ids, file_name = parts[3:]
+    elif parts[1] == "mc-all":
+        object_type, *object_ids, file_name = parts[2:]
+    else:
+        return None
+
+    frequency = _FREQUENCIES.get(file_name.rpartition("-")[2])
+    if object_type not in _ID_COLUMNS or frequency is None:
+        return None
+    if len(object_ids) != (0 if _ID_COLUMNS[object_type] is None else 1):
+        return None
+    return StoredFile(f"{parts[1]}/{object_type}/{file_name}", mc_year, "".join(object_ids), frequency)
+
+
+def _stored_column_name(header: list[str]) -> str:
+    return "|".join(header)
+
+
+def _read_output_file(
+    catalog: OutputCatalog, header_cache: HeaderCache, relative_path: str, location: StoredFile
+) -> tuple[pl.DataFrame, MultipleOutputHeaders]:
+    output = parse_output_file(
+        catalog.file_source(relative_path), get_start_column(location.frequency), header_cache=header_cache
+    )
+    headers = output.output_headers.headers
+    data = output.data.rename(dict(zip(output.data.columns, map(_stored_column_name, headers))))
+    height = data.height
+    key_columns = [pl.int_range(1, height + 1, dtype=pl.Int64).alias(TIME_ID_COL)]
+    if location.id_column is not None:
+        key_columns.insert(0, pl.repeat(location.object_id, height, dtype=pl.String).alias(location.id_column))
+    return data.select(*key_columns, pl.all()), headers
+
+
+class _DatasetWriter:
+    """Writes the files of a dataset in parquet files, one folder per Monte Carlo year."""
+
+    def __init__(self, path: Path, compression: ParquetCompression) -> None:
+        self._path = path
+        self._compression = compression
+        self._pending: list[pl.DataFrame] = []
+        self._pending_rows = 0
+        self._mc_year: Optional[int] = None
+        self._part = 0
+
+    def write(self, mc_year: Optional[int], df: pl.DataFrame) -> None:
+        if self._pending and (mc_year != self._mc_year or self._pending_rows >= PARQUET_CHUNK_ROWS):
+            self.flush()
+        self._mc_year = mc_year
+        self._pending.append(df)
+        self._pending_rows += df.height
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        folder = self._path if self._mc_year is None else self._path / f"{MC_YEAR_COL}={self._mc_year}"
+        folder.mkdir(parents=True, exist_ok=True)
+        # Files may not share the same columns: the missing ones are nulls.
+        table = pl.concat(self._pending, how="diagonal_relaxed").to_arrow()
+        # Parts are numbered so that they're scanned in the files order
+        part_path = folder / f"part-{self._part:05d}.parquet"
+        with pq.ParquetWriter(part_path, table.schema, compression=self._compression) as writer:
+            # Row groups hold whole files, of at least `ROW_GROUP_ROWS` rows
+            start = end = 0
+            for df in self._pending:
+                end += df.height
+                if end - start >= ROW_GROUP_ROWS:
+                    writer.write_table(table.slice(start, end - start), row_group_size=end - start)
+                    start = end
+            if end > start:
+                writer.write_table(table.slice(start, end - start), row_group_size=end - start)
+        self._pending, self._pending_rows, self._part = [], 0, self._part + 1
+
+
+def _convert_output_files(
+    catalog: OutputCatalog, dest: Path, compression: ParquetCompression, max_workers: int
+) -> dict[str, dict[str, Any]]:
+    located_files = [
+        (location, relative_path)
+        for relative_path in catalog.list_files("economy")
+        if (location := locate_output_file(relative_path)) is not None
+    ]
+    located_files.sort(key=lambda item: (item[0].dataset, item[0].mc_year or 0, item[0].object_id))
+    header_cache = HeaderCache()
+
+    def read(item: tuple[StoredFile, str]) -> tuple[pl.DataFrame, MultipleOutputHeaders]:
+        location, relative_path = item
+        return _read_output_file(catalog, header_cache, relative_path, location)
+
+    datasets: dict[str, dict[str, Any]] = {}
+    parsed_files = zip(located_files, map_in_order(read, located_files, max_workers))
+    for dataset, dataset_files in itertools.groupby(parsed_files, key=lambda item: item[0][0].dataset):
+        writer = _DatasetWriter(dest / dataset, compression)
+        for (location, _), (df, headers) in dataset_files:
+            description = datasets.setdefault(
+                dataset,
+                {
+                    "frequency": location.frequency.value,
+                    "id_column": location.id_column,
+                    "partitioned": location.mc_year is not None,
+                    "files": 0,
+                    "rows": 0,
+                    "headers": {},
+                    "layouts": {},
+                },
+            )
+            columns = [_stored_column_name(header) for header in headers]
+            description["headers"].update(zip(columns, headers))
+            # The columns of each area or link, in the file order, to rebuild its files
+            layout: list[str] = description["layouts"].setdefault(location.object_id, [])
+            if layout != columns:
+                known_columns = set(layout)
+                layout.extend(column for column in columns if column not in known_columns)
+            description["files"] += 1
+            description["rows"] += df.height
+            writer.write(location.mc_year, df)
+        writer.flush()
+    return datasets
+
+
+def _convert_ts_numbers(
+    catalog: OutputCatalog, dest: Path, compression: ParquetCompression, max_workers: int
+) -> dict[str, list[str]]:
+    files = [file_path for file_path in catalog.list_files(TS_NUMBERS_DATASET) if file_path.endswith(".txt")]
+    if not files:
+        return {}
+
+    def parse(file_path: str) -> np.ndarray:
+        return parse_ts_numbers(catalog.file_source(file_path))
+
+    objects: dict[str, list[str]] = {}
+    kinds, object_ids = [], []
+    for file_path in files:
+        kind, _, object_id = file_path.removeprefix(f"{TS_NUMBERS_DATASET}/").removesuffix(".txt").partition("/")
+        objects.setdefault(kind, []).append(object_id)
+        kinds.append(kind)
+        object_ids.append(object_id)
+    ts_numbers = list(map_in_order(parse, files, max_workers))
+    lengths = [len(numbers) for numbers in ts_numbers]
+    df = pl.DataFrame(
+        {
+            "kind": pl.Series(kinds, dtype=pl.String).gather(np.repeat(np.arange(len(files)), lengths)),
+            "object": pl.Series(object_ids, dtype=pl.String).gather(np.repeat(np.arange(len(files)), lengths)),
+            MC_YEAR_COL: np.concatenate([np.arange(1, length + 1, dtype=np.int32) for length in lengths]),
+            "tsNumber": np.concatenate(ts_numbers).astype(np.int32),
+        }
+    )
+    (dest / TS_NUMBERS_DATASET).mkdir(parents=True)
+    pq.write_table(df.to_arrow(), dest / TS_NUMBERS_DATASET / "part-0.parquet", compression=compression)
+    return objects
+
+
+def convert_output(
+    catalog: OutputCatalog,
+    dest: Path,
+    compression: ParquetCompression = "zstd",
+    max_workers: int = 1,
+    cache_dir: Optional[Path] = None,
+) -> "OutputStore":
+    """Converts a whole output, given by its catalog, into an `OutputStore`.
+
+    Every individual and synthetic result of the areas, links and binding constraints is converted,
+    along with the time series numbers. The files are parsed by a pool of `max_workers` workers
+    and streamed to the datasets, so the whole output is never held in memory.
+
+    The manifest is written last: an interrupted conversion leaves no usable store.
+    The output is never modified: if a cache folder is given, a small file inside it records where
+    the output was converted, so that the store is found again by later sessions.
+
+    Args:
+        catalog: The catalog of the output to convert.
+        dest: Folder of the store, it should not exist or be empty.
+        compression: Compression codec of the parquet files, e.g. "zstd", "snappy" or "none".
+        max_workers: Number of files parsed concurrently.
+        cache_dir: Folder where the location of the store is recorded.
+
+    Raises:
+        FileExistsError: If the store folder is not empty.
+    """
+    if dest.exists() and any(dest.iterdir()):
+        raise FileExistsError(f"The folder {dest} already exists and is not empty")
+    dest.mkdir(parents=True, exist_ok=True)
+
+    manifest = {
+        "version": STORE_VERSION,
+        "output": catalog.output_path.name,
+        "output_path": str(catalog.output_path.absolute()),
+        "signature": catalog.signature,
+        "compression": compression,
+        "datasets": _convert_output_files(catalog, dest, compression, max_workers),
+        "ts_numbers": _convert_ts_numbers(catalog, dest, compression, max_workers),
+    }
+    (dest / MANIFEST_FILE_NAME).write_text(json.dumps(manifest))
+
+    if cache_dir is not None:
+        pointer_path = output_cache_path(cache_dir, catalog.output_path, STORE_POINTER_SUFFIX)
+        try:
+            pointer_path.parent.mkdir(parents=True, exist_ok=True)
+            pointer_path.write_text(json.dumps({"path": str(dest.absolute())}))
+        except OSError as e:
+            # The store is still used by the current session
+            logger.debug(f"Could not record the store of the output {catalog.output_path}: {e}")
+    return OutputStore(dest, manifest)
+
+
+class OutputStore:
+    """Simulation output converted to parquet datasets, see `convert_output`.
+
+    Each kind of file, e.g. the hourly values of the areas in individual results, is gathered in a dataset
+    `<mc-ind|mc-all>/<areas|links|binding_constraints>/<file name>`. Its rows are the rows of the files,
+    along with the `area` or `link` column and the `timeId` column. Individual results are partitioned by
+    Monte Carlo year (`mcYear=<year>` folders). The data columns are named after their three header lines
+    joined by `|`, e.g. `LOAD|MWh|`.
+
+    The manifest lists the datasets and the columns of each area or link, so that the files are rebuilt
+    exactly as parsed from the output. Reads only scan the requested years, row groups and columns.
+    """
+
+    def __init__(self, path: Path, manifest: dict[str, Any]) -> None:
+        self._path = path
+        self._manifest = manifest
+        self._datasets: dict[str, dict[str, Any]] = manifest["datasets"]
+        # Files of the same area or link share their headers, along with the objects built from them.
+        self._output_headers: dict[tuple[str, tuple[str, ...]], OutputHeaders] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["OutputStore"]:
+        """Returns the store of the given folder, or `None` if there's no complete store of a known version."""
+        try:
+            manifest: dict[str, Any] = json.loads((path / MANIFEST_FILE_NAME).read_text())
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != STORE_VERSION:
+            return None
+        return cls(path, manifest)
+
+    @classmethod
+    def find(cls, output_path: Path, cache_dir: Optional[Path]) -> Optional["OutputStore"]:
+        """Returns the store where the given output was converted, if recorded in the cache folder."""
+        if cache_dir is None:
+            return None
+        try:
+            pointer_path = output_cache_path(cache_dir, output_path, STORE_POINTER_SUFFIX)
+            pointer: dict[str, str] = json.loads(pointer_path.read_text())
+            store = cls.load(Path(pointer["path"]))
+        except (OSError, ValueError, KeyError):
+            return None
+        # The store may have been replaced by the conversion of another output since
+        if store is None or store._manifest.get("output_path") != str(output_path.absolute()):
+            return None
+        return store
+
+    @property
+    def path(self) -> Path:
+        """Folder of the store."""
+        return self._path
+
+    @property
+    def signature(self) -> list[Optional[int]]:
+        """Signature of the output catalog when it was converted, the store is outdated if it changed since."""
+        signature: list[Optional[int]] = self._manifest["signature"]
+        return signature
+
+    def has_dataset(self, dataset: str) -> bool:
+        return dataset in self._datasets
+
+    def object_ids(self, dataset: str) -> list[str]:
+        """Areas or links of the dataset, sorted as their rows."""
+        return sorted(self._datasets[dataset]["layouts"])
+
+    def layout(self, dataset: str, object_id: str) -> Optional[list[str]]:
+        """Columns of the files of the area or link, in the file order, or `None` if it's not in the dataset."""
+        layout: Optional[list[str]] = self._datasets[dataset]["layouts"].get(object_id)
+        return layout
+
+    def batch_size(self, dataset: str) -> int:
+        """Number of files of the dataset read at once, so that about `PARQUET_CHUNK_ROWS` rows are held in memory."""
+        description = self._datasets[dataset]
+        file_rows = int(description["rows"]) // max(int(description["files"]), 1)
+        return max(PARQUET_CHUNK_ROWS // max(file_rows, 1), 1)
+
+    def output_headers(self, dataset: str, columns: list[str]) -> OutputHeaders:
+        """Headers of the given columns of the dataset, shared by every file having these columns."""
+        key = (dataset, tuple(columns))
+        with self._lock:
+            output_headers = self._output_headers.get(key)
+            if output_headers is None:
+                headers = self._datasets[dataset]["headers"]
+                output_headers = self._output_headers[key] = OutputHeaders([headers[column] for column in columns])
+        return output_headers
+
+    def scan(
+        self, dataset: str, mc_year: Optional[int] = None, object_ids: Optional[Collection[str]] = None
+    ) -> pl.LazyFrame:
+        """Lazily scans the dataset, filtered on the given Monte Carlo year and areas or links.
+
+        The filters are pushed down to the scan: only the folder of the year is read,
+        and the row groups not holding the areas or links are skipped.
+        """
+        description = self._datasets[dataset]
+        id_column: Optional[str] = description["id_column"]
+        schema: dict[str, pl.DataType] = {}
+        if id_column is not None:
+            schema[id_column] = pl.String()
+        schema[TIME_ID_COL] = pl.Int64()
+        schema.update((column, pl.Float64()) for column in description["headers"])
+        partitioned = bool(description["partitioned"])
+        lf = pl.scan_parquet(
+            self._path / dataset,
+            hive_partitioning=partitioned,
+            hive_schema={MC_YEAR_COL: pl.Int64} if partitioned else None,
+            schema=pl.Schema(schema),
+            missing_columns="insert",
+        )
+        if mc_year is not None:
+            lf = lf.filter(pl.col(MC_YEAR_COL) == mc_year)
+        if id_column is not None and object_ids is not None:
+            lf = lf.filter(pl.col(id_column).is_in(list(object_ids)))
+        return lf
+
+    def _select(
+        self, dataset: str, layout: list[str], select_columns: Optional[ColumnSelector]
+    ) -> tuple[list[str], OutputHeaders]:
+        output_headers = self.output_headers(dataset, layout)
+        if not select_columns:
+            return layout, output_headers
+
+        def build(headers: MultipleOutputHeaders) -> tuple[list[str], OutputHeaders]:
+            # As when parsing a file, every column is kept if none is selected.
+            selected = sorted(select_columns(headers))
+            if not selected:
+                return layout, output_headers
+            columns = [layout[k] for k in selected]
+            return columns, self.output_headers(dataset, columns)
+
+        key: Hashable = ("stored_columns", select_columns)
+        return output_headers.get_or_build(key, build)
+
+    def read_outputs(
+        self,
+        dataset: str,
+        mc_year: Optional[int],
+        object_ids: Optional[Collection[str]] = None,
+        select_columns: Optional[ColumnSelector] = None,
+    ) -> dict[str, OutputDataFrame]:
+        """Reads the files of a dataset for a Monte Carlo year, as parsed by `parse_output_file`.
+
+        Args:
+            dataset: The dataset, e.g. `mc-ind/areas/values-hourly`.
+            mc_year: The Monte Carlo year of individual results, `None` for synthetic ones.
+            object_ids: The areas or links to read, all of them if not given.
+            select_columns: Selects the columns to read from the headers of each file, as in `parse_output_file`.
+
+        Returns:
+            The files of each area or link (an empty ID for binding constraints).
+        """
+        layouts: dict[str, list[str]] = self._datasets[dataset]["layouts"]
+        if object_ids is not None:
+            layouts = {object_id: layouts[object_id] for object_id in object_ids if object_id in layouts}
+        selections = {object_id: self._select(dataset, layout, select_columns) for object_id, layout in layouts.items()}
+        if not selections:
+            return {}
+
+        id_column: Optional[str] = self._datasets[dataset]["id_column"]
+        columns = list(dict.fromkeys(column for selected, _ in selections.values() for column in selected))
+        lf = self.scan(dataset, mc_year, list(selections) if object_ids is not None else None)
+        df = lf.select(([id_column] if id_column is not None else []) + columns).collect()
+
+        if id_column is None:
+            groups = {"": df}
+        else:
+            groups = {
+                str(key[0]): group
+                for key, group in df.partition_by(id_column, as_dict=True, maintain_order=True).items()
+            }
+        return {
+            object_id: OutputDataFrame(
+                data=groups[object_id].select(selected), headers=output_headers.headers, output_headers=output_headers
+            )
+            for object_id, (selected, output_headers) in selections.items()
+            if object_id in groups
+        }
+
+    def read_matrix(self, relative_path: str) -> Optional[pd.DataFrame]:
+        """Reads a file, relative to the output folder, as `read_output_matrix` does, or `None` if it's not stored."""
+        location = locate_output_file(relative_path)
+        if location is None or not self.has_dataset(location.dataset):
+            return None
+        output = self.read_outputs(location.dataset, location.mc_year, [location.object_id]).get(location.object_id)
+        if output is None:
+            return None
+        df = output.data.to_pandas()
+        df.columns = output.output_headers.multi_index().copy()
+        return df
+
+    def read_ts_numbers(self, kind: str, object_id: Optional[str] = None) -> Optional[dict[str, np.ndarray]]:
+        """Time series numbers of every object of the given kind (or only the given one), `None` if not stored.
+
+        Returns:
+            The time series numbers of each object, one per Monte Carlo year.
+        """
+        object_ids: Optional[list[str]] = self._manifest["ts_numbers"].get(kind)
+        if object_ids is None or (object_id is not None and object_id not in object_ids):
+            return None
+        if object_id is not None:
+            object_ids = [object_id]
+
+        lf = pl.scan_parquet(self._path / TS_NUMBERS_DATASET).filter(pl.col("kind") == kind)
+        if object_id is not None:
+            lf = lf.filter(pl.col("object") == object_id)
+        df = lf.select("object", "tsNumber").collect()
+        groups = {str(key[0]): group for key, group in df.partition_by("object", as_dict=True).items()}
+        empty = np.empty(0, dtype=np.int32)
+        return {
+            object_id: groups[object_id]["tsNumber"].to_numpy() if object_id in groups else empty
+            for object_id in object_ids
+        }
+
+
+class StoredOutputs:
+    """Files of an aggregation read from a store, by batches of files of the same dataset and Monte Carlo year.
+
+    The aggregations go through the files year after year: a batch of areas or links of a year is read at once,
+    with only the requested columns, then its files are handed one at a time to the aggregation.
+    """
+
+    def __init__(self, store: OutputStore, object_ids: Optional[Collection[str]] = None, max_workers: int = 1) -> None:
+        self._store = store
+        self._object_ids = set(object_ids) if object_ids is not None else None
+        # The workers parse up to two files each ahead of the aggregation, which may all belong to different reads.
+        self._kept_reads = 2 * max(max_workers, 1)
+        self._batches: dict[str, dict[str, list[str]]] = {}
+        self._reads: OrderedDict[Hashable, Future[dict[str, OutputDataFrame]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_batch(self, dataset: str, object_id: str) -> Optional[list[str]]:
+        batches = self._batches.get(dataset)
+        if batches is None:
+            object_ids = self._store.object_ids(dataset)
+            if self._object_ids is not None:
+                object_ids = [object_id for object_id in object_ids if object_id in self._object_ids]
+            batch_size = self._store.batch_size(dataset)
+            batches = self._batches[dataset] = {}
+            for start in range(0, len(object_ids), batch_size):
+                batch = object_ids[start : start + batch_size]
+                batches.update(dict.fromkeys(batch, batch))
+        return batches.get(object_id)
+
+    def get(self, relative_path: str, select_columns: Optional[ColumnSelector]) -> Optional[OutputDataFrame]:
+        """The file, relative to the output folder, as parsed by `parse_output_file`, or `None` if not stored."""
+        location = locate_output_file(relative_path)
+        if location is None or not self._store.has_dataset(location.dataset):
+            return None
+        # The lock only guards the bookkeeping: the workers read different batches concurrently,
+        # and the ones needing a batch being read wait for it instead of reading it again.
+        with self._lock:
+            batch = self._get_batch(location.dataset, location.object_id)
+            if batch is None:
+                return None
+            key = (location.dataset, location.mc_year, batch[0], select_columns)
+            pending_read = self._reads.get(key)
+            is_reader = pending_read is None
+            if pending_read is None:
+                pending_read = self._reads[key] = Future()
+                while len(self._reads) > self._kept_reads:
+                    self._reads.popitem(last=False)
+
+        if is_reader:
+            try:
+                pending_read.set_result(
+                    self._store.read_outputs(location.dataset, location.mc_year, batch, select_columns)
+                )
+            except Exception as e:
+                pending_read.set_exception(e)
+                with self._lock:
+                    if self._reads.get(key) is pending_read:
+                        del self._reads[key]
+                raise
+        return pending_read.result().get(location.object_id)
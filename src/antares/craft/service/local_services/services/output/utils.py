@@ -9,7 +9,13 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
+from typing import Callable, Iterable, Iterator, TypeVar
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
 
 
 class MCRoot(Enum):
@@ -21,3 +27,31 @@ def normalize_df_column_names(mc_root: MCRoot, output_headers: list[list[str]])
     if mc_root == MCRoot.MC_IND:
         return [col[0] for col in output_headers]
     return [" ".join([col[0], col[2]]).upper().strip() for col in output_headers]
+
+
+def map_in_order(
+    function: Callable[[_ItemT], _ResultT], items: Iterable[_ItemT], max_workers: int
+) -> Iterator[_ResultT]:
+    """Applies the function to the items with a pool of workers, yielding the results in the items order.
+
+    Only a few items are processed ahead of the consumer, so the memory stays bounded
+    while the results are streamed, e.g. to a parquet writer.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield function(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[_ResultT]] = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The consumer may stop early or an item may fail: there's no need to process the next ones.
+            for future in pending:
+                future.cancel()
@@ -12,7 +12,7 @@
 import copy
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Sequence
 
 import pandas as pd
 
@@ -31,7 +31,7 @@ from antares.craft.service.local_services.models.renewable import (
     serialize_renewable_cluster_local,
 )
 from antares.craft.service.local_services.services.utils import checks_matrix_dimensions
-from antares.craft.tools.matrix_tool import read_timeseries, write_timeseries
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, read_timeseries, write_timeseries
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
@@ -55,9 +55,22 @@ class RenewableLocalService(BaseRenewableService):
         IniWriter().write(content, self._get_ini_path(area_id))
 
     @override
-    def get_renewable_matrix(self, cluster_id: str, area_id: str) -> pd.DataFrame:
+    def get_renewable_matrix(
+        self,
+        cluster_id: str,
+        area_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         return read_timeseries(
-            TimeSeriesFileType.RENEWABLE_SERIES, self.config.study_path, area_id=area_id, cluster_id=cluster_id
+            TimeSeriesFileType.RENEWABLE_SERIES,
+            self.config.study_path,
+            area_id=area_id,
+            cluster_id=cluster_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
         )
 
     @override
@@ -69,6 +82,9 @@ class RenewableLocalService(BaseRenewableService):
             TimeSeriesFileType.RENEWABLE_SERIES,
             renewable_cluster.area_id,
             renewable_cluster.id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
         )
 
     @override
@@ -11,10 +11,11 @@
 # This file is part of the Antares project.
 import shutil
 import subprocess
+import time
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import psutil
 
@@ -32,6 +33,9 @@ from antares.craft.model.simulation import (
 from antares.craft.service.base_services import BaseRunService
 from antares.study.version import SolverVersion
 
+POLL_INTERVAL = 10
+"""Seconds between two checks of a running simulation, when the job is polled."""
+
 
 def _get_solver_version(solver_path: Path) -> SolverVersion:
     args = [str(solver_path), "-v"]
@@ -92,12 +96,16 @@ class RunLocalService(BaseRunService):
         return Job(job_id=str(process.pid), status=JobStatus.RUNNING, parameters=parameters, output_id=None)
 
     @override
-    def wait_job_completion(self, job: Job, time_out: int) -> None:
+    def wait_job_completion(self, job: Job, time_out: int, on_poll: Optional[Callable[[Job], object]] = None) -> None:
         pid = int(job.job_id)
         try:
             process = psutil.Process(pid)
 
-            return_code = process.wait(timeout=time_out)
+            return_code = (
+                process.wait(timeout=time_out)
+                if on_poll is None
+                else self._poll_process(process, job, time_out, on_poll)
+            )
             if return_code == 0:
                 self._handle_success(job)
             else:
@@ -108,6 +116,28 @@ class RunLocalService(BaseRunService):
         except psutil.TimeoutExpired:
             raise SimulationTimeOutError(job.job_id, time_out)
 
+    def _poll_process(self, process: psutil.Process, job: Job, time_out: int, on_poll: Callable[[Job], object]) -> int:
+        deadline = time.monotonic() + time_out
+        while True:
+            try:
+                return_code: int = process.wait(timeout=max(0.0, min(POLL_INTERVAL, deadline - time.monotonic())))
+                return return_code
+            except psutil.TimeoutExpired:
+                if time.monotonic() >= deadline:
+                    raise
+            if job.output_id is None and job.parameters.unzip_output:
+                job.output_id = self._find_running_output()
+            on_poll(job)
+
+    def _find_running_output(self) -> Optional[str]:
+        # The simulator writes `execution_info.ini` at the end: a more recent output without it is being written.
+        if not (self.config.study_path / "output").is_dir():
+            return None
+        output_id = self._find_most_recent_output(True)
+        if not output_id or (self.config.study_path / "output" / output_id / "execution_info.ini").exists():
+            return None
+        return output_id
+
     def _handle_simulation_ending(self, job: Job) -> None:
         output_id = self._find_most_recent_output(job.parameters.unzip_output)
         if output_id.endswith(".zip"):
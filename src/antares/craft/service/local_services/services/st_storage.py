@@ -12,7 +12,7 @@
 import copy
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Sequence
 
 import pandas as pd
 
@@ -45,7 +45,7 @@ from antares.craft.service.local_services.services.utils import (
     checks_matrix_dimensions,
     remove_object_from_scenario_builder,
 )
-from antares.craft.tools.matrix_tool import read_timeseries, write_timeseries
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, read_timeseries, write_timeseries
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
@@ -117,12 +117,36 @@ class ShortTermStorageLocalService(BaseShortTermStorageService):
     def set_storage_matrix(self, storage: STStorage, ts_name: STStorageMatrixName, matrix: pd.DataFrame) -> None:
         self._check_matrix_allowed(ts_name)
         checks_matrix_dimensions(matrix, f"storage/{storage.area_id}/{storage.name}", ts_name.value)
-        write_timeseries(self.config.study_path, matrix, MAPPING[ts_name], storage.area_id, storage.id)
+        write_timeseries(
+            self.config.study_path,
+            matrix,
+            MAPPING[ts_name],
+            storage.area_id,
+            storage.id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
-    def get_storage_matrix(self, storage: STStorage, ts_name: STStorageMatrixName) -> pd.DataFrame:
+    def get_storage_matrix(
+        self,
+        storage: STStorage,
+        ts_name: STStorageMatrixName,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         self._check_matrix_allowed(ts_name)
-        return read_timeseries(MAPPING[ts_name], self.config.study_path, area_id=storage.area_id, cluster_id=storage.id)
+        return read_timeseries(
+            MAPPING[ts_name],
+            self.config.study_path,
+            area_id=storage.area_id,
+            cluster_id=storage.id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
+        )
 
     @override
     def update_st_storages_properties(
@@ -281,13 +305,28 @@ class ShortTermStorageLocalService(BaseShortTermStorageService):
         remove_object_from_scenario_builder(self.config.study_path, clean_constraints)
 
     @override
-    def get_constraint_term(self, area_id: str, storage_id: str, constraint_id: str) -> pd.DataFrame:
+    def get_constraint_term(
+        self,
+        area_id: str,
+        storage_id: str,
+        constraint_id: str,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         if self.study_version < STUDY_VERSION_9_2:
             raise ValueError(CONSTRAINTS_ERROR_MSG)
 
         ts = TimeSeriesFileType.ST_STORAGE_CONSTRAINT_TERM
         return read_timeseries(
-            ts, self.config.study_path, area_id=area_id, constraint_id=constraint_id, cluster_id=storage_id
+            ts,
+            self.config.study_path,
+            area_id=area_id,
+            constraint_id=constraint_id,
+            cluster_id=storage_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
         )
 
     @override
@@ -296,7 +335,17 @@ class ShortTermStorageLocalService(BaseShortTermStorageService):
             raise ValueError(CONSTRAINTS_ERROR_MSG)
 
         ts = TimeSeriesFileType.ST_STORAGE_CONSTRAINT_TERM
-        write_timeseries(self.config.study_path, matrix, ts, area_id, storage_id, constraint_id=constraint_id)
+        write_timeseries(
+            self.config.study_path,
+            matrix,
+            ts,
+            area_id,
+            storage_id,
+            constraint_id=constraint_id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def update_st_storages_constraints(
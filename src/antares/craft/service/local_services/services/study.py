@@ -10,11 +10,12 @@
 #
 # This file is part of the Antares project.
 import copy
+import os
 import shutil
 import tempfile
 
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -36,6 +37,8 @@ from antares.craft.service.local_services.services.utils import (
     _read_scenario_builder,
     remove_object_from_scenario_builder,
 )
+from antares.craft.tools.matrix_store import MatrixStore
+from antares.craft.tools.matrix_tool import MatrixFormat, TimeSeriesRequest, read_timeseries_many
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 from antares.study.version import StudyVersion
@@ -53,7 +56,16 @@ def _replace_safely_original_files(study_path: Path, tmp_path: Path) -> None:
     tmp_path.rename(original_path)
 
 
-def _build_timeseries(number_of_years: int, areas_dict: dict[str, Area], seed: int, tmp_path: Path) -> None:
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _build_timeseries(
+    number_of_years: int, areas_dict: dict[str, Area], seed: int, tmp_path: Path, store: Optional[MatrixStore] = None
+) -> None:
     # 1- Get the seed and nb_years to generate
     # 2 - Build the generator
     rng = MersenneTwisterRNG(seed=seed)
@@ -106,7 +118,11 @@ def _build_timeseries(number_of_years: int, areas_dict: dict[str, Area], seed: i
                 df = pd.DataFrame(data=generated_matrix)
                 df = df[list(df.columns)].astype(int)
                 target_path = tmp_path / area_id / thermal.id / "series.txt"
-                df.to_csv(target_path, sep="\t", header=False, index=False, float_format="%.6f")
+                if store:
+                    content = df.to_csv(sep="\t", header=False, index=False, float_format="%.6f")
+                    store.write(target_path, content.encode("utf-8"))
+                else:
+                    df.to_csv(target_path, sep="\t", header=False, index=False, float_format="%.6f")
             except Exception as e:
                 e.args = tuple([f"Area {area_id}, cluster {thermal.id}: {e.args[0]}"])
                 raise
@@ -210,8 +226,13 @@ class StudyLocalService(BaseStudyService):
         study_path = self._config.study_path
         with tempfile.TemporaryDirectory(suffix=".thermal_ts_gen.tmp", prefix="~", dir=study_path.parent) as path:
             tmp_dir = Path(path)
-            shutil.copytree(study_path / "input" / "thermal" / "series", tmp_dir, dirs_exist_ok=True)
-            _build_timeseries(number_of_years, areas, seed, tmp_dir)
+            store = self._config.matrix_store
+            # With a store, every written matrix replaces its file instead of modifying it: links are enough.
+            copy_function = _link_or_copy if store else shutil.copy2
+            shutil.copytree(
+                study_path / "input" / "thermal" / "series", tmp_dir, copy_function=copy_function, dirs_exist_ok=True
+            )
+            _build_timeseries(number_of_years, areas, seed, tmp_dir, store)
             _replace_safely_original_files(study_path, tmp_dir)
 
     @override
@@ -225,3 +246,16 @@ class StudyLocalService(BaseStudyService):
         scenario_builder_path = self._config.study_path / "settings" / "scenariobuilder.dat"
         sc_builder_local = ScenarioBuilderLocal.from_user_model(scenario_builder)
         IniWriter().write(sc_builder_local.to_ini(), scenario_builder_path)
+
+    @override
+    def read_timeseries_many(
+        self, requests: Sequence[TimeSeriesRequest], max_workers: Optional[int], output_format: MatrixFormat
+    ) -> dict[TimeSeriesRequest, Any]:
+        return read_timeseries_many(
+            requests,
+            self._config.study_path,
+            cache=self._config.matrix_cache,
+            memory_cache=self._config.matrix_memory_cache,
+            max_workers=max_workers,
+            output_format=output_format,
+        )
@@ -12,7 +12,7 @@
 import copy
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Sequence
 
 import pandas as pd
 
@@ -31,7 +31,7 @@ from antares.craft.service.local_services.models.thermal import (
     serialize_thermal_cluster_local,
 )
 from antares.craft.service.local_services.services.utils import checks_matrix_dimensions
-from antares.craft.tools.matrix_tool import read_timeseries, write_timeseries
+from antares.craft.tools.matrix_tool import Matrix, MatrixFormat, read_timeseries, write_timeseries
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
@@ -64,12 +64,22 @@ class ThermalLocalService(BaseThermalService):
         IniWriter().write(content, self._get_ini_path(area_id))
 
     @override
-    def get_thermal_matrix(self, thermal_cluster: ThermalCluster, ts_name: ThermalClusterMatrixName) -> pd.DataFrame:
+    def get_thermal_matrix(
+        self,
+        thermal_cluster: ThermalCluster,
+        ts_name: ThermalClusterMatrixName,
+        columns: Optional[Sequence[int]] = None,
+        output_format: MatrixFormat = MatrixFormat.PANDAS,
+    ) -> Matrix:
         return read_timeseries(
             MAPPING[ts_name],
             self.config.study_path,
             area_id=thermal_cluster.area_id,
             cluster_id=thermal_cluster.id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            columns=columns,
+            output_format=output_format,
         )
 
     @override
@@ -77,7 +87,16 @@ class ThermalLocalService(BaseThermalService):
         self, thermal_cluster: ThermalCluster, matrix: pd.DataFrame, ts_name: ThermalClusterMatrixName
     ) -> None:
         checks_matrix_dimensions(matrix, f"thermal/{thermal_cluster.area_id}/{thermal_cluster.id}", ts_name.value)
-        write_timeseries(self.config.study_path, matrix, MAPPING[ts_name], thermal_cluster.area_id, thermal_cluster.id)
+        write_timeseries(
+            self.config.study_path,
+            matrix,
+            MAPPING[ts_name],
+            thermal_cluster.area_id,
+            thermal_cluster.id,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def update_thermal_clusters_properties(
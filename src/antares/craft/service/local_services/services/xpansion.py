@@ -105,7 +105,13 @@ class XpansionLocalService(BaseXpansionService):
     @override
     def get_matrix(self, file_name: str, file_type: XpansionMatrix) -> pd.DataFrame:
         try:
-            return read_timeseries(FILE_MAPPING[file_type][1], self.config.study_path, file_name=file_name)
+            return read_timeseries(
+                FILE_MAPPING[file_type][1],
+                self.config.study_path,
+                file_name=file_name,
+                cache=self.config.matrix_cache,
+                memory_cache=self.config.matrix_memory_cache,
+            )
         except FileNotFoundError:
             raise XpansionMatrixReadingError(self._study_name, file_name, "The file does not exist")
 
@@ -116,7 +122,15 @@ class XpansionLocalService(BaseXpansionService):
 
     @override
     def set_matrix(self, file_name: str, series: pd.DataFrame, file_type: XpansionMatrix) -> None:
-        write_timeseries(self.config.study_path, series, FILE_MAPPING[file_type][1], file_name=file_name)
+        write_timeseries(
+            self.config.study_path,
+            series,
+            FILE_MAPPING[file_type][1],
+            file_name=file_name,
+            cache=self.config.matrix_cache,
+            memory_cache=self.config.matrix_memory_cache,
+            store=self.config.matrix_store,
+        )
 
     @override
     def create_candidate(self, candidate: XpansionCandidate) -> XpansionCandidate:
@@ -0,0 +1,235 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import itertools
+import warnings
+
+from typing import Iterable, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+import polars as pl
+
+from antares.craft.model.output import MCStatistic
+
+MC_YEAR_COLUMN = "mcYear"
+KEY_COLUMNS = ("area", "link", "cluster", "timeId")
+"""Columns of the aggregated results identifying a row inside a Monte Carlo year."""
+
+_STATISTIC_SUFFIXES = {MCStatistic.MEAN: "EXP", MCStatistic.STD: "STD", MCStatistic.MIN: "MIN", MCStatistic.MAX: "MAX"}
+_P2_MARKERS = 5
+
+
+def quantile_suffix(quantile: float) -> str:
+    """Suffix of the columns holding the given quantile, e.g. `Q50` for the median."""
+    return f"Q{quantile * 100:g}"
+
+
+class _WeightedMoments:
+    """Weighted mean and variance updated one observation at a time (Welford / West algorithm)."""
+
+    def __init__(self, size: int) -> None:
+        self._weight_sum = np.zeros(size)
+        self._mean = np.zeros(size)
+        self._m2 = np.zeros(size)
+
+    def update(self, values: np.ndarray, valid: np.ndarray, weight: float) -> None:
+        weights = np.where(valid, weight, 0.0)
+        self._weight_sum += weights
+        delta = np.where(valid, values - self._mean, 0.0)
+        ratio = np.divide(weights, self._weight_sum, out=np.zeros_like(weights), where=self._weight_sum > 0)
+        self._mean += ratio * delta
+        self._m2 += weights * delta * np.where(valid, values - self._mean, 0.0)
+
+    def mean(self) -> np.ndarray:
+        return np.where(self._weight_sum > 0, self._mean, np.nan)
+
+    def std(self) -> np.ndarray:
+        variance = np.divide(self._m2, self._weight_sum, out=np.full_like(self._m2, np.nan), where=self._weight_sum > 0)
+        std: np.ndarray = np.sqrt(np.maximum(variance, 0.0))
+        return std
+
+
+class _P2Quantile:
+    """Quantile estimated one observation at a time with the P² algorithm (Jain & Chlamtac, 1985).
+
+    Five markers are kept per value, whatever the number of observations. The first five observations
+    are kept as they are, so the quantile is exact until then.
+    """
+
+    def __init__(self, size: int, quantile: float) -> None:
+        self._quantile = quantile
+        self._count = np.zeros(size, dtype=np.int64)
+        # The first observations, then the marker heights once there are enough of them
+        self._heights = np.full((size, _P2_MARKERS), np.nan)
+        self._positions = np.tile(np.arange(1.0, _P2_MARKERS + 1), (size, 1))
+        self._increments = np.array([0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0])
+
+    def update(self, values: np.ndarray, valid: np.ndarray) -> None:
+        filling = np.flatnonzero(valid & (self._count < _P2_MARKERS))
+        self._heights[filling, self._count[filling]] = values[filling]
+        stepping = np.flatnonzero(valid & (self._count >= _P2_MARKERS))
+        self._count[valid] += 1
+        ready = filling[self._count[filling] == _P2_MARKERS]
+        self._heights[ready] = np.sort(self._heights[ready], axis=1)
+        if stepping.size:
+            self._step(stepping, values[stepping])
+
+    def _step(self, indexes: np.ndarray, values: np.ndarray) -> None:
+        q = self._heights[indexes]
+        n = self._positions[indexes]
+        q[:, 0] = np.minimum(q[:, 0], values)
+        q[:, -1] = np.maximum(q[:, -1], values)
+        # Every marker above the cell containing the new value moves up
+        cells = np.sum(values[:, None] >= q[:, 1:-1], axis=1)
+        n += np.arange(_P2_MARKERS) > cells[:, None]
+        desired = 1 + (self._count[indexes, None] - 1) * self._increments
+
+        rows = np.arange(len(indexes))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i in range(1, _P2_MARKERS - 1):
+                d = desired[:, i] - n[:, i]
+                up = (d >= 1) & (n[:, i + 1] - n[:, i] > 1)
+                down = (d <= -1) & (n[:, i - 1] - n[:, i] < -1)
+                sign = np.where(up, 1.0, -1.0)
+                parabolic = q[:, i] + sign / (n[:, i + 1] - n[:, i - 1]) * (
+                    (n[:, i] - n[:, i - 1] + sign) * (q[:, i + 1] - q[:, i]) / (n[:, i + 1] - n[:, i])
+                    + (n[:, i + 1] - n[:, i] - sign) * (q[:, i] - q[:, i - 1]) / (n[:, i] - n[:, i - 1])
+                )
+                neighbour = i + sign.astype(np.int64)
+                linear = q[:, i] + sign * (q[rows, neighbour] - q[:, i]) / (n[rows, neighbour] - n[:, i])
+                estimate = np.where((q[:, i - 1] < parabolic) & (parabolic < q[:, i + 1]), parabolic, linear)
+                move = up | down
+                q[:, i] = np.where(move, estimate, q[:, i])
+                n[:, i] += np.where(move, sign, 0.0)
+
+        self._heights[indexes] = q
+        self._positions[indexes] = n
+
+    def result(self) -> np.ndarray:
+        with warnings.catch_warnings():
+            # Values without any observation are NaN
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            exact = np.nanquantile(self._heights, self._quantile, axis=1)
+        return np.where(self._count > _P2_MARKERS, self._heights[:, _P2_MARKERS // 2], exact)
+
+
+class _YearsAccumulator:
+    """Every statistic of the values of a year, updated one year at a time."""
+
+    def __init__(self, keys: pl.DataFrame, value_columns: list[str], quantiles: Sequence[float]) -> None:
+        self.keys = keys
+        self.value_columns = value_columns
+        size = keys.height * len(value_columns)
+        self._moments = _WeightedMoments(size)
+        self._minimum = np.full(size, np.nan)
+        self._maximum = np.full(size, np.nan)
+        self._quantiles = {quantile: _P2Quantile(size, quantile) for quantile in quantiles}
+
+    def update(self, year_df: pl.DataFrame, weight: float) -> None:
+        key_columns = self.keys.columns
+        if not year_df.select(key_columns).equals(self.keys):
+            year_df = self.keys.join(year_df, on=key_columns, how="left", maintain_order="left")
+        values = (
+            year_df.select(
+                pl.col(column) if column in year_df.columns else pl.lit(None, dtype=pl.Float64).alias(column)
+                for column in self.value_columns
+            )
+            .cast(pl.Float64)
+            .to_numpy()
+            .ravel()
+        )
+        valid = ~np.isnan(values)
+        self._moments.update(values, valid, weight)
+        if weight > 0:
+            # Years weighing 0 are excluded from the playlist, they must not reach the extrema either.
+            self._minimum = np.fmin(self._minimum, values)
+            self._maximum = np.fmax(self._maximum, values)
+        for estimator in self._quantiles.values():
+            estimator.update(values, valid)
+
+    def result(self, stats: Sequence[MCStatistic]) -> pl.DataFrame:
+        results: dict[str, np.ndarray] = {}
+        for stat in stats:
+            if stat == MCStatistic.MEAN:
+                results[_STATISTIC_SUFFIXES[stat]] = self._moments.mean()
+            elif stat == MCStatistic.STD:
+                results[_STATISTIC_SUFFIXES[stat]] = self._moments.std()
+            elif stat == MCStatistic.MIN:
+                results[_STATISTIC_SUFFIXES[stat]] = self._minimum
+            else:
+                results[_STATISTIC_SUFFIXES[stat]] = self._maximum
+        for quantile, estimator in self._quantiles.items():
+            results[quantile_suffix(quantile)] = estimator.result()
+
+        shape = (self.keys.height, len(self.value_columns))
+        statistics_df = self.keys.with_columns(
+            pl.Series(f"{column} {suffix}", result.reshape(shape)[:, k], dtype=pl.Float64)
+            for k, column in enumerate(self.value_columns)
+            for suffix, result in results.items()
+        )
+        # Values without any observation are nulls
+        return statistics_df.fill_nan(None)
+
+
+def split_by_year(dataframes: Iterable[pl.DataFrame]) -> Iterator[tuple[int, pl.DataFrame]]:
+    """Gathers consecutive dataframes of the same Monte Carlo year, e.g. the files of each area for a year."""
+    for mc_year, year_dfs in itertools.groupby(dataframes, key=lambda df: int(df[MC_YEAR_COLUMN][0])):
+        yield mc_year, pl.concat(list(year_dfs), how="diagonal_relaxed").drop(MC_YEAR_COLUMN)
+
+
+def compute_mc_statistics(
+    year_dataframes: Iterable[tuple[int, pl.DataFrame]],
+    stats: Sequence[MCStatistic],
+    quantiles: Sequence[float] = (),
+    weights: Optional[Mapping[int, float]] = None,
+) -> pl.DataFrame:
+    """Computes statistics across Monte Carlo years, walking the years one at a time.
+
+    Only the accumulators are kept in memory, so the memory doesn't depend on the number of years as long as
+    `year_dataframes` yields them lazily. The API results are downloaded as a single table, so all the years
+    are held in memory in this case.
+    Mean and standard deviation are weighted with Welford's online algorithm, quantiles are estimated
+    with the P² algorithm. Missing values are ignored.
+
+    Args:
+        year_dataframes: The Monte Carlo years and their aggregated results, without the `mcYear` column.
+            The rows and columns of the first year are used, the following years are aligned on them.
+        stats: The statistics to compute.
+        quantiles: The quantiles to estimate, between 0 and 1.
+        weights: Weight of each Monte Carlo year, 1 for the missing ones. Years weighing 0 are ignored.
+
+    Returns:
+        A dataframe with the columns identifying a row (`area` or `link`, `cluster` and `timeId`) followed by
+        one column per value column and statistic, suffixed like synthesis results, e.g. `LOAD EXP` or `LOAD Q50`.
+
+    Raises:
+        ValueError: If a quantile is not between 0 and 1, if a weight is negative, or if quantiles are
+            requested along with weights, as the P² algorithm doesn't handle weights.
+    """
+    if any(not 0 <= quantile <= 1 for quantile in quantiles):
+        raise ValueError(f"Quantiles should be between 0 and 1, got {list(quantiles)}")
+    if weights is not None:
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError("Monte Carlo years weights should be positive")
+        if quantiles:
+            raise ValueError("Quantiles cannot be computed with Monte Carlo years weights")
+
+    accumulator: Optional[_YearsAccumulator] = None
+    for mc_year, year_df in year_dataframes:
+        if accumulator is None:
+            key_columns = [column for column in KEY_COLUMNS if column in year_df.columns]
+            value_columns = [column for column in year_df.columns if column not in key_columns]
+            accumulator = _YearsAccumulator(year_df.select(key_columns), value_columns, quantiles)
+        accumulator.update(year_df, 1.0 if weights is None else weights.get(mc_year, 1.0))
+
+    if accumulator is None:
+        return pl.DataFrame()
+    return accumulator.result(stats)
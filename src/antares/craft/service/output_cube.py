@@ -0,0 +1,73 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import polars as pl
+
+from antares.craft.model.output import OutputCube
+
+# Only typed by the stubs of recent numpy versions: binding it to a typed variable checks on every version
+_open_memmap: Callable[..., np.ndarray] = np.lib.format.open_memmap
+
+
+def allocate_cube_values(
+    variables: Sequence[str], shape: tuple[int, int, int], dtype: npt.DTypeLike, memmap_dir: Optional[Path]
+) -> dict[str, np.ndarray]:
+    """Allocates one NaN filled array per variable, backed by a `<variable>.npy` file of `memmap_dir` if given."""
+    values: dict[str, np.ndarray] = {}
+    if memmap_dir is not None:
+        memmap_dir.mkdir(parents=True, exist_ok=True)
+    for variable in variables:
+        if memmap_dir is None:
+            values[variable] = np.full(shape, np.nan, dtype=dtype)
+        else:
+            # A `.npy` file rather than a raw `np.memmap`, so that it keeps its dtype and shape
+            array = _open_memmap(memmap_dir / f"{variable}.npy", mode="w+", dtype=dtype, shape=shape)
+            array[...] = np.nan
+            values[variable] = array
+    return values
+
+
+def variables_by_column(variables: Sequence[str]) -> dict[str, str]:
+    """Requested variables keyed by their lower case name, as columns are matched regardless of the case."""
+    return {variable.lower(): variable for variable in variables}
+
+
+def build_cube_from_table(
+    table: pl.DataFrame,
+    id_column: str,
+    variables: Sequence[str],
+    dtype: npt.DTypeLike,
+    memmap_dir: Optional[Path],
+) -> OutputCube:
+    """Scatters an aggregation of individual results (with `mcYear`, `timeId` and the `id_column`) in a cube."""
+    mc_years = table["mcYear"].unique().sort().to_list()
+    ids = table[id_column].unique().sort().to_list()
+    time_count = table.height and int(table.select(pl.col("timeId").max()).item())
+    values = allocate_cube_values(variables, (len(mc_years), time_count, len(ids)), dtype, memmap_dir)
+
+    # Sorted unique values have consecutive dense ranks, starting at 1
+    positions = table.select(
+        (pl.col("mcYear").rank("dense") - 1).alias("year_index"),
+        (pl.col("timeId") - 1).alias("time_index"),
+        (pl.col(id_column).rank("dense") - 1).alias("id_index"),
+    )
+    indexes = tuple(positions[column].to_numpy() for column in positions.columns)
+    requested_variables = variables_by_column(variables)
+    for column in table.columns:
+        variable = requested_variables.get(column.lower())
+        if variable is not None:
+            values[variable][indexes] = table[column].cast(pl.Float64).to_numpy()
+    return OutputCube(mc_years=mc_years, ids=ids, values=values)
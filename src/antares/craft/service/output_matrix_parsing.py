@@ -10,56 +10,161 @@
 #
 # This file is part of the Antares project.
 
+import hashlib
+import threading
+
+from collections import OrderedDict
 from dataclasses import dataclass
-from io import StringIO
+from functools import partial
 from pathlib import Path
-from typing import TypeAlias
+from typing import Any, Callable, Hashable, Optional, Sequence, TypeAlias, TypeVar, cast
 
 import numpy as np
 import pandas as pd
 import polars as pl
 
-from polars.exceptions import ComputeError
-
 from antares.craft.model.output import Frequency
+from antares.craft.tools.matrix_tool import build_float_schema
 
 SingleOutputHeaders: TypeAlias = list[str]
 MultipleOutputHeaders: TypeAlias = list[list[str]]
+ColumnSelector: TypeAlias = Callable[[MultipleOutputHeaders], Sequence[int]]
 
 
-def parse_headers(content: str, start_col: int) -> MultipleOutputHeaders:
-    lines = content.splitlines()
-    header_lines = []
-    for idx, line in enumerate(lines[4:7]):
+HEADER_CACHE_SIZE = 256
+"""Number of distinct headers kept by a `HeaderCache`."""
+
+_T = TypeVar("_T")
+
+
+def _parse_header_lines(header_lines: list[str], start_col: int) -> MultipleOutputHeaders:
+    headers: MultipleOutputHeaders = []
+    for idx, line in enumerate(header_lines):
         cols = line.split("\t")[start_col:]
         if idx == 0:
-            header_lines = [[col] for col in cols]
+            headers = [[col] for col in cols]
         else:
             for k, col in enumerate(cols):
-                header_lines[k].append(col)
-
-    return header_lines
-
-
-def _parse_output_dataframe(source: Path | StringIO) -> pl.DataFrame:
-    try:
-        return pl.read_csv(source, skip_lines=7, separator="\t", has_header=False, null_values="N/A", n_threads=1)
-    except ComputeError:
-        # Happens if polars wrongly inferred the schema.
-        # If so, we specify that it should read the entire file to be sure it doesn't infer a false schema.
-        # It's significantly slower but it does not fail.
-        # As no file is longer than 10.000 rows we use this value.
-        return pl.read_csv(
-            source,
-            skip_lines=7,
-            separator="\t",
-            has_header=False,
-            null_values="N/A",
-            infer_schema_length=10000,
-            n_threads=1,
+                headers[k].append(col)
+    return headers
+
+
+def parse_headers(content: str, start_col: int) -> MultipleOutputHeaders:
+    return _parse_header_lines(content.splitlines()[4:7], start_col)
+
+
+class OutputHeaders:
+    """Headers of an output file, along with the objects built from them.
+
+    The files of an aggregation only have a few distinct headers. Shared through a `HeaderCache`,
+    the objects built from the headers (pandas index, normalized column names, selected columns ...)
+    are built once per distinct header instead of once per file.
+    """
+
+    def __init__(self, headers: MultipleOutputHeaders) -> None:
+        self.headers = headers
+        self._built: dict[Hashable, Any] = {}
+
+    def get_or_build(self, key: Hashable, build: Callable[[MultipleOutputHeaders], _T]) -> _T:
+        """Returns the object built from the headers for the given key, building it the first time."""
+        try:
+            return cast(_T, self._built[key])
+        except KeyError:
+            # Concurrent workers may build the same object twice, which is harmless.
+            value = build(self.headers)
+            self._built[key] = value
+            return value
+
+    def multi_index(self) -> pd.MultiIndex:
+        """The headers as pandas columns."""
+        return self.get_or_build(
+            "multi_index", lambda headers: pd.MultiIndex.from_tuples([tuple(header) for header in headers])
         )
 
 
+class HeaderCache:
+    """Parsed headers of output files, keyed by a hash of their raw header lines.
+
+    Only the most recently used `max_size` headers are kept. The cache can be shared between threads.
+    """
+
+    def __init__(self, max_size: int = HEADER_CACHE_SIZE) -> None:
+        self._max_size = max_size
+        self._headers: OrderedDict[bytes, OutputHeaders] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, header_lines: bytes) -> OutputHeaders:
+        """Returns the parsed headers of the given raw header lines, without their time columns.
+
+        The headers are parsed the first time only.
+        """
+        key = hashlib.blake2b(header_lines, digest_size=16).digest()
+        with self._lock:
+            output_headers = self._headers.get(key)
+            if output_headers is not None:
+                self._headers.move_to_end(key)
+                return output_headers
+
+        output_headers = _parse_output_headers(header_lines)
+        with self._lock:
+            output_headers = self._headers.setdefault(key, output_headers)
+            while len(self._headers) > self._max_size:
+                self._headers.popitem(last=False)
+        return output_headers
+
+
+_SHARED_HEADER_CACHE = HeaderCache()
+
+
+def _line_ends(content: bytes, line_count: int) -> list[int]:
+    # Offsets of the end of the first lines, the missing lines end with the content.
+    ends = []
+    end = -1
+    for _ in range(line_count):
+        end = content.find(b"\n", end + 1)
+        if end == -1:
+            end = len(content)
+        ends.append(end)
+    return ends
+
+
+def _header_lines(content: bytes, line_ends: list[int], first_column: int) -> bytes:
+    # The header lines without their time columns, which may hold the area or link name.
+    lines = []
+    for k in range(4, 7):
+        start, end = line_ends[k - 1] + 1, line_ends[k]
+        for _ in range(first_column):
+            start = content.find(b"\t", start, end) + 1 or end
+        lines.append(content[start:end])
+    return b"\n".join(lines)
+
+
+def _parse_output_headers(header_lines: bytes) -> OutputHeaders:
+    return OutputHeaders(_parse_header_lines(header_lines.decode("utf-8").splitlines(), 0))
+
+
+def _count_output_columns(content: bytes, line_ends: list[int]) -> int:
+    # The first data line is used as it has exactly the file layout. Without data, we fall back on the header.
+    line = content[line_ends[6] + 1 : line_ends[7]]
+    if not line.strip():
+        line = content[line_ends[3] + 1 : line_ends[4]]
+    return line.rstrip(b"\r").count(b"\t") + 1
+
+
+def _parse_output_dataframe(source: bytes, first_column: int, column_count: int, columns: list[int]) -> pl.DataFrame:
+    # Only the requested numeric columns are parsed, with an explicit schema, so that the file is read exactly once.
+    return pl.read_csv(
+        source,
+        skip_lines=7,
+        separator="\t",
+        has_header=False,
+        null_values="N/A",
+        schema=build_float_schema(column_count, first_column),
+        columns=columns,
+        n_threads=1,
+    )
+
+
 def get_start_column(frequency: Frequency) -> int:
     if frequency == Frequency.ANNUAL:
         return 2
@@ -83,30 +188,93 @@ class OutputDataFrame:
 
     data: pl.DataFrame
     headers: SingleOutputHeaders | MultipleOutputHeaders
+    output_headers: OutputHeaders
 
 
-def parse_output_file(source: Path | StringIO, first_column: int) -> OutputDataFrame:
-    if isinstance(source, Path):
-        content = source.read_text(encoding="utf-8")
+def parse_output_file(
+    source: Path | bytes,
+    first_column: int,
+    select_columns: Optional[ColumnSelector] = None,
+    header_cache: Optional[HeaderCache] = None,
+) -> OutputDataFrame:
+    """Parses an output file, given by its path or its raw content.
+
+    The file is read once: its headers come from its first lines and the same bytes are then parsed by polars.
+
+    If `select_columns` is given, it is called with the headers and only the returned columns
+    (indexes among the headers) are parsed. As the number of rows is still needed,
+    every column is parsed if none is selected.
+
+    If `header_cache` is given, files sharing the same headers only parse them once. The columns selection
+    is then also kept along with the headers, `select_columns` should thus always be the same object
+    for a given selection.
+    """
+    content = source.read_bytes() if isinstance(source, Path) else source
+    line_ends = _line_ends(content, 8)
+    header_lines = _header_lines(content, line_ends, first_column)
+    output_headers = header_cache.get(header_lines) if header_cache is not None else _parse_output_headers(header_lines)
+    column_count = _count_output_columns(content, line_ends)
+
+    selected_columns: list[int] = []
+    if select_columns:
+        selected_columns, selected_headers = output_headers.get_or_build(
+            ("columns", select_columns), partial(_select_headers, select_columns=select_columns)
+        )
+    if selected_columns:
+        output_headers = selected_headers
+        columns = [first_column + k for k in selected_columns]
     else:
-        content = source.read()
-        source.seek(0)
+        columns = list(range(first_column, column_count))
+    df = _parse_output_dataframe(content, first_column, column_count, columns)
 
-    output_headers = parse_headers(content, first_column)
-    polars_df = _parse_output_dataframe(source)
+    return OutputDataFrame(data=df, headers=output_headers.headers, output_headers=output_headers)
 
-    df = polars_df[polars_df.columns[first_column:]]
 
-    # At this point we only have numeric values in our df. But NaN columns are considered to be String by polars.
-    # So we change this to be Float64 to harmonize everything.
-    df = df.with_columns(pl.col(pl.Utf8).cast(pl.Float64))
+def _select_headers(headers: MultipleOutputHeaders, select_columns: ColumnSelector) -> tuple[list[int], OutputHeaders]:
+    selected_columns = sorted(select_columns(headers))
+    return selected_columns, OutputHeaders([headers[k] for k in selected_columns])
+
+
+def reshape_details_output(output: OutputDataFrame) -> pl.DataFrame:
+    """Reshapes a parsed details file (thermal, renewable or short-term storage clusters) into a long format.
+
+    The columns of a details file are grouped by cluster. Each cluster becomes a block of rows with one column
+    per variable (NODU, production etc.), rows being ordered by time then cluster.
+
+    Returns:
+        A dataframe with the `cluster` and `timeId` columns followed by the sorted variables.
+        Values are null if the cluster doesn't have the variable.
+    """
+    headers = cast(MultipleOutputHeaders, output.headers)
+    clusters = sorted({header[0] for header in headers})
+    variables = sorted({header[1] for header in headers})
+    cluster_indexes = {cluster: k for k, cluster in enumerate(clusters)}
+
+    # Each variable is gathered in a (time, cluster) block, which flattened row by row gives the long format rows.
+    row_count = output.data.height
+    data = output.data.to_numpy()
+    variable_series = []
+    for variable in variables:
+        columns = [k for k, header in enumerate(headers) if header[1] == variable]
+        block = np.full((row_count, len(clusters)), np.nan)
+        block[:, [cluster_indexes[headers[k][0]] for k in columns]] = data[:, columns]
+        variable_series.append(pl.Series(variable, block.ravel(), dtype=pl.Float64))
 
-    return OutputDataFrame(data=df, headers=output_headers)
+    long_df = pl.DataFrame(
+        [
+            pl.Series("cluster", clusters, dtype=pl.String).gather(np.tile(np.arange(len(clusters)), row_count)),
+            pl.Series("timeId", np.repeat(np.arange(1, row_count + 1, dtype=np.int64), len(clusters))),
+            *variable_series,
+        ]
+    )
+    # N/A values of the file and missing variables are both nulls, as NaN does not come from the file.
+    return long_df.fill_nan(None)
 
 
-def read_output_matrix(source: Path | StringIO, frequency: Frequency) -> pd.DataFrame:
+def read_output_matrix(source: Path | bytes, frequency: Frequency) -> pd.DataFrame:
     output_first_column = get_start_column(frequency)
-    output = parse_output_file(source, output_first_column)
-    df = output.data.to_pandas().astype(np.float64)
-    df.columns = pd.MultiIndex.from_tuples(output.headers)  # type: ignore
+    output = parse_output_file(source, output_first_column, header_cache=_SHARED_HEADER_CACHE)
+    df = output.data.to_pandas()
+    # The cached index is shared: the returned dataframe gets its own copy, which shares the levels and codes.
+    df.columns = output.output_headers.multi_index().copy()
     return df
@@ -0,0 +1,84 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import polars as pl
+import pyarrow.dataset as ds
+
+PARQUET_CHUNK_ROWS = 1_000_000
+"""Number of rows gathered in memory before being written to the dataset."""
+
+
+def _write_chunk(path: Path, dataframes: list[pl.DataFrame], partition_by: Sequence[str], chunk_index: int) -> None:
+    chunk = pl.concat(dataframes, how="diagonal_relaxed")
+    missing_columns = [col for col in partition_by if col not in chunk.columns]
+    if missing_columns:
+        raise ValueError(f"Cannot partition the dataset by the missing columns {missing_columns}")
+    ds.write_dataset(
+        chunk.to_arrow(),
+        path,
+        format="parquet",
+        partitioning=list(partition_by) or None,
+        partitioning_flavor="hive" if partition_by else None,
+        # Each chunk writes its own files, so that chunks sharing a partition don't overwrite each other.
+        basename_template=f"part-{chunk_index}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+
+def write_parquet_dataset(
+    path: Path,
+    dataframes: Iterable[pl.DataFrame],
+    partition_by: Sequence[str] = (),
+    chunk_rows: int = PARQUET_CHUNK_ROWS,
+) -> pl.LazyFrame:
+    """Streams the given dataframes to a (hive partitioned) parquet dataset.
+
+    Dataframes are gathered by chunks of about `chunk_rows` rows, so the whole data is never held in memory.
+    They may not share the same columns: the missing ones are read as nulls.
+
+    Args:
+        path: Folder of the dataset, it should not exist or be empty.
+        dataframes: The dataframes to write.
+        partition_by: Columns used to partition the dataset, e.g. `["mcYear"]` writes one folder per year.
+        chunk_rows: Number of rows written at once.
+
+    Returns:
+        A lazy frame scanning the written dataset, with the columns in the order they were encountered.
+
+    Raises:
+        FileExistsError: If the dataset folder is not empty.
+        ValueError: If a partition column is missing.
+    """
+    if path.exists() and any(path.iterdir()):
+        raise FileExistsError(f"The folder {path} already exists and is not empty")
+    path.mkdir(parents=True, exist_ok=True)
+
+    schema: dict[str, pl.DataType] = {}
+    pending: list[pl.DataFrame] = []
+    pending_rows = 0
+    chunk_index = 0
+    for df in dataframes:
+        for name, dtype in df.schema.items():
+            schema.setdefault(name, dtype)
+        pending.append(df)
+        pending_rows += df.height
+        if pending_rows >= chunk_rows:
+            _write_chunk(path, pending, partition_by, chunk_index)
+            pending, pending_rows, chunk_index = [], 0, chunk_index + 1
+    if pending:
+        _write_chunk(path, pending, partition_by, chunk_index)
+
+    return pl.scan_parquet(
+        path, hive_partitioning=bool(partition_by), schema=pl.Schema(schema), missing_columns="insert"
+    )
@@ -11,7 +11,10 @@
 # This file is part of the Antares project.
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
 
 from antares.craft import (
     XpansionCandidate,
@@ -66,10 +69,24 @@ def update_sensitivity(
     return XpansionSensitivity(**sensitivity_dict)
 
 
-def read_ts_numbers_file(source: Path | str) -> dict[int, int]:
+def parse_ts_numbers(source: Path | str | bytes) -> np.ndarray:
+    """Time series numbers of a `ts-numbers` file, one per Monte-Carlo year."""
     if isinstance(source, Path):
         char = source.read_text()
+    elif isinstance(source, bytes):
+        char = source.decode("utf-8")
     else:
         char = source
-    data = char.splitlines()[1:]
-    return {k + 1: int(data[k]) for k in range(len(data))}
+    # The first line holds the size of the vector
+    return np.array(char.splitlines()[1:], dtype=np.int32)
+
+
+def read_ts_numbers_file(source: Path | str | bytes) -> dict[int, int]:
+    return {k + 1: int(value) for k, value in enumerate(parse_ts_numbers(source))}
+
+
+def build_ts_numbers_dataframe(ts_numbers: Mapping[str, np.ndarray]) -> pd.DataFrame:
+    """Gathers the time series numbers of several objects in a dataframe indexed by Monte-Carlo year."""
+    df = pd.DataFrame({object_id: ts_numbers[object_id] for object_id in sorted(ts_numbers)}, dtype=np.int32)
+    df.index = pd.RangeIndex(1, len(df) + 1, name="mcYear")
+    return df
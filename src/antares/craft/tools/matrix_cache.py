@@ -0,0 +1,333 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import hashlib
+import os
+import shutil
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Hashable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+CACHE_FILE_EXTENSION = ".arrow"
+ARRAY_FILE_EXTENSION = ".npy"
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+@dataclass
+class MatrixCacheStats:
+    """Usage counters of a `MatrixCache`.
+
+    Attributes:
+        hits: Number of reads served from the cache.
+        misses: Number of reads that had to parse the text file.
+        invalidations: Number of entries removed because their matrix was rewritten.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class MatrixCache:
+    """On-disk binary cache for the input matrices of a study.
+
+    Each parsed text matrix is stored as an Arrow IPC file inside `cache_dir`.
+    Entries are keyed on the matrix absolute path, its size and its modification time:
+    an entry is only served if the text file has not changed since it was cached.
+
+    With `memory_map=True`, matrices are stored as float64 `.npy` files instead and read back as
+    read-only memory-mapped arrays. Every process reading the same matrix then shares the same
+    physical pages instead of holding its own parsed copy.
+    """
+
+    def __init__(self, cache_dir: Path, memory_map: bool = False) -> None:
+        self._cache_dir = cache_dir
+        self._memory_map = memory_map
+        self._stats = MatrixCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Folder containing the cached matrices."""
+        return self._cache_dir
+
+    @property
+    def memory_map(self) -> bool:
+        """Whether matrices are served as read-only memory-mapped arrays."""
+        return self._memory_map
+
+    @property
+    def stats(self) -> MatrixCacheStats:
+        """Usage counters since the creation of the cache object."""
+        return self._stats
+
+    @staticmethod
+    def _is_entry_folder(path: Path) -> bool:
+        # The cache folder also holds the catalogs and parquet conversions of the outputs, which are kept.
+        name = path.name
+        return len(name) == 40 and _HEX_DIGITS.issuperset(name) and path.is_dir()
+
+    def _entry_folder(self, file_path: Path) -> Path:
+        # One folder per matrix, this way outdated entries can be found without listing the whole cache.
+        return self._cache_dir / hashlib.sha1(str(file_path.absolute()).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, file_path: Path, extension: str) -> Path:
+        stat = file_path.stat()
+        return self._entry_folder(file_path) / f"{stat.st_size}-{stat.st_mtime_ns}{extension}"
+
+    def _remove_entries(self, file_path: Path) -> int:
+        entry_folder = self._entry_folder(file_path)
+        if not entry_folder.exists():
+            return 0
+        removed = 0
+        for entry in entry_folder.iterdir():
+            try:
+                entry.unlink(missing_ok=True)
+                removed += 1
+            except PermissionError:
+                # On Windows, a file cannot be deleted while it is memory-mapped.
+                # It's harmless: the entry key no longer matches the matrix, so it won't be served.
+                pass
+        return removed
+
+    def _register_lookup(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+
+    def _prepare_entry(self, file_path: Path, extension: str) -> tuple[Path, Path]:
+        self._remove_entries(file_path)
+        entry = self._entry_path(file_path, extension)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # We write in a temporary file first so that concurrent readers never see a partial entry.
+        tmp_entry = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        return entry, tmp_entry
+
+    def get(self, file_path: Path, columns: Optional[Sequence[int]] = None) -> Optional[pl.DataFrame]:
+        """Returns the cached content of the given matrix or `None` if there's no valid entry.
+
+        If `columns` is given, only these columns are read from the cache.
+        """
+        entry = self._entry_path(file_path, CACHE_FILE_EXTENSION)
+        hit = entry.exists()
+        self._register_lookup(hit)
+        if not hit:
+            return None
+        if columns is None:
+            return pl.read_ipc(entry, memory_map=False)
+        column_names = list(pl.read_ipc_schema(entry))
+        if any(not 0 <= column < len(column_names) for column in columns):
+            raise IndexError(f"Columns {columns} are out of bounds for a matrix with {len(column_names)} columns")
+        return pl.read_ipc(entry, columns=[column_names[k] for k in columns], memory_map=False)
+
+    def put(self, file_path: Path, df: pl.DataFrame) -> None:
+        """Stores the parsed content of the given matrix and drops the outdated entries."""
+        entry, tmp_entry = self._prepare_entry(file_path, CACHE_FILE_EXTENSION)
+        df.write_ipc(tmp_entry)
+        os.replace(tmp_entry, entry)
+
+    def get_array(self, file_path: Path) -> Optional[np.ndarray]:
+        """Returns a read-only memory-mapped view of the given matrix or `None` if there's no valid entry."""
+        entry = self._entry_path(file_path, ARRAY_FILE_EXTENSION)
+        hit = entry.exists()
+        self._register_lookup(hit)
+        return np.load(entry, mmap_mode="r") if hit else None
+
+    def put_array(self, file_path: Path, array: np.ndarray) -> np.ndarray:
+        """Stores the given matrix as a float64 array and returns a read-only memory-mapped view of it."""
+        entry, tmp_entry = self._prepare_entry(file_path, ARRAY_FILE_EXTENSION)
+        with open(tmp_entry, "wb") as f:
+            np.save(f, array.astype(np.float64, copy=False))
+        os.replace(tmp_entry, entry)
+        memory_mapped_array: np.ndarray = np.load(entry, mmap_mode="r")
+        return memory_mapped_array
+
+    def get_shape(self, file_path: Path) -> Optional[tuple[int, int]]:
+        """Returns the shape of the cached matrix or `None` if there's no valid entry.
+
+        Only the entry header is read: the `.npy` header or the Arrow schema and record batch lengths.
+        """
+        array_entry = self._entry_path(file_path, ARRAY_FILE_EXTENSION)
+        if array_entry.exists():
+            array: np.ndarray = np.load(array_entry, mmap_mode="r")
+            return array.shape[0], array.shape[1]
+        entry = self._entry_path(file_path, CACHE_FILE_EXTENSION)
+        if not entry.exists():
+            return None
+        with pa.memory_map(str(entry)) as source:
+            reader = pa.ipc.open_file(source)
+            row_count = sum(reader.get_batch(k).num_rows for k in range(reader.num_record_batches))
+            return row_count, len(reader.schema)
+
+    def invalidate(self, file_path: Path) -> None:
+        """Removes every entry of the given matrix. Should be called whenever the matrix is rewritten."""
+        removed = self._remove_entries(file_path)
+        with self._lock:
+            self._stats.invalidations += removed
+
+    def purge(self) -> int:
+        """Removes every cached matrix, the other content of the cache folder is left untouched.
+
+        Returns:
+            The number of deleted entries.
+        """
+        removed = 0
+        if self._cache_dir.exists():
+            for entry_folder in self._cache_dir.iterdir():
+                if not self._is_entry_folder(entry_folder):
+                    continue
+                removed += sum(
+                    1
+                    for entry in entry_folder.iterdir()
+                    if entry.suffix in {CACHE_FILE_EXTENSION, ARRAY_FILE_EXTENSION}
+                )
+                shutil.rmtree(entry_folder, ignore_errors=True)
+        return removed
+
+
+@dataclass
+class MatrixMemoryCacheStats:
+    """Usage counters of a `MatrixMemoryCache`.
+
+    Attributes:
+        hits: Number of reads served from memory.
+        misses: Number of reads that had to fetch the matrix.
+        evictions: Number of entries dropped to stay within the byte budget.
+        invalidations: Number of entries removed because their matrix was rewritten.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _MemoryEntry:
+    df: pd.DataFrame
+    version: Hashable
+    size: int
+    read_only: bool
+
+
+def _freeze(df: pd.DataFrame) -> tuple[pd.DataFrame, bool]:
+    if df.dtypes.nunique() > 1:
+        # Frames with several dtypes cannot be backed by a single array: they're copied on each read instead.
+        return df, False
+    array = df.to_numpy()
+    array.flags.writeable = False
+    return pd.DataFrame(array, index=df.index, columns=df.columns, copy=False), True
+
+
+class MatrixMemoryCache:
+    """In-memory LRU cache of matrices, bounded by a byte budget.
+
+    Entries are keyed by the matrix location and optionally by a version (e.g. the file size and modification time):
+    an entry is only served if its version matches the one given at read time.
+    The least recently used entries are evicted once the total size of the cached matrices exceeds `max_bytes`.
+
+    Cached matrices are shared between callers, so they're returned as read-only dataframes.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"The memory cache size should be strictly positive, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._size = 0
+        self._stats = MatrixMemoryCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum total size of the cached matrices."""
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        """Current total size of the cached matrices, in bytes."""
+        return self._size
+
+    @property
+    def stats(self) -> MatrixMemoryCacheStats:
+        """Usage counters since the creation of the cache object."""
+        return self._stats
+
+    def _pop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._size -= entry.size
+        return True
+
+    def get(self, key: str, version: Hashable = None) -> Optional[pd.DataFrame]:
+        """Returns the cached matrix or `None` if there's no entry for the given key and version."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                self._pop(key)
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+        return entry.df if entry.read_only else entry.df.copy()
+
+    def put(self, key: str, df: pd.DataFrame, version: Hashable = None) -> pd.DataFrame:
+        """Caches the given matrix, evicting the least recently used ones if needed.
+
+        Returns:
+            The dataframe to hand over to the caller, read-only if it is shared with the cache.
+            Matrices larger than the whole budget are not cached and returned untouched.
+        """
+        size = int(df.memory_usage(index=True, deep=False).sum())
+        if size > self._max_bytes:
+            with self._lock:
+                self._pop(key)
+            return df
+        frozen_df, read_only = _freeze(df)
+        with self._lock:
+            self._pop(key)
+            while self._size + size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._stats.evictions += 1
+            self._entries[key] = _MemoryEntry(frozen_df, version, size, read_only)
+            self._size += size
+        return frozen_df if read_only else frozen_df.copy()
+
+    def invalidate(self, key: str) -> None:
+        """Removes the entry of the given matrix. Should be called whenever the matrix is rewritten."""
+        with self._lock:
+            if self._pop(key):
+                self._stats.invalidations += 1
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Removes the entries of every matrix whose key starts with the given prefix (e.g. a whole folder)."""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._pop(key)
+                self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Removes every cached matrix."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -0,0 +1,118 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import hashlib
+import os
+import shutil
+import sys
+import threading
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+_FICLONE: Optional[int] = None
+if sys.platform.startswith("linux"):
+    import fcntl
+
+    # Linux ioctl cloning a file into another one sharing the same blocks (Btrfs, XFS, ...).
+    # The number is Linux specific: other platforms copy the payload instead.
+    _FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+
+@dataclass
+class MatrixStoreStats:
+    """Usage counters of a `MatrixStore`.
+
+    Attributes:
+        written: Number of distinct payloads written in the store.
+        linked: Number of matrix files linked to a payload already present in the store.
+        bytes_saved: Disk space spared by these links, in bytes.
+    """
+
+    written: int = 0
+    linked: int = 0
+    bytes_saved: int = 0
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if _FICLONE is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        return True
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+
+
+def _link(source: Path, target: Path) -> bool:
+    try:
+        os.link(source, target)
+        return True
+    except OSError:
+        # Hard links are not supported or the store is on another device
+        return _reflink(source, target)
+
+
+class MatrixStore:
+    """Content-addressed store deduplicating identical matrix files.
+
+    Each distinct payload is written once inside `store_dir`, named after its SHA-256 hash.
+    Matrix files are then hard links to it, or reflinks when hard links are not possible.
+    If the file system supports none of them, the payload is copied and no space is saved.
+
+    Hard linked matrix files share their content: they must never be modified in place.
+    `write_timeseries` always replaces them with a new file instead.
+    """
+
+    def __init__(self, store_dir: Path) -> None:
+        self._store_dir = store_dir
+        self._stats = MatrixStoreStats()
+        self._lock = threading.Lock()
+
+    @property
+    def store_dir(self) -> Path:
+        """Folder containing the stored payloads."""
+        return self._store_dir
+
+    @property
+    def stats(self) -> MatrixStoreStats:
+        """Usage counters since the creation of the store object."""
+        return self._stats
+
+    def _blob_path(self, payload: bytes) -> Path:
+        digest = hashlib.sha256(payload).hexdigest()
+        return self._store_dir / digest[:2] / digest
+
+    def write(self, file_path: Path, payload: bytes) -> None:
+        """Writes the payload to the given path, linking it to an identical stored payload if there's one."""
+        blob = self._blob_path(payload)
+        is_new = not blob.exists()
+        if is_new:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            # We write in a temporary file first so that concurrent writers never link a partial payload.
+            tmp_blob = blob.with_name(f"{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_blob.write_bytes(payload)
+            os.replace(tmp_blob, blob)
+
+        file_path.unlink(missing_ok=True)
+        linked = _link(blob, file_path)
+        if not linked:
+            shutil.copyfile(blob, file_path)
+
+        with self._lock:
+            if is_new:
+                self._stats.written += 1
+            elif linked:
+                self._stats.linked += 1
+                self._stats.bytes_saved += len(payload)
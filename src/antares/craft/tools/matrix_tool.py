@@ -10,15 +10,20 @@
 #
 # This file is part of the Antares project.
 
+import re
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Literal, Optional, Sequence, TypeAlias, cast, overload
 
 import numpy as np
 import pandas as pd
 import polars as pl
 
-from polars.exceptions import ComputeError
-
+from antares.craft.tools.matrix_cache import MatrixCache, MatrixMemoryCache
+from antares.craft.tools.matrix_store import MatrixStore
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
 
 default_data_matrix = np.zeros((365, 6), dtype=np.float64)
@@ -124,6 +129,229 @@ DEFAULT_MATRIX_MAPPING = {
 }
 
 
+_INTEGER_PATTERN = re.compile(r"[+-]?\d+")
+_INT64_UPPER_BOUND = 2.0**63
+
+
+def build_float_schema(column_count: int, first_float_column: int = 0) -> pl.Schema:
+    """Builds the polars schema of a tab-separated matrix without header.
+
+    Every column is read as Float64, except the first `first_float_column` ones which are read as strings.
+    Giving the schema up-front spares polars the type inference, which could otherwise guess a wrong type
+    (e.g. Int64 for values too big, or String for columns starting with N/A).
+    """
+    return pl.Schema(
+        {f"column_{k + 1}": pl.String if k < first_float_column else pl.Float64 for k in range(column_count)}
+    )
+
+
+def _read_first_line(file_path: Path) -> str:
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.readline().rstrip("\r\n")
+
+
+def _restore_integer_columns(df: pl.DataFrame, candidates: list[str]) -> pl.DataFrame:
+    # Polars used to infer integer columns as Int64: we keep returning integers when every value is one.
+    if not candidates:
+        return df
+    checks = df.select(
+        ((pl.col(col) == pl.col(col).round()) & (pl.col(col).abs() < _INT64_UPPER_BOUND)).all() for col in candidates
+    ).row(0)
+    integer_columns = [col for col, is_integer in zip(candidates, checks) if is_integer]
+    return df.with_columns(pl.col(integer_columns).cast(pl.Int64)) if integer_columns else df
+
+
+def _check_columns(columns: Sequence[int], column_count: int) -> None:
+    for column in columns:
+        if not 0 <= column < column_count:
+            raise IndexError(f"Column {column} is out of bounds for a matrix with {column_count} columns")
+
+
+def validate_columns(columns: Sequence[int], column_count: Optional[int] = None) -> None:
+    """Checks a selection of columns, whatever the matrix source.
+
+    The columns are returned in the requested order, so they don't need to be sorted, but each one can only
+    be selected once. They are also checked against the number of columns of the matrix if it's known.
+
+    Raises:
+        ValueError: If a column is selected several times.
+        IndexError: If a column is out of bounds.
+    """
+    if len(set(columns)) != len(columns):
+        raise ValueError(f"Columns {list(columns)} are selected several times")
+    if column_count is not None:
+        _check_columns(columns, column_count)
+
+
+def _parse_timeseries(file_path: Path, columns: Optional[Sequence[int]] = None) -> pl.DataFrame:
+    # Every input matrix only contains numeric values, so its schema only depends on its number of columns,
+    # given by its first line. The file is then parsed once without any type inference.
+    first_line_values = _read_first_line(file_path).split("\t")
+    schema = build_float_schema(len(first_line_values))
+    if columns is None:
+        df = pl.read_csv(file_path, n_threads=1, separator="\t", has_header=False, schema=schema)
+        values_by_column = dict(zip(df.columns, first_line_values))
+    else:
+        # Only the requested columns are parsed. Polars returns them in the file order, so we reorder them.
+        _check_columns(columns, len(first_line_values))
+        df = pl.read_csv(
+            file_path, n_threads=1, separator="\t", has_header=False, schema=schema, columns=list(columns)
+        ).select(schema.names()[k] for k in columns)
+        values_by_column = {schema.names()[k]: first_line_values[k] for k in columns}
+    candidates = [col for col, value in values_by_column.items() if _INTEGER_PATTERN.fullmatch(value)]
+    return _restore_integer_columns(df, candidates)
+
+
+def _read_memory_mapped_array(file_path: Path, cache: MatrixCache) -> np.ndarray:
+    array = cache.get_array(file_path)
+    if array is None:
+        array = cache.put_array(file_path, _parse_timeseries(file_path).to_numpy())
+    return array
+
+
+class MatrixFormat(Enum):
+    """Type of the objects returned by the matrix readers.
+
+    Numeric pipelines can ask for polars or numpy objects to skip the conversion into a pandas dataframe.
+    """
+
+    PANDAS = "pandas"
+    POLARS = "polars"
+    NUMPY = "numpy"
+
+
+Matrix: TypeAlias = pd.DataFrame | pl.DataFrame | np.ndarray
+
+
+def _convert_polars_matrix(
+    df: pl.DataFrame, output_format: MatrixFormat, columns: Optional[Sequence[int]] = None
+) -> Matrix:
+    if output_format == MatrixFormat.POLARS:
+        return df
+    if output_format == MatrixFormat.NUMPY:
+        return df.to_numpy()
+    pandas_df = df.to_pandas()
+    # The labels of the selected columns are their indices in the whole matrix.
+    pandas_df.columns = pd.RangeIndex(len(pandas_df.columns)) if columns is None else pd.Index(columns)  # type: ignore
+    return pandas_df
+
+
+def convert_numpy_matrix(
+    array: np.ndarray, output_format: MatrixFormat, columns: Optional[Sequence[int]] = None
+) -> Matrix:
+    """Converts an array to the given format, after selecting the given columns."""
+    if columns is not None:
+        _check_columns(columns, array.shape[1])
+        array = array[:, columns]
+    if output_format == MatrixFormat.NUMPY:
+        return array
+    column_indices = range(array.shape[1]) if columns is None else columns
+    if output_format == MatrixFormat.POLARS:
+        return pl.from_numpy(array, schema=[f"column_{k + 1}" for k in column_indices], orient="row")
+    # The dataframe wraps the array without copying it.
+    return pd.DataFrame(array, columns=pd.Index(column_indices), copy=False)
+
+
+def _convert_default_matrix(
+    df: pd.DataFrame, output_format: MatrixFormat, columns: Optional[Sequence[int]] = None
+) -> Matrix:
+    if df.empty:
+        # Empty defaults (e.g. binding constraints terms) depend on the object properties, callers fill them.
+        columns = None
+    if output_format == MatrixFormat.PANDAS and columns is None:
+        return df
+    # Default matrices are built from read-only arrays, so this view can be shared safely.
+    return convert_numpy_matrix(df.to_numpy(), output_format, columns)
+
+
+def _read_matrix_file(
+    file_path: Path, cache: Optional[MatrixCache], output_format: MatrixFormat, columns: Optional[Sequence[int]]
+) -> Matrix:
+    if cache and cache.memory_map:
+        return convert_numpy_matrix(_read_memory_mapped_array(file_path, cache), output_format, columns)
+
+    if not cache:
+        return _convert_polars_matrix(_parse_timeseries(file_path, columns), output_format, columns)
+
+    polars_df = cache.get(file_path, columns)
+    if polars_df is None:
+        # The whole matrix is cached, so that later reads can select any column from the cache.
+        polars_df = _parse_timeseries(file_path)
+        cache.put(file_path, polars_df)
+        if columns is not None:
+            _check_columns(columns, polars_df.width)
+            polars_df = polars_df.select(polars_df.columns[k] for k in columns)
+
+    return _convert_polars_matrix(polars_df, output_format, columns)
+
+
+@overload
+def read_timeseries(
+    ts_file_type: TimeSeriesFileType,
+    study_path: Path,
+    area_id: Optional[str] = None,
+    constraint_id: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    second_area_id: Optional[str] = None,
+    file_name: Optional[str] = None,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+    output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+) -> pd.DataFrame: ...
+
+
+@overload
+def read_timeseries(
+    ts_file_type: TimeSeriesFileType,
+    study_path: Path,
+    area_id: Optional[str] = None,
+    constraint_id: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    second_area_id: Optional[str] = None,
+    file_name: Optional[str] = None,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+    *,
+    output_format: Literal[MatrixFormat.POLARS],
+) -> pl.DataFrame: ...
+
+
+@overload
+def read_timeseries(
+    ts_file_type: TimeSeriesFileType,
+    study_path: Path,
+    area_id: Optional[str] = None,
+    constraint_id: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    second_area_id: Optional[str] = None,
+    file_name: Optional[str] = None,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+    *,
+    output_format: Literal[MatrixFormat.NUMPY],
+) -> np.ndarray: ...
+
+
+@overload
+def read_timeseries(
+    ts_file_type: TimeSeriesFileType,
+    study_path: Path,
+    area_id: Optional[str] = None,
+    constraint_id: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    second_area_id: Optional[str] = None,
+    file_name: Optional[str] = None,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+    *,
+    output_format: MatrixFormat,
+) -> Matrix: ...
+
+
 def read_timeseries(
     ts_file_type: TimeSeriesFileType,
     study_path: Path,
@@ -132,7 +360,13 @@ def read_timeseries(
     cluster_id: Optional[str] = None,
     second_area_id: Optional[str] = None,
     file_name: Optional[str] = None,
-) -> pd.DataFrame:
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    columns: Optional[Sequence[int]] = None,
+    output_format: MatrixFormat = MatrixFormat.PANDAS,
+) -> Matrix:
+    if columns is not None:
+        validate_columns(columns)
     file_path = study_path / ts_file_type.value.format(
         area_id=area_id,
         constraint_id=constraint_id,
@@ -142,23 +376,213 @@ def read_timeseries(
     )
 
     if file_path.exists() and file_path.lstat().st_size != 0:
-        try:
-            polars_df = pl.read_csv(file_path, n_threads=1, separator="\t", has_header=False)
-        except ComputeError:
-            # Happens for file `conversion.txt` as polars infer the data as int64, but the value is too big.
-            # In such cases, we'll read the data as a string and convert it in float64 afterward
-            polars_df = pl.read_csv(
-                file_path, n_threads=1, separator="\t", has_header=False, infer_schema=False
-            ).with_columns(pl.all().cast(pl.Float64))
-
-        df = polars_df.to_pandas()
-        df.columns = pd.RangeIndex(len(df.columns))  # type: ignore
-        return df
+        if memory_cache is None or output_format != MatrixFormat.PANDAS:
+            return _read_matrix_file(file_path, cache, output_format, columns)
+
+        # The file size and modification time ensure we never serve a matrix modified outside of this process.
+        stat = file_path.stat()
+        version = (stat.st_size, stat.st_mtime_ns)
+        df = memory_cache.get(str(file_path), version)
+        if df is not None:
+            if columns is None:
+                return df
+            _check_columns(columns, df.shape[1])
+            return df.iloc[:, list(columns)]
+        if columns is not None:
+            # Partial matrices aren't cached, they would be useless for other selections.
+            return _read_matrix_file(file_path, cache, output_format, columns)
+        full_df = _read_matrix_file(file_path, cache, output_format, None)
+        return memory_cache.put(str(file_path), cast(pd.DataFrame, full_df), version)
 
     if not file_path.exists() and ts_file_type not in OPTIONAL_MATRICES:
         raise FileNotFoundError(f"File {file_path} not found")
 
-    return DEFAULT_MATRIX_MAPPING[ts_file_type]
+    return _convert_default_matrix(DEFAULT_MATRIX_MAPPING[ts_file_type], output_format, columns)
+
+
+@dataclass(frozen=True)
+class TimeSeriesRequest:
+    """Identifies one matrix to read with `read_timeseries_many`.
+
+    The ids have the same meaning as the corresponding `read_timeseries` arguments.
+    """
+
+    ts_file_type: TimeSeriesFileType
+    area_id: Optional[str] = None
+    constraint_id: Optional[str] = None
+    cluster_id: Optional[str] = None
+    second_area_id: Optional[str] = None
+    file_name: Optional[str] = None
+    columns: Optional[tuple[int, ...]] = None
+
+
+@overload
+def read_timeseries_many(
+    requests: Iterable[TimeSeriesRequest],
+    study_path: Path,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    max_workers: Optional[int] = None,
+    output_format: Literal[MatrixFormat.PANDAS] = MatrixFormat.PANDAS,
+) -> dict[TimeSeriesRequest, pd.DataFrame]: ...
+
+
+@overload
+def read_timeseries_many(
+    requests: Iterable[TimeSeriesRequest],
+    study_path: Path,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    max_workers: Optional[int] = None,
+    *,
+    output_format: Literal[MatrixFormat.POLARS],
+) -> dict[TimeSeriesRequest, pl.DataFrame]: ...
+
+
+@overload
+def read_timeseries_many(
+    requests: Iterable[TimeSeriesRequest],
+    study_path: Path,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    max_workers: Optional[int] = None,
+    *,
+    output_format: Literal[MatrixFormat.NUMPY],
+) -> dict[TimeSeriesRequest, np.ndarray]: ...
+
+
+@overload
+def read_timeseries_many(
+    requests: Iterable[TimeSeriesRequest],
+    study_path: Path,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    max_workers: Optional[int] = None,
+    *,
+    output_format: MatrixFormat,
+) -> dict[TimeSeriesRequest, Matrix]: ...
+
+
+def read_timeseries_many(
+    requests: Iterable[TimeSeriesRequest],
+    study_path: Path,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    max_workers: Optional[int] = None,
+    output_format: MatrixFormat = MatrixFormat.PANDAS,
+) -> dict[TimeSeriesRequest, Any]:
+    """Reads several matrices concurrently.
+
+    Parsing is done by polars which releases the GIL, so the files are read in parallel on a thread pool.
+
+    Args:
+        requests: Matrices to read. Duplicated requests are only read once.
+        study_path: Path of the study containing the matrices.
+        cache: Optional binary cache used for every read.
+        memory_cache: Optional in-memory cache used for every read.
+        max_workers: Maximum number of threads. Defaults to the `ThreadPoolExecutor` default.
+        output_format: Type of the returned matrices.
+
+    Returns:
+        The matrices keyed by request, in the order of the given requests.
+
+    Raises:
+        FileNotFoundError: If a non-optional matrix does not exist.
+    """
+    unique_requests = list(dict.fromkeys(requests))
+    if not unique_requests:
+        return {}
+
+    def _read(request: TimeSeriesRequest) -> Matrix:
+        return read_timeseries(
+            request.ts_file_type,
+            study_path,
+            area_id=request.area_id,
+            constraint_id=request.constraint_id,
+            cluster_id=request.cluster_id,
+            second_area_id=request.second_area_id,
+            file_name=request.file_name,
+            cache=cache,
+            memory_cache=memory_cache,
+            columns=request.columns,
+            output_format=output_format,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(unique_requests, executor.map(_read, unique_requests)))
+
+
+@dataclass(frozen=True)
+class MatrixInfo:
+    """Metadata of a matrix, obtained without parsing it.
+
+    Attributes:
+        rows: Number of rows of the matrix.
+        columns: Number of columns of the matrix.
+        size: Size of the matrix file, in bytes.
+        is_default: Whether the matrix file is empty or absent, i.e. the matrix is the default one.
+    """
+
+    rows: int
+    columns: int
+    size: int
+    is_default: bool
+
+
+def _count_lines(file_path: Path) -> int:
+    # Counting the line feeds of raw chunks is way faster than parsing the values.
+    line_count = 0
+    last_chunk = b""
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            line_count += chunk.count(b"\n")
+            last_chunk = chunk
+    # The last line may not end with a line feed
+    return line_count + 1 if last_chunk and not last_chunk.endswith(b"\n") else line_count
+
+
+def matrix_info(
+    ts_file_type: TimeSeriesFileType,
+    study_path: Path,
+    area_id: Optional[str] = None,
+    constraint_id: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    second_area_id: Optional[str] = None,
+    file_name: Optional[str] = None,
+    cache: Optional[MatrixCache] = None,
+) -> MatrixInfo:
+    """Returns the shape, size and default status of a matrix without parsing its values.
+
+    The shape comes from the binary cache entry header if there's one, otherwise the columns are counted on the
+    first line and the rows by scanning the line feeds of the file.
+    The arguments have the same meaning as the `read_timeseries` ones.
+
+    Raises:
+        FileNotFoundError: if the matrix file is missing and the matrix is not optional.
+    """
+    file_path = study_path / ts_file_type.value.format(
+        area_id=area_id,
+        constraint_id=constraint_id,
+        cluster_id=cluster_id,
+        second_area_id=second_area_id,
+        file_name=file_name,
+    )
+
+    if not file_path.exists():
+        if ts_file_type not in OPTIONAL_MATRICES:
+            raise FileNotFoundError(f"File {file_path} not found")
+        size = 0
+    else:
+        size = file_path.stat().st_size
+
+    if size == 0:
+        row_count, column_count = DEFAULT_MATRIX_MAPPING[ts_file_type].shape
+        return MatrixInfo(rows=row_count, columns=column_count, size=0, is_default=True)
+
+    shape = cache.get_shape(file_path) if cache else None
+    if shape is None:
+        shape = _count_lines(file_path), len(_read_first_line(file_path).split("\t"))
+    return MatrixInfo(rows=shape[0], columns=shape[1], size=size, is_default=False)
 
 
 def write_timeseries(
@@ -170,7 +594,11 @@ def write_timeseries(
     second_area_id: Optional[str] = None,
     constraint_id: Optional[str] = None,
     file_name: Optional[str] = None,
+    cache: Optional[MatrixCache] = None,
+    memory_cache: Optional[MatrixMemoryCache] = None,
+    store: Optional[MatrixStore] = None,
 ) -> None:
+    """Writes a matrix of the study, creating its folder if needed."""
     series = pd.DataFrame() if series is None else series
 
     file_path = study_path / ts_file_type.value.format(
@@ -183,4 +611,19 @@ def write_timeseries(
 
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    pl.from_pandas(series).write_csv(file_path, separator="\t", include_header=False)
+    if file_path.exists() and file_path.stat().st_nlink > 1:
+        # The file shares its content with other matrices through a `MatrixStore`, it must not be modified in place.
+        file_path.unlink()
+
+    if series.empty:
+        # An empty file is read back as the default matrix, there's no need to go through polars.
+        file_path.write_bytes(b"")
+    elif store:
+        store.write(file_path, pl.from_pandas(series).write_csv(separator="\t", include_header=False).encode("utf-8"))
+    else:
+        pl.from_pandas(series).write_csv(file_path, separator="\t", include_header=False)
+
+    if cache:
+        cache.invalidate(file_path)
+    if memory_cache:
+        memory_cache.invalidate(str(file_path))
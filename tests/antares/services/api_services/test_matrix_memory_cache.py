@@ -0,0 +1,145 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+import requests_mock
+
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from antares.craft.api_conf.api_conf import APIconf
+from antares.craft.exceptions.exceptions import StudyMatrixDownloadError
+from antares.craft.model.area import Area
+from antares.craft.model.thermal import ThermalCluster
+from antares.craft.service.api_services.factory import create_api_services
+from antares.craft.tools.matrix_tool import MatrixFormat, TimeSeriesRequest
+from antares.craft.tools.time_series_tool import TimeSeriesFileType
+
+STUDY_ID = "22c52f44-4c2a-407b-862b-490887f93dd8"
+BASE_URL = "https://antares.com/api/v1"
+STUDY_URL = f"{BASE_URL}/studies/{STUDY_ID}"
+
+
+def arrow_content(value: float) -> bytes:
+    buffer = io.BytesIO()
+    pd.DataFrame({"0": [value, value]}).to_feather(buffer)
+    return buffer.getvalue()
+
+
+def raw_url(path: str) -> str:
+    return f"{STUDY_URL}/raw?path={path}&matrix_format=arrow compressed"
+
+
+class TestMatrixMemoryCache:
+    def setup_method(self) -> None:
+        self.api = APIconf("https://antares.com", "token", verify=False, matrix_memory_cache_size=10_000)
+        self.services = create_api_services(self.api, STUDY_ID)
+        self.area = Area(
+            "fr",
+            self.services.area_service,
+            self.services.short_term_storage_service,
+            self.services.thermal_service,
+            self.services.renewable_service,
+            self.services.hydro_service,
+        )
+
+    def test_deleted_area_matrices_are_downloaded_again(self) -> None:
+        with requests_mock.Mocker() as mocker:
+            matrix_url = raw_url("input/load/series/load_fr")
+            mocker.get(matrix_url, content=arrow_content(1))
+            assert self.area.get_load_matrix().iloc[0, 0] == 1
+            assert self.area.get_load_matrix().iloc[0, 0] == 1
+            assert mocker.call_count == 1
+
+            # The area is deleted then created again with other matrices
+            mocker.delete(f"{STUDY_URL}/areas/fr", status_code=200)
+            self.services.area_service.delete_area("fr", [])
+            mocker.get(matrix_url, content=arrow_content(2))
+            assert self.area.get_load_matrix().iloc[0, 0] == 2
+
+    def test_deleted_cluster_matrices_are_downloaded_again(self) -> None:
+        cluster = ThermalCluster(self.services.thermal_service, "fr", "gas")
+        other_cluster = ThermalCluster(self.services.thermal_service, "fr", "gas_2")
+        with requests_mock.Mocker() as mocker:
+            for thermal_cluster in [cluster, other_cluster]:
+                mocker.get(raw_url(f"input/thermal/series/fr/{thermal_cluster.id}/series"), content=arrow_content(1))
+                thermal_cluster.get_series_matrix()
+
+            mocker.delete(f"{STUDY_URL}/areas/fr/clusters/thermal", status_code=200)
+            self.services.area_service.delete_thermal_clusters("fr", [cluster])
+            for thermal_cluster in [cluster, other_cluster]:
+                mocker.get(raw_url(f"input/thermal/series/fr/{thermal_cluster.id}/series"), content=arrow_content(2))
+            matrix = cluster.get_series_matrix()
+            assert matrix.iloc[0, 0] == 2
+            # The other clusters of the area are still cached
+            matrix = other_cluster.get_series_matrix()
+            assert matrix.iloc[0, 0] == 1
+
+    def test_generated_thermal_series_are_downloaded_again(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        cluster = ThermalCluster(self.services.thermal_service, "fr", "gas")
+        with requests_mock.Mocker() as mocker:
+            matrix_url = raw_url("input/thermal/series/fr/gas/series")
+            mocker.get(matrix_url, content=arrow_content(1))
+            cluster.get_series_matrix()
+
+            mocker.put(f"{STUDY_URL}/timeseries/config", status_code=200)
+            mocker.put(f"{STUDY_URL}/timeseries/generate", json="task-id")
+            mocker.get(f"{BASE_URL}/tasks/task-id", json={"result": {"success": True}})
+            self.services.study_service.generate_thermal_timeseries(1, {}, 42)
+
+            mocker.get(matrix_url, content=arrow_content(2))
+            matrix = cluster.get_series_matrix()
+            assert matrix.iloc[0, 0] == 2
+
+    def test_read_many_matrices_use_the_cache(self) -> None:
+        requests = [
+            TimeSeriesRequest(TimeSeriesFileType.LOAD, area_id="fr"),
+            TimeSeriesRequest(TimeSeriesFileType.THERMAL_SERIES, area_id="fr", cluster_id="gas", columns=(0,)),
+            TimeSeriesRequest(TimeSeriesFileType.LOAD, area_id="fr"),
+        ]
+        with requests_mock.Mocker() as mocker:
+            mocker.get(raw_url("input/load/series/load_fr"), content=arrow_content(1))
+            mocker.get(raw_url("input/thermal/series/fr/gas/series"), content=arrow_content(2))
+            matrices = self.services.study_service.read_timeseries_many(requests, 2, MatrixFormat.PANDAS)
+            assert list(matrices) == requests[:2]
+            assert matrices[requests[0]].iloc[0, 0] == 1
+            assert matrices[requests[1]].iloc[0, 0] == 2
+            assert self.area.get_load_matrix().iloc[0, 0] == 1
+            assert mocker.call_count == 2
+
+            mocker.get(raw_url("input/load/series/load_be"), status_code=404)
+            with pytest.raises(StudyMatrixDownloadError, match="input/load/series/load_be"):
+                self.services.study_service.read_timeseries_many(
+                    [TimeSeriesRequest(TimeSeriesFileType.LOAD, area_id="be")], None, MatrixFormat.PANDAS
+                )
+
+    def test_read_matrix_columns(self) -> None:
+        df = pd.DataFrame(np.arange(6, dtype=float).reshape(2, 3), columns=["0", "1", "2"])
+        buffer = io.BytesIO()
+        df.to_feather(buffer)
+        with requests_mock.Mocker() as mocker:
+            mocker.get(raw_url("input/load/series/load_fr"), content=buffer.getvalue())
+            # Same semantics as the local matrices: the requested order is kept, with the indices as labels
+            matrix = self.area.get_load_matrix(columns=[2, 0])
+            assert matrix.columns.equals(pd.Index([2, 0]))
+            assert matrix.to_numpy().tolist() == [[2, 0], [5, 3]]
+            polars_matrix = self.area.get_load_matrix(columns=[2, 0], output_format=MatrixFormat.POLARS)
+            assert polars_matrix.to_numpy().tolist() == [[2, 0], [5, 3]]
+
+            with pytest.raises(ValueError, match="selected several times"):
+                self.area.get_load_matrix(columns=[1, 1])
+            for columns in [[3], [-1]]:
+                with pytest.raises(IndexError, match="out of bounds"):
+                    self.area.get_load_matrix(columns=columns)
@@ -0,0 +1,269 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+import requests_mock
+
+import io
+import threading
+import time
+import zipfile
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from antares.craft.api_conf.api_conf import APIconf
+from antares.craft.exceptions.exceptions import AggregateCreationError, TsNumbersOutputParsingError
+from antares.craft.model.output import (
+    AggregationFormat,
+    Frequency,
+    MCAllLinksDataType,
+    MCIndAreasDataType,
+    MCIndLinksDataType,
+    MCStatistic,
+    Output,
+    TsNumbersKind,
+)
+from antares.craft.service.api_services.factory import create_api_services
+from antares.craft.service.api_services.services.output import OUTPUT_DOWNLOAD_WORKERS
+from antares.craft.service.output_matrix_parsing import read_output_matrix
+
+STUDY_ID = "22c52f44-4c2a-407b-862b-490887f93dd8"
+BASE_URL = "https://antares.com/api/v1"
+STUDY_URL = f"{BASE_URL}/studies/{STUDY_ID}"
+OUTPUT_ID = "20201014-1425eco-goodbye"
+OUTPUT_ASSETS = Path(__file__).parents[1] / "local_services" / "output_service" / "assets" / "output.zip"
+DOWNLOAD_ID = "download-id"
+
+AGGREGATED_AREAS = pl.DataFrame(
+    {
+        "area": ["de", "fr", "de", "fr"] * 2,
+        "mcYear": [1, 1, 1, 1, 2, 2, 2, 2],
+        "timeId": [1, 1, 2, 2] * 2,
+        "LOAD": [10.0, 20.0, 11.0, 21.0, 30.0, 40.0, 31.0, 41.0],
+        "OV. COST": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+    }
+)
+
+
+def parquet_content(df: pl.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.write_parquet(buffer)
+    return buffer.getvalue()
+
+
+def zip_content(files: dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def aggregate_url(object_type: str, mc_type: str) -> str:
+    return f"{STUDY_URL}/outputs/{OUTPUT_ID}/aggregate/{object_type}/mc-{mc_type}"
+
+
+def mock_aggregation(mocker: requests_mock.Mocker, object_type: str, mc_type: str, df: pl.DataFrame) -> None:
+    mocker.get(aggregate_url(object_type, mc_type), json=DOWNLOAD_ID)
+    mocker.get(f"{BASE_URL}/downloads/{DOWNLOAD_ID}/metadata", json={})
+    mocker.get(f"{BASE_URL}/downloads/{DOWNLOAD_ID}", content=parquet_content(df))
+
+
+class TestOutputApi:
+    def setup_method(self) -> None:
+        self.api = APIconf("https://antares.com", "token", verify=False)
+        self.services = create_api_services(self.api, STUDY_ID)
+        self.output = Output(OUTPUT_ID, False, self.services.output_service)
+
+    def test_aggregate_values_formats(self) -> None:
+        with requests_mock.Mocker() as mocker:
+            mock_aggregation(mocker, "areas", "ind", AGGREGATED_AREAS)
+
+            # The downloaded parquet file is decoded in the requested format
+            polars_df = self.output.aggregate_mc_ind_areas(
+                MCIndAreasDataType.VALUES,
+                Frequency.HOURLY,
+                mc_years=[1, 2],
+                areas_ids=["de", "fr"],
+                columns_names=["LOAD"],
+                output_format=AggregationFormat.POLARS,
+            )
+            assert isinstance(polars_df, pl.DataFrame)
+            assert polars_df.equals(AGGREGATED_AREAS)
+            aggregate_request = mocker.request_history[0]
+            assert aggregate_request.path == f"/api/v1/studies/{STUDY_ID}/outputs/{OUTPUT_ID}/aggregate/areas/mc-ind"
+            assert aggregate_request.qs == {
+                "query_file": ["values"],
+                "frequency": ["hourly"],
+                "mc_years": ["1,2"],
+                "areas_ids": ["de,fr"],
+                "columns_names": ["load"],
+                "format": ["parquet"],
+            }
+            # The aggregation is downloaded once the server made it available
+            assert mocker.call_count == 3
+            assert mocker.request_history[1].qs == {"wait_for_availability": ["true"]}
+
+            arrow_table = self.output.aggregate_mc_ind_areas(
+                MCIndAreasDataType.VALUES, Frequency.HOURLY, output_format=AggregationFormat.ARROW
+            )
+            assert isinstance(arrow_table, pa.Table)
+            assert pl.DataFrame(arrow_table).equals(AGGREGATED_AREAS)
+
+            pandas_df = self.output.aggregate_mc_ind_areas(MCIndAreasDataType.VALUES, Frequency.HOURLY)
+            assert isinstance(pandas_df, pd.DataFrame)
+            pd.testing.assert_frame_equal(pandas_df, AGGREGATED_AREAS.to_pandas())
+
+            mocker.get(aggregate_url("areas", "ind"), status_code=404, json={"description": "Output not found"})
+            with pytest.raises(AggregateCreationError, match="Output not found"):
+                self.output.aggregate_mc_ind_areas(
+                    MCIndAreasDataType.VALUES, Frequency.HOURLY, output_format=AggregationFormat.POLARS
+                )
+
+    def test_aggregate_values_to_parquet(self, tmp_path: Path) -> None:
+        with requests_mock.Mocker() as mocker:
+            mock_aggregation(mocker, "areas", "ind", AGGREGATED_AREAS)
+
+            # The downloaded aggregation is partitioned by Monte Carlo year
+            lf = self.output.aggregate_mc_ind_areas_to_parquet(
+                tmp_path / "areas", MCIndAreasDataType.VALUES, Frequency.HOURLY
+            )
+            assert sorted(path.name for path in (tmp_path / "areas").iterdir()) == ["mcYear=1", "mcYear=2"]
+            df = lf.collect().select(AGGREGATED_AREAS.columns).sort("mcYear", "timeId", "area")
+            assert df.equals(AGGREGATED_AREAS.sort("mcYear", "timeId", "area"))
+
+            links_df = pl.DataFrame({"link": ["de - fr", "fr - it"], "timeId": [1, 1], "FLOW LIN.": [1.0, 2.0]})
+            mock_aggregation(mocker, "links", "all", links_df)
+            lf = self.output.aggregate_mc_all_links_to_parquet(
+                tmp_path / "links", MCAllLinksDataType.VALUES, Frequency.ANNUAL
+            )
+            assert lf.collect().equals(links_df)
+            assert mocker.request_history[-3].path.endswith("/aggregate/links/mc-all")
+
+    def test_compute_mc_statistics(self) -> None:
+        with requests_mock.Mocker() as mocker:
+            mock_aggregation(mocker, "areas", "ind", AGGREGATED_AREAS)
+
+            # The individual results are downloaded at once then split by Monte Carlo year
+            df = self.output.compute_mc_statistics(
+                MCIndAreasDataType.VALUES, Frequency.HOURLY, stats=[MCStatistic.MEAN, MCStatistic.MAX]
+            )
+            expected_df = pd.DataFrame(
+                {
+                    "area": ["de", "fr", "de", "fr"],
+                    "timeId": [1, 1, 2, 2],
+                    "LOAD EXP": [20.0, 30.0, 21.0, 31.0],
+                    "LOAD MAX": [30.0, 40.0, 31.0, 41.0],
+                    "OV. COST EXP": [3.0, 4.0, 5.0, 6.0],
+                    "OV. COST MAX": [5.0, 6.0, 7.0, 8.0],
+                }
+            )
+            pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
+            assert mocker.request_history[0].path.endswith("/aggregate/areas/mc-ind")
+
+            # Years weighing 0 are ignored
+            df = self.output.compute_mc_statistics(
+                MCIndAreasDataType.VALUES, Frequency.HOURLY, stats=[MCStatistic.MEAN], weights={2: 0}
+            )
+            assert df["LOAD EXP"].tolist() == [10.0, 20.0, 11.0, 21.0]
+
+    def test_get_all_ts_numbers(self) -> None:
+        url = f"{STUDY_URL}/raw/original-file?path=output/{OUTPUT_ID}/ts-numbers/thermal"
+        expected_df = pd.DataFrame(
+            {"de/gas": [1, 2, 1], "fr/nuclear": [3, 1, 2]}, index=pd.RangeIndex(1, 4, name="mcYear"), dtype="int32"
+        )
+        with requests_mock.Mocker() as mocker:
+            # The whole folder is downloaded at once as a zip archive
+            files = {"de/gas.txt": "size:1x3\n1\n2\n1\n", "fr/nuclear.txt": "size:1x3\n3\n1\n2\n"}
+            mocker.get(url, content=zip_content(files))
+            pd.testing.assert_frame_equal(self.output.get_all_ts_numbers(TsNumbersKind.THERMAL), expected_df)
+            assert mocker.call_count == 1
+
+            # The archive may hold the folder itself
+            mocker.get(url, content=zip_content({f"thermal/{name}": content for name, content in files.items()}))
+            pd.testing.assert_frame_equal(self.output.get_all_ts_numbers(TsNumbersKind.THERMAL), expected_df)
+
+            mocker.get(url, content=b"not an archive")
+            with pytest.raises(TsNumbersOutputParsingError, match="thermal ts-numbers"):
+                self.output.get_all_ts_numbers(TsNumbersKind.THERMAL)
+
+            mocker.get(url, status_code=404, json={"description": "Folder not found"})
+            with pytest.raises(TsNumbersOutputParsingError, match="Folder not found"):
+                self.output.get_all_ts_numbers(TsNumbersKind.THERMAL)
+
+    def test_get_matrices(self) -> None:
+        # Output files of the API paths, where links are written `area_from/area_to`
+        with zipfile.ZipFile(OUTPUT_ASSETS) as archive:
+            contents = {
+                f"mc-ind/0000{mc_year}/{object_type}/{api_id}/values-hourly": archive.read(
+                    f"output/{OUTPUT_ID}/economy/mc-ind/0000{mc_year}/{object_type}/{local_id}/values-hourly.txt"
+                )
+                for mc_year in [1, 2]
+                for object_type, api_id, local_id in [
+                    ("areas", "de", "de"),
+                    ("areas", "fr", "fr"),
+                    ("links", "de/fr", "de - fr"),
+                ]
+            }
+        threads: set[int] = set()
+
+        def respond(request: requests_mock.request._RequestObjectProxy, context: object) -> bytes:
+            threads.add(threading.get_ident())
+            # requests_mock handles one request at a time: the other files are submitted to the workers meanwhile
+            time.sleep(0.05)
+            return contents[request.url.split("path=", 1)[1].removeprefix(f"output/{OUTPUT_ID}/economy/")]
+
+        with requests_mock.Mocker() as mocker:
+            mocker.get(f"{STUDY_URL}/raw/original-file", content=respond)
+            df = self.output.get_mc_ind_areas([1, 2], Frequency.HOURLY, MCIndAreasDataType.VALUES, ["de", "fr"])
+
+            # The files are downloaded by several workers sharing the session of the service
+            assert mocker.call_count == 4
+            assert 1 < len(threads) <= OUTPUT_DOWNLOAD_WORKERS
+            assert threading.get_ident() not in threads
+            assert all(request.headers["Authorization"] == "Bearer token" for request in mocker.request_history)
+
+            expected_df = read_output_matrix(contents["mc-ind/00002/areas/fr/values-hourly"], Frequency.HOURLY)
+            fr_df = df.xs((2, "fr"))
+            assert isinstance(fr_df, pd.DataFrame)
+            assert fr_df.index.tolist() == list(range(1, len(expected_df) + 1))
+            assert fr_df.reset_index(drop=True).equals(expected_df)
+
+            links_df = self.output.get_mc_ind_links([1, 2], Frequency.HOURLY, MCIndLinksDataType.VALUES, [("de", "fr")])
+            expected_df = read_output_matrix(contents["mc-ind/00001/links/de/fr/values-hourly"], Frequency.HOURLY)
+            link_df = links_df.xs((1, "de - fr"))
+            assert isinstance(link_df, pd.DataFrame)
+            assert link_df.reset_index(drop=True).equals(expected_df)
+
+    def test_to_cube(self, tmp_path: Path) -> None:
+        with requests_mock.Mocker() as mocker:
+            mock_aggregation(mocker, "areas", "ind", AGGREGATED_AREAS)
+
+            # The downloaded aggregation is scattered by Monte Carlo year, time step and area
+            cube = self.output.to_cube(["load", "MRG. PRICE"], MCIndAreasDataType.VALUES, Frequency.HOURLY)
+            assert cube.mc_years == [1, 2]
+            assert cube.ids == ["de", "fr"]
+            assert list(cube.values) == ["load", "MRG. PRICE"]
+            assert cube.values["load"].tolist() == [[[10.0, 20.0], [11.0, 21.0]], [[30.0, 40.0], [31.0, 41.0]]]
+            assert np.isnan(cube.values["MRG. PRICE"]).all()
+            assert mocker.request_history[0].path.endswith("/aggregate/areas/mc-ind")
+            assert mocker.request_history[0].qs["columns_names"] == ["load,mrg. price"]
+
+            cube = self.output.to_cube(
+                ["LOAD"], MCIndAreasDataType.VALUES, Frequency.HOURLY, dtype=np.float32, memmap_dir=tmp_path
+            )
+            assert cube.values["LOAD"].dtype == np.float32
+            np.testing.assert_array_equal(np.load(tmp_path / "LOAD.npy", mmap_mode="r"), cube.values["LOAD"])
@@ -12,26 +12,59 @@
 import pytest
 
 import dataclasses
+import json
+import os
+import shutil
+import threading
 import zipfile
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 
 from antares.craft import LocalConfiguration, Study
 from antares.craft.exceptions.exceptions import OutputDataRetrievalError
 from antares.craft.model.commons import STUDY_VERSION_8_8
 from antares.craft.model.output import (
+    AggregationFormat,
     Frequency,
     MCAllAreasDataType,
     MCAllLinksDataType,
     MCIndAreasDataType,
     MCIndLinksDataType,
+    MCStatistic,
     Output,
+    TsNumbersKind,
 )
 from antares.craft.service.local_services.factory import create_local_services
-from antares.craft.service.output_matrix_parsing import read_output_matrix
+from antares.craft.service.local_services.services.output import output as local_output
+from antares.craft.service.local_services.services.output import output_aggregation, output_catalog
+from antares.craft.service.local_services.services.output.incremental_aggregation import (
+    LEDGER_FILE_NAME,
+    IncrementalAggregator,
+)
+from antares.craft.service.local_services.services.output.output_catalog import OutputCatalog
+from antares.craft.service.local_services.services.output.output_store import (
+    MANIFEST_FILE_NAME,
+    STORE_POINTER_SUFFIX,
+    OutputStore,
+    StoredOutputs,
+)
+from antares.craft.service.mc_statistics import compute_mc_statistics
+from antares.craft.service.output_cube import build_cube_from_table
+from antares.craft.service.output_matrix_parsing import (
+    HeaderCache,
+    get_start_column,
+    parse_output_file,
+    read_output_matrix,
+    reshape_details_output,
+)
 
 ASSETS_DIR = Path(__file__).parent / "assets"
 
@@ -355,9 +388,13 @@ LINKS_REQUESTS__IND = [
 ]
 
 
-def setup_output(tmp_path: Path, output_id: str) -> Output:
+def setup_output(
+    tmp_path: Path, output_id: str, output_aggregation_workers: int = 1, matrix_cache_dir: Optional[Path] = None
+) -> Output:
     study_name = "studyTest"
-    config = LocalConfiguration(tmp_path, study_name)
+    config = LocalConfiguration(
+        tmp_path, study_name, matrix_cache_dir=matrix_cache_dir, output_aggregation_workers=output_aggregation_workers
+    )
     services = create_local_services(config, study_name, STUDY_VERSION_8_8)
     output_service = services.output_service
 
@@ -401,6 +438,9 @@ class TestOutput:
         dataframe = output_2.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
         assert dataframe.equals(expected_dataframe)
 
+        # Raw contents (e.g. downloaded from AntaresWeb) are parsed the same way
+        assert read_output_matrix(matrix_path.read_bytes(), Frequency.HOURLY).equals(expected_dataframe)
+
         # Ensures we raise if the link is given in the wrong order
         with pytest.raises(
             OutputDataRetrievalError,
@@ -408,6 +448,234 @@ class TestOutput:
         ):
             output_2.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "fr", "de")
 
+    def test_parse_output_file_columns(self, tmp_path: Path) -> None:
+        setup_output(tmp_path, "20201014-1422eco-hello")
+        matrix_path = (
+            tmp_path / "studyTest/output/20201014-1422eco-hello/economy/mc-ind/00001/areas/fr/values-hourly.txt"
+        )
+        first_column = get_start_column(Frequency.HOURLY)
+        full_output = parse_output_file(matrix_path, first_column)
+
+        # Only the selected columns are parsed
+        output = parse_output_file(
+            matrix_path,
+            first_column,
+            lambda headers: [k for k, header in enumerate(headers) if header[0] in {"LOAD", "MRG. PRICE"}],
+        )
+        assert [header[0] for header in output.headers] == ["MRG. PRICE", "LOAD"]
+        load_index = next(k for k, header in enumerate(full_output.headers) if header[0] == "LOAD")
+        assert output.data.to_series(1).equals(full_output.data.to_series(load_index))
+
+        # Without any selected column, the whole file is parsed to keep its rows
+        output = parse_output_file(matrix_path, first_column, lambda headers: [])
+        assert output.headers == full_output.headers
+        assert output.data.equals(full_output.data)
+
+    def test_header_cache(self, tmp_path: Path) -> None:
+        setup_output(tmp_path, "20201014-1422eco-hello")
+        areas_path = tmp_path / "studyTest/output/20201014-1422eco-hello/economy/mc-ind/00001/areas"
+        first_column = get_start_column(Frequency.HOURLY)
+        header_cache = HeaderCache(max_size=1)
+
+        # Files with the same headers share their parsed headers and the objects built from them
+        fr_output = parse_output_file(areas_path / "fr/values-hourly.txt", first_column, header_cache=header_cache)
+        de_output = parse_output_file(areas_path / "de/values-hourly.txt", first_column, header_cache=header_cache)
+        assert de_output.output_headers is fr_output.output_headers
+        assert de_output.output_headers.multi_index() is fr_output.output_headers.multi_index()
+        assert fr_output.data.equals(parse_output_file(areas_path / "fr/values-hourly.txt", first_column).data)
+
+        # As well as the columns selection
+        def select_load(headers: list[list[str]]) -> list[int]:
+            return [k for k, header in enumerate(headers) if header[0] == "LOAD"]
+
+        fr_output = parse_output_file(areas_path / "fr/values-hourly.txt", first_column, select_load, header_cache)
+        de_output = parse_output_file(areas_path / "de/values-hourly.txt", first_column, select_load, header_cache)
+        assert fr_output.headers == [["LOAD", "MWh", ""]]
+        assert de_output.output_headers is fr_output.output_headers
+
+        # Only the last used headers are kept
+        details_output = parse_output_file(
+            areas_path / "fr/details-hourly.txt", first_column, header_cache=header_cache
+        )
+        fr_output = parse_output_file(areas_path / "fr/values-hourly.txt", first_column, header_cache=header_cache)
+        assert fr_output.output_headers is not de_output.output_headers
+        assert details_output.headers != fr_output.headers
+
+    def test_reshape_details_output(self) -> None:
+        headers = [["b", "NODU", "EXP"], ["b", "MWh", "EXP"], ["a", "MWh", "EXP"]]
+        content = "\n".join(
+            ["area\tde\tannual", "", "", ""]
+            + ["\t\t" + "\t".join(header[k] for header in headers) for k in range(3)]
+            + ["\tde\t1\t10\t100", "\tde\tN/A\t20\t200"]
+        )
+        output = parse_output_file(content.encode("utf-8"), get_start_column(Frequency.ANNUAL))
+
+        # Clusters become rows, ordered by time then cluster, and variables become sorted columns
+        expected_df = pl.DataFrame(
+            {
+                "cluster": ["a", "b", "a", "b"],
+                "timeId": [1, 1, 2, 2],
+                "MWh": [100.0, 10.0, 200.0, 20.0],
+                "NODU": [None, 1.0, None, None],
+            }
+        )
+        assert reshape_details_output(output).equals(expected_df)
+
+    def test_output_catalog(self, tmp_path: Path) -> None:
+        output_name = "20201014-1422eco-hello"
+        output = setup_output(tmp_path, output_name)
+        output_path = tmp_path / "studyTest" / "output" / output_name
+
+        output.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+
+        # The catalog is persisted in the cache folder and reused, the output folder is left untouched
+        cache_dir = tmp_path / "cache"
+        output_files = sorted(output_path.rglob("*"))
+        OutputCatalog.load(output_path, cache_dir)
+        assert sorted(output_path.rglob("*")) == output_files
+        assert len(list((cache_dir / "outputs").iterdir())) == 1
+        catalog = OutputCatalog.load(output_path, cache_dir)
+        assert catalog.is_up_to_date()
+        assert catalog.mc_years() == [1]
+        values_file = "economy/mc-ind/00001/links/de - fr/values-hourly.txt"
+        assert catalog.file_size(values_file) == (output_path / values_file).stat().st_size
+        assert catalog.has_folder("economy/mc-ind/00001/links")
+        assert not catalog.has_file("economy/mc-ind/00001/links/de - fr/values-daily.txt")
+
+        # Missing files are detected without reading them
+        with pytest.raises(OutputDataRetrievalError, match="values-daily.txt does not exist"):
+            output.get_mc_ind_link(1, Frequency.DAILY, MCIndLinksDataType.VALUES, "de", "fr")
+
+        # A new Monte Carlo year makes the catalog outdated
+        shutil.copytree(output_path / "economy" / "mc-ind" / "00001", output_path / "economy" / "mc-ind" / "00002")
+        assert not catalog.is_up_to_date()
+        df = output.aggregate_mc_ind_links(MCIndLinksDataType.VALUES, Frequency.HOURLY, mc_years=[2])
+        assert set(df["mcYear"]) == {2}
+
+        # Without `execution_info.ini`, the simulation may still be adding files to the folders of a year:
+        # the folder of a missing file is listed again.
+        year_path = output_path / "economy" / "mc-ind" / "00003"
+        shutil.copytree(output_path / "economy" / "mc-ind" / "00001", year_path)
+        link_path = year_path / "links" / "de - fr"
+        (link_path / "values-hourly.txt").rename(tmp_path / "values-hourly.txt")
+        with pytest.raises(OutputDataRetrievalError, match="values-hourly.txt does not exist"):
+            output.get_mc_ind_link(3, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+        (tmp_path / "values-hourly.txt").rename(link_path / "values-hourly.txt")
+        assert output.get_mc_ind_link(3, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr").equals(
+            output.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+        )
+
+        # An ended simulation only checks the top-level folders
+        (output_path / "execution_info.ini").touch()
+        catalog = OutputCatalog.load(output_path, cache_dir)
+        os.utime(link_path, ns=(0, 0))
+        assert catalog.is_up_to_date()
+
+    def test_output_catalog_resolved_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output = setup_output(tmp_path, "20201014-1422eco-hello")
+        builds: list[Path] = []
+        checks: list[Path] = []
+        build = OutputCatalog.build.__func__  # type: ignore[attr-defined]
+        is_up_to_date = OutputCatalog.is_up_to_date
+
+        def counting_build(cls: type[OutputCatalog], output_path: Path) -> OutputCatalog:
+            builds.append(output_path)
+            return build(cls, output_path)  # type: ignore[no-any-return]
+
+        def counting_is_up_to_date(catalog: OutputCatalog) -> bool:
+            checks.append(catalog.output_path)
+            return is_up_to_date(catalog)
+
+        monkeypatch.setattr(OutputCatalog, "build", classmethod(counting_build))
+        monkeypatch.setattr(OutputCatalog, "is_up_to_date", counting_is_up_to_date)
+
+        # The catalog is built by the first read only, then each of the other reads checks it once
+        reads = 5
+        for _ in range(reads):
+            output.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+            output.get_mc_ind_area(1, Frequency.HOURLY, MCIndAreasDataType.VALUES, "fr")
+        output.aggregate_mc_ind_areas(MCIndAreasDataType.VALUES, Frequency.HOURLY)
+        assert len(builds) == 1
+        assert len(checks) == 2 * reads
+
+    def test_output_catalog_lists_folders_lazily(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output_name = "20201014-1422eco-hello"
+        output = setup_output(tmp_path, output_name)
+        output_path = tmp_path / "studyTest" / "output" / output_name
+        link_path = output_path / "economy" / "mc-ind" / "00001" / "links" / "de - fr"
+        listed: list[Path] = []
+        scan_folder = output_catalog._scan_folder
+
+        def spying_scan_folder(folder: Path) -> dict[str, bool]:
+            listed.append(folder)
+            return scan_folder(folder)
+
+        monkeypatch.setattr(output_catalog, "_scan_folder", spying_scan_folder)
+
+        # Reading a file only lists its folder, once
+        for _ in range(2):
+            output.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+        assert listed == [link_path]
+
+        # A file missing from a running simulation only lists its folder again,
+        # after checking whether the simulation ended
+        listed.clear()
+        with pytest.raises(OutputDataRetrievalError, match="values-daily.txt does not exist"):
+            output.get_mc_ind_link(1, Frequency.DAILY, MCIndLinksDataType.VALUES, "de", "fr")
+        assert listed == [output_path, link_path]
+
+        # Aggregating the links doesn't list the folders of the areas, and lists the other folders once
+        listed.clear()
+        output.aggregate_mc_ind_links(MCIndLinksDataType.VALUES, Frequency.HOURLY)
+        year_path = output_path / "economy" / "mc-ind" / "00001"
+        other_link_paths = [folder for folder in (year_path / "links").iterdir() if folder != link_path]
+        expected_folders = [output_path / "economy", year_path.parent, year_path / "links", *other_link_paths]
+        assert sorted(listed) == sorted(expected_folders)
+
+    def test_archived_output(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output_name = "20201014-1422eco-hello"
+        output = setup_output(tmp_path, output_name)
+        output_path = tmp_path / "studyTest" / "output" / output_name
+        shutil.make_archive(str(output_path.with_name(f"{output_name}-archived")), "zip", output_path)
+        archived_output = Output(f"{output_name}-archived.zip", True, output._output_service)
+
+        # Archived results are read in place and are the same as the extracted ones
+        expected_df = output.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+        df = archived_output.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+        assert df.equals(expected_df)
+
+        expected_df = output.aggregate_mc_ind_areas(MCIndAreasDataType.DETAILS, Frequency.HOURLY)
+        df = archived_output.aggregate_mc_ind_areas(MCIndAreasDataType.DETAILS, Frequency.HOURLY)
+        pd.testing.assert_frame_equal(df, expected_df)
+
+        # The members of the archive are read by several threads at once
+        archive_path = output_path.with_name(f"{output_name}-archived.zip")
+        catalog = OutputCatalog.load(archive_path)
+        values_file = "economy/mc-ind/00001/links/de - fr/values-hourly.txt"
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            contents = list(executor.map(catalog.file_source, [values_file] * 8))
+        assert contents == [(output_path / values_file).read_bytes()] * 8
+        catalog.close()
+
+        # The catalog of a modified archive is replaced, and the previous one closes the archive
+        closed: list[Path] = []
+        close = OutputCatalog.close
+
+        def spying_close(catalog: OutputCatalog) -> None:
+            closed.append(catalog.output_path)
+            close(catalog)
+
+        monkeypatch.setattr(OutputCatalog, "close", spying_close)
+        os.utime(archive_path, ns=(0, 0))
+        archived_output.get_mc_ind_link(1, Frequency.HOURLY, MCIndLinksDataType.VALUES, "de", "fr")
+        assert closed == [archive_path]
+
+        # As well as the ts-numbers, here in an archive produced by the simulator
+        adequacy_output = setup_output(tmp_path, "20201014-1430adq-2.zip")
+        assert adequacy_output.get_load_ts_numbers("fr") == output.get_load_ts_numbers("fr")
+        with pytest.raises(OutputDataRetrievalError, match="fake.txt does not exist"):
+            adequacy_output.get_load_ts_numbers("fake")
+
     @pytest.mark.parametrize("params,expected_result_filename", AREAS_REQUESTS__ALL)
     def test_area_aggregate_mc_all(
         self, tmp_path: Path, params: TestParamsAreas, expected_result_filename: str
@@ -429,11 +697,24 @@ class TestOutput:
 
         pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
 
+        # The Arrow aggregation doesn't go through pandas but gives the same result
+        table = output.aggregate_mc_all_areas(
+            MCAllAreasDataType(params.query_file),
+            params.frequency,
+            areas_ids=params.type_ids,
+            columns_names=params.columns_names,
+            output_format=AggregationFormat.ARROW,
+        )
+        assert isinstance(table, pa.Table)
+        pd.testing.assert_frame_equal(table.to_pandas(), expected_df, check_dtype=False)
+
+    @pytest.mark.parametrize("workers", [1, 3])
     @pytest.mark.parametrize("params,expected_result_filename", AREAS_REQUESTS__IND)
     def test_area_aggregate_mc_ind(
-        self, tmp_path: Path, params: TestParamsAreas, expected_result_filename: str
+        self, tmp_path: Path, params: TestParamsAreas, expected_result_filename: str, workers: int
     ) -> None:
-        output = setup_output(tmp_path, params.output_id)
+        # The aggregated rows don't depend on the number of workers parsing the files
+        output = setup_output(tmp_path, params.output_id, output_aggregation_workers=workers)
 
         df = output.aggregate_mc_ind_areas(
             MCIndAreasDataType(params.query_file),
@@ -451,6 +732,17 @@ class TestOutput:
 
         pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
 
+        polars_df = output.aggregate_mc_ind_areas(
+            MCIndAreasDataType(params.query_file),
+            params.frequency,
+            areas_ids=params.type_ids,
+            columns_names=params.columns_names,
+            mc_years=params.mc_years,
+            output_format=AggregationFormat.POLARS,
+        )
+        assert isinstance(polars_df, pl.DataFrame)
+        pd.testing.assert_frame_equal(polars_df.to_pandas(), expected_df, check_dtype=False)
+
     @pytest.mark.parametrize("params,expected_result_filename", LINKS_REQUESTS__ALL)
     def test_link_aggregate_mc_all(
         self, tmp_path: Path, params: TestParamsLinks, expected_result_filename: str
@@ -472,11 +764,12 @@ class TestOutput:
 
         pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
 
+    @pytest.mark.parametrize("workers", [1, 3])
     @pytest.mark.parametrize("params,expected_result_filename", LINKS_REQUESTS__IND)
     def test_link_aggregate_mc_ind(
-        self, tmp_path: Path, params: TestParamsLinks, expected_result_filename: str
+        self, tmp_path: Path, params: TestParamsLinks, expected_result_filename: str, workers: int
     ) -> None:
-        output = setup_output(tmp_path, params.output_id)
+        output = setup_output(tmp_path, params.output_id, output_aggregation_workers=workers)
 
         df = output.aggregate_mc_ind_links(
             MCIndLinksDataType(params.query_file),
@@ -493,3 +786,495 @@ class TestOutput:
         expected_df = pd.read_csv(resource_file, sep="\t", header=0)
 
         pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
+
+    @pytest.mark.parametrize("params,expected_result_filename", AREAS_REQUESTS__IND)
+    def test_area_aggregate_mc_ind_to_parquet(
+        self, tmp_path: Path, params: TestParamsAreas, expected_result_filename: str
+    ) -> None:
+        output = setup_output(tmp_path, params.output_id)
+        dataset_path = tmp_path / "dataset"
+
+        lazy_df = output.aggregate_mc_ind_areas_to_parquet(
+            dataset_path,
+            MCIndAreasDataType(params.query_file),
+            params.frequency,
+            areas_ids=params.type_ids,
+            columns_names=params.columns_names,
+            mc_years=params.mc_years,
+        )
+
+        expected_df = pd.read_csv(
+            Path(ASSETS_DIR) / "aggregate_areas_raw_data" / expected_result_filename, sep="\t", header=0
+        )
+        # The dataset is partitioned by Monte-Carlo year, each year keeping the aggregation order
+        assert sorted(p.name for p in dataset_path.iterdir()) == sorted(
+            f"mcYear={year}" for year in expected_df["mcYear"].unique()
+        )
+        df = lazy_df.collect().to_pandas().sort_values("mcYear", kind="stable", ignore_index=True)
+        expected_df = expected_df.sort_values("mcYear", kind="stable", ignore_index=True)
+        pd.testing.assert_frame_equal(df, expected_df, check_dtype=False)
+
+        with pytest.raises(FileExistsError):
+            output.aggregate_mc_ind_areas_to_parquet(dataset_path, MCIndAreasDataType.VALUES, params.frequency)
+
+    def test_link_aggregate_mc_all_to_parquet(self, tmp_path: Path) -> None:
+        params, expected_result_filename = LINKS_REQUESTS__ALL[0]
+        output = setup_output(tmp_path, params.output_id)
+
+        lazy_df = output.aggregate_mc_all_links_to_parquet(
+            tmp_path / "dataset",
+            MCAllLinksDataType(params.query_file),
+            params.frequency,
+            links_ids=params.type_ids,
+            columns_names=params.columns_names,
+        )
+
+        expected_df = pd.read_csv(
+            Path(ASSETS_DIR) / "aggregate_links_raw_data" / expected_result_filename, sep="\t", header=0
+        )
+        pd.testing.assert_frame_equal(lazy_df.collect().to_pandas(), expected_df, check_dtype=False)
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_compute_mc_statistics(self, tmp_path: Path, workers: int) -> None:
+        output = setup_output(tmp_path, "20201014-1425eco-goodbye", output_aggregation_workers=workers)
+        columns = ["OP. COST", "LOAD"]
+
+        statistics = output.compute_mc_statistics(
+            MCIndAreasDataType.VALUES,
+            Frequency.HOURLY,
+            columns_names=columns,
+            stats=[MCStatistic.MEAN, MCStatistic.STD, MCStatistic.MIN, MCStatistic.MAX],
+            quantiles=[0.5],
+        )
+
+        # Same statistics as the ones computed on the whole aggregation
+        df = output.aggregate_mc_ind_areas(MCIndAreasDataType.VALUES, Frequency.HOURLY, columns_names=columns)
+        grouped = df.groupby(["area", "timeId"], sort=False)
+        expected_df = grouped[columns].first().reset_index()[["area", "timeId"]]
+        for column in columns:
+            expected_df[f"{column} EXP"] = grouped[column].mean().to_numpy()
+            expected_df[f"{column} STD"] = grouped[column].std(ddof=0).to_numpy()
+            expected_df[f"{column} MIN"] = grouped[column].min().to_numpy()
+            expected_df[f"{column} MAX"] = grouped[column].max().to_numpy()
+            expected_df[f"{column} Q50"] = grouped[column].median().to_numpy()
+        pd.testing.assert_frame_equal(statistics, expected_df, check_dtype=False)
+
+        # Weighted mean of the links values
+        link_df = output.aggregate_mc_ind_links(MCIndLinksDataType.VALUES, Frequency.HOURLY, links_ids=[("fr", "de")])
+        link_statistics = output.compute_mc_statistics(
+            MCIndLinksDataType.VALUES,
+            Frequency.HOURLY,
+            columns_names=["FLOW LIN."],
+            stats=[MCStatistic.MEAN],
+            weights={1: 3, 2: 1},
+            ids=[("fr", "de")],
+        )
+        assert list(link_statistics.columns) == ["link", "timeId", "FLOW LIN. EXP"]
+        year_values = [link_df[link_df["mcYear"] == year]["FLOW LIN."].to_numpy() for year in [1, 2]]
+        assert link_statistics["FLOW LIN. EXP"].to_numpy() == pytest.approx((3 * year_values[0] + year_values[1]) / 4)
+
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            output.compute_mc_statistics(MCIndAreasDataType.VALUES, Frequency.HOURLY, quantiles=[50])
+        with pytest.raises(ValueError, match="weights"):
+            output.compute_mc_statistics(MCIndAreasDataType.VALUES, Frequency.HOURLY, quantiles=[0.5], weights={1: 2})
+
+    def test_mc_statistics_quantiles_estimation(self) -> None:
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=(1000, 50))
+        year_dfs = (
+            (year, pl.DataFrame({"area": ["fr"] * 50, "timeId": range(1, 51), "LOAD": year_values}))
+            for year, year_values in enumerate(values, start=1)
+        )
+
+        statistics = compute_mc_statistics(year_dfs, [MCStatistic.MEAN], quantiles=[0.1, 0.5, 0.9])
+
+        assert statistics["LOAD EXP"].to_numpy() == pytest.approx(values.mean(axis=0))
+        # The P² estimation stays close to the exact quantiles
+        for quantile in [0.1, 0.5, 0.9]:
+            error = np.abs(statistics[f"LOAD Q{quantile * 100:g}"].to_numpy() - np.quantile(values, quantile, axis=0))
+            assert error.mean() < 0.05
+
+    def test_mc_statistics_zero_weights(self) -> None:
+        values = np.array([[1.0, 5.0], [-10.0, 50.0], [3.0, 2.0]])
+        year_dfs = (
+            (year, pl.DataFrame({"area": ["fr", "fr"], "timeId": [1, 2], "LOAD": year_values}))
+            for year, year_values in enumerate(values, start=1)
+        )
+
+        stats = [MCStatistic.MEAN, MCStatistic.MIN, MCStatistic.MAX]
+        statistics = compute_mc_statistics(year_dfs, stats, weights={2: 0})
+
+        # The second year weighs nothing, so it drives none of the statistics
+        assert statistics["LOAD EXP"].to_list() == pytest.approx([2.0, 3.5])
+        assert statistics["LOAD MIN"].to_list() == [1.0, 2.0]
+        assert statistics["LOAD MAX"].to_list() == [3.0, 5.0]
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_get_all_ts_numbers(self, tmp_path: Path, workers: int) -> None:
+        output_name = "20201014-1422eco-hello"
+        output = setup_output(tmp_path, output_name, output_aggregation_workers=workers)
+
+        thermal_ts_numbers = output.get_all_ts_numbers(TsNumbersKind.THERMAL)
+        assert thermal_ts_numbers.shape == (1, 36)
+        assert thermal_ts_numbers.index.name == "mcYear"
+        assert thermal_ts_numbers["fr/07_gas"].to_dict() == output.get_thermal_ts_numbers("fr", "07_gas")
+
+        # One column per object and one row per Monte-Carlo year
+        load_folder = tmp_path / "studyTest" / "output" / output_name / "ts-numbers" / "load"
+        for k, area_id in enumerate(["de", "es", "fr", "it"]):
+            (load_folder / f"{area_id}.txt").write_text("size:1x3\n" + "\n".join(str(k + year) for year in range(3)))
+        load_ts_numbers = output.get_all_ts_numbers(TsNumbersKind.LOAD)
+        assert load_ts_numbers.dtypes.unique().tolist() == [np.int32]
+        expected_df = pd.DataFrame(
+            {"de": [0, 1, 2], "es": [1, 2, 3], "fr": [2, 3, 4], "it": [3, 4, 5]},
+            index=pd.RangeIndex(1, 4, name="mcYear"),
+            dtype=np.int32,
+        )
+        pd.testing.assert_frame_equal(load_ts_numbers, expected_df)
+        for area_id in load_ts_numbers.columns:
+            assert load_ts_numbers[area_id].to_dict() == output.get_load_ts_numbers(area_id)
+
+        # Archived outputs are read the same way
+        adequacy_output = setup_output(tmp_path, "20201014-1430adq-2.zip")
+        pd.testing.assert_frame_equal(adequacy_output.get_all_ts_numbers(TsNumbersKind.THERMAL), thermal_ts_numbers)
+
+        with pytest.raises(OutputDataRetrievalError, match="ts-numbers/ntc does not exist"):
+            output.get_all_ts_numbers(TsNumbersKind.NTC)
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_batch_getters(self, tmp_path: Path, workers: int) -> None:
+        output = setup_output(tmp_path, "20201014-1425eco-goodbye", output_aggregation_workers=workers)
+
+        # Every file is stacked in one dataframe, with the same columns as the individual getters
+        df = output.get_mc_ind_areas([1, 2], Frequency.HOURLY, MCIndAreasDataType.VALUES, ["de", "fr"])
+        assert df.index.names == ["mcYear", "area", "timeId"]
+        for mc_year in [1, 2]:
+            for area in ["de", "fr"]:
+                expected_df = output.get_mc_ind_area(mc_year, Frequency.HOURLY, MCIndAreasDataType.VALUES, area)
+                area_df = df.xs((mc_year, area))
+                assert isinstance(area_df, pd.DataFrame)
+                assert area_df.index.tolist() == list(range(1, len(expected_df) + 1))
+                pd.testing.assert_frame_equal(area_df.reset_index(drop=True), expected_df)
+
+        df = output.get_mc_ind_links([2], Frequency.HOURLY, MCIndLinksDataType.VALUES, [("de", "fr"), ("es", "fr")])
+        assert df.index.get_level_values("link").unique().tolist() == ["de - fr", "es - fr"]
+        expected_df = output.get_mc_ind_link(2, Frequency.HOURLY, MCIndLinksDataType.VALUES, "es", "fr")
+        link_df = df.xs((2, "es - fr"))
+        assert isinstance(link_df, pd.DataFrame)
+        pd.testing.assert_frame_equal(link_df.reset_index(drop=True), expected_df)
+
+        assert output.get_mc_all_areas(Frequency.HOURLY, MCAllAreasDataType.VALUES, []).empty
+
+        with pytest.raises(OutputDataRetrievalError, match="Areas should be sorted alphabetically"):
+            output.get_mc_ind_links([1], Frequency.HOURLY, MCIndLinksDataType.VALUES, [("fr", "de")])
+        with pytest.raises(OutputDataRetrievalError, match="mc-ind/00003/areas/fr/values-hourly.txt does not exist"):
+            output.get_mc_ind_areas([1, 3], Frequency.HOURLY, MCIndAreasDataType.VALUES, ["fr"])
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_to_cube(self, tmp_path: Path, workers: int) -> None:
+        output = setup_output(tmp_path, "20201014-1425eco-goodbye", output_aggregation_workers=workers)
+        variables = ["LOAD", "mrg. price", "FAKE"]
+
+        cube = output.to_cube(variables, MCIndAreasDataType.VALUES, Frequency.HOURLY, ids=["fr", "de", "it"])
+        assert cube.mc_years == [1, 2]
+        assert cube.ids == ["de", "fr", "it"]
+        assert list(cube.values) == variables
+
+        # Same values as the aggregation, in a (year, time, area) layout
+        df = output.aggregate_mc_ind_areas(MCIndAreasDataType.VALUES, Frequency.HOURLY, areas_ids=["de", "fr", "it"])
+        for variable, column in [("LOAD", "LOAD"), ("mrg. price", "MRG. PRICE")]:
+            expected = df.pivot_table(index=["mcYear", "timeId"], columns="area", values=column)
+            assert cube.values[variable].shape == (2, 336, 3)
+            assert np.array_equal(cube.values[variable].reshape(672, 3), expected.to_numpy())
+        assert np.isnan(cube.values["FAKE"]).all()
+
+        # The API scatters the server aggregation in the same cube
+        table = output.aggregate_mc_ind_areas(
+            MCIndAreasDataType.VALUES,
+            Frequency.HOURLY,
+            areas_ids=["de", "fr", "it"],
+            columns_names=variables,
+            output_format=AggregationFormat.POLARS,
+        )
+        api_cube = build_cube_from_table(table, "area", variables, np.float64, None)
+        assert (api_cube.mc_years, api_cube.ids) == (cube.mc_years, cube.ids)
+        for variable in variables:
+            assert np.array_equal(api_cube.values[variable], cube.values[variable], equal_nan=True)
+
+        # Links values, in float32 and memory-mapped
+        memmap_dir = tmp_path / "cube"
+        link_cube = output.to_cube(
+            ["FLOW LIN."],
+            MCIndLinksDataType.VALUES,
+            Frequency.HOURLY,
+            mc_years=[2],
+            dtype=np.float32,
+            memmap_dir=memmap_dir,
+        )
+        assert link_cube.mc_years == [2]
+        assert link_cube.ids == ["de - fr", "es - fr", "fr - it"]
+        flows = np.load(memmap_dir / "FLOW LIN..npy", mmap_mode="r")
+        assert flows.dtype == np.float32 and flows.shape == (1, 336, 3)
+        expected_flows = output.get_mc_ind_link(2, Frequency.HOURLY, MCIndLinksDataType.VALUES, "es", "fr")
+        assert np.array_equal(flows[0, :, 1], expected_flows[("FLOW LIN.", "MWh", "")].to_numpy(dtype=np.float32))
+
+        with pytest.raises(ValueError, match="Only the values"):
+            output.to_cube(["NODU"], MCIndAreasDataType.DETAILS, Frequency.HOURLY)
+        with pytest.raises(ValueError, match="At least one variable"):
+            output.to_cube([], MCIndAreasDataType.VALUES, Frequency.HOURLY)
+
+    def test_convert_to_parquet(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output_name = "20201014-1425eco-goodbye"
+        cache_dir = tmp_path / "cache"
+        output = setup_output(tmp_path, output_name, output_aggregation_workers=2, matrix_cache_dir=cache_dir)
+        output_path = tmp_path / "studyTest" / "output" / output_name
+        output_files = sorted(output_path.rglob("*"))
+
+        def read_everything(output: Output) -> list[pd.DataFrame]:
+            return [
+                output.get_mc_ind_area(2, Frequency.HOURLY, MCIndAreasDataType.DETAILS, "fr"),
+                output.get_mc_all_area(Frequency.DAILY, MCAllAreasDataType.ID, "de"),
+                output.get_mc_ind_links(
+                    [1, 2], Frequency.HOURLY, MCIndLinksDataType.VALUES, [("de", "fr"), ("fr", "it")]
+                ),
+                output.aggregate_mc_ind_areas(MCIndAreasDataType.VALUES, Frequency.HOURLY),
+                output.aggregate_mc_ind_areas(
+                    MCIndAreasDataType.VALUES, Frequency.WEEKLY, [2], ["de", "es"], ["LOAD", "OV. COST"]
+                ),
+                output.aggregate_mc_ind_areas(MCIndAreasDataType.DETAILS, Frequency.HOURLY, columns_names=["NODU"]),
+                output.aggregate_mc_ind_links(
+                    MCIndLinksDataType.VALUES, Frequency.HOURLY, output_format=AggregationFormat.POLARS
+                ).to_pandas(),
+                output.aggregate_mc_all_areas(MCAllAreasDataType.VALUES, Frequency.DAILY, columns_names=["EXP"]),
+                output.compute_mc_statistics(MCIndAreasDataType.VALUES, Frequency.HOURLY, ["LOAD"], [MCStatistic.MEAN]),
+                output.get_all_ts_numbers(TsNumbersKind.THERMAL),
+                pd.DataFrame(output.get_load_ts_numbers("es"), index=[0]),
+            ]
+
+        expected = read_everything(output)
+        dest = tmp_path / "parquet"
+        output.convert_to_parquet(dest, compression="snappy")
+
+        manifest = json.loads((dest / MANIFEST_FILE_NAME).read_text())
+        assert manifest["output"] == output_name
+        assert manifest["datasets"]["mc-ind/areas/values-hourly"]["layouts"]["fr"][:2] == [
+            "OV. COST|Euro|",
+            "OP. COST|Euro|",
+        ]
+        assert (dest / "mc-ind/areas/values-hourly/mcYear=2").is_dir()
+        assert sorted(manifest["ts_numbers"]["thermal"])[0] == "de/01_solar"
+
+        # The output files are not parsed anymore
+        def fail(*args: object, **kwargs: object) -> None:
+            raise RuntimeError("The output files should not be parsed")
+
+        for module in [output_aggregation, local_output]:
+            for function in ["parse_output_file", "read_output_matrix", "read_ts_numbers_file", "parse_ts_numbers"]:
+                if hasattr(module, function):
+                    monkeypatch.setattr(module, function, fail)
+        for actual_df, expected_df in zip(read_everything(output), expected):
+            pd.testing.assert_frame_equal(actual_df, expected_df)
+
+        # The output folder is left untouched, later sessions find the parquet datasets through the cache folder
+        assert sorted(output_path.rglob("*")) == output_files
+        assert len(list((cache_dir / "outputs").glob(f"*{STORE_POINTER_SUFFIX}"))) == 1
+        config = LocalConfiguration(tmp_path, "studyTest", matrix_cache_dir=cache_dir)
+        new_session_services = create_local_services(config, "studyTest", STUDY_VERSION_8_8)
+        new_session_output = Output(output_name, False, new_session_services.output_service)
+        for actual_df, expected_df in zip(read_everything(new_session_output), expected):
+            pd.testing.assert_frame_equal(actual_df, expected_df)
+
+        # Purging the matrix cache keeps the location of the parquet datasets
+        assert config.matrix_cache is not None
+        config.matrix_cache.purge()
+        purged_session_services = create_local_services(config, "studyTest", STUDY_VERSION_8_8)
+        purged_session_output = Output(output_name, False, purged_session_services.output_service)
+        for actual_df, expected_df in zip(read_everything(purged_session_output), expected):
+            pd.testing.assert_frame_equal(actual_df, expected_df)
+
+        # The datasets of a modified output are outdated
+        os.utime(tmp_path / "studyTest" / "output" / output_name / "economy" / "mc-ind", ns=(0, 0))
+        with pytest.raises(RuntimeError, match="should not be parsed"):
+            output.get_mc_ind_area(2, Frequency.HOURLY, MCIndAreasDataType.DETAILS, "fr")
+
+        with pytest.raises(FileExistsError, match="is not empty"):
+            output.convert_to_parquet(dest)
+
+    def test_stored_outputs_concurrent_reads(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output = setup_output(tmp_path, "20201014-1425eco-goodbye")
+        output.convert_to_parquet(tmp_path / "parquet")
+        store = OutputStore.load(tmp_path / "parquet")
+        assert store is not None
+
+        # Both years must be read at the same time to get through the barrier
+        barrier = threading.Barrier(2, timeout=10)
+        read_years: list[Optional[int]] = []
+        read_outputs = store.read_outputs
+
+        def read_concurrently(dataset: str, mc_year: Optional[int], *args: Any) -> Any:
+            read_years.append(mc_year)
+            barrier.wait()
+            return read_outputs(dataset, mc_year, *args)
+
+        monkeypatch.setattr(store, "read_outputs", read_concurrently)
+        stored_outputs = StoredOutputs(store)
+        paths = [
+            f"economy/mc-ind/0000{mc_year}/areas/{area}/values-hourly.txt"
+            for mc_year in [1, 2]
+            for area in ["de", "fr"]
+        ]
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            results = list(executor.map(lambda path: stored_outputs.get(path, None), paths))
+
+        assert all(result is not None for result in results)
+        # Each batch is read once, the workers needing a batch being read wait for it
+        assert len(read_years) == 2 and set(read_years) == {1, 2}
+
+    def test_stored_outputs_kept_reads(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output = setup_output(tmp_path, "20201014-1425eco-goodbye")
+        output.convert_to_parquet(tmp_path / "parquet")
+        store = OutputStore.load(tmp_path / "parquet")
+        assert store is not None
+        read_keys: list[tuple[Optional[int], Any]] = []
+        read_outputs = store.read_outputs
+
+        def counting_read(dataset: str, mc_year: Optional[int], object_ids: Any, *args: Any) -> Any:
+            read_keys.append((mc_year, object_ids))
+            return read_outputs(dataset, mc_year, object_ids, *args)
+
+        # One read per area and year, as many as the files the workers may parse ahead
+        monkeypatch.setattr(store, "batch_size", lambda dataset: 1)
+        monkeypatch.setattr(store, "read_outputs", counting_read)
+        max_workers = 3
+        stored_outputs = StoredOutputs(store, max_workers=max_workers)
+        paths = [
+            f"economy/mc-ind/0000{mc_year}/areas/{area}/values-hourly.txt"
+            for mc_year in [1, 2]
+            for area in ["de", "es", "fr"]
+        ]
+        assert len(paths) == 2 * max_workers
+        for path in paths + paths:
+            assert stored_outputs.get(path, None) is not None
+
+        # The reads of every file in flight are kept: none of them is read again
+        assert len(read_keys) == len(paths)
+
+    def test_convert_archived_output_to_parquet(self, tmp_path: Path) -> None:
+        output_name = "20201014-1422eco-hello"
+        output = setup_output(tmp_path, output_name)
+        output_path = tmp_path / "studyTest" / "output" / output_name
+        shutil.make_archive(str(output_path.with_name(f"{output_name}-archived")), "zip", output_path)
+        archived_output = Output(f"{output_name}-archived.zip", True, output._output_service)
+
+        expected = archived_output.aggregate_mc_ind_areas(MCIndAreasDataType.DETAILS, Frequency.ANNUAL)
+        archived_output.convert_to_parquet(tmp_path / "parquet", compression="none")
+        df = archived_output.aggregate_mc_ind_areas(MCIndAreasDataType.DETAILS, Frequency.ANNUAL)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_incremental_aggregation(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output_name = "20201014-1425eco-goodbye"
+        output = setup_output(tmp_path, output_name)
+        output_path = tmp_path / "studyTest" / "output" / output_name
+        expected = output.aggregate_mc_ind_areas(
+            MCIndAreasDataType.VALUES, Frequency.HOURLY, output_format=AggregationFormat.POLARS
+        )
+
+        # The simulation only wrote its first year
+        running_path = tmp_path / "running" / output_name
+        shutil.copytree(output_path, running_path, ignore=shutil.ignore_patterns("00002"))
+        for file_path in running_path.rglob("*.txt"):
+            os.utime(file_path, ns=(0, 0))
+        parsed_sources: list[object] = []
+
+        def counting_parse(source: Path | bytes, *args: object, **kwargs: object) -> object:
+            parsed_sources.append(source)
+            return parse_output_file(source, *args, **kwargs)  # type: ignore
+
+        monkeypatch.setattr(output_aggregation, "parse_output_file", counting_parse)
+        store_path = tmp_path / "store"
+        aggregator = IncrementalAggregator(
+            running_path, store_path, MCIndAreasDataType.VALUES, Frequency.HOURLY, max_workers=2
+        )
+        assert aggregator.update() == [1]
+        first_year_files = len(parsed_sources)
+        assert first_year_files == 4
+        assert aggregator.scan().collect()["mcYear"].unique().to_list() == [1]
+        assert aggregator.update() == []
+        assert len(parsed_sources) == first_year_files
+
+        # A year being written is not ingested until its files settle or the simulation ends
+        second_year_path = running_path / "economy" / "mc-ind" / "00002"
+        shutil.copytree(output_path / "economy" / "mc-ind" / "00002", second_year_path)
+        for file_path in second_year_path.rglob("*.txt"):
+            os.utime(file_path)
+        assert aggregator.update() == []
+        (running_path / "execution_info.ini").touch()
+
+        # Another session resumes from the ingested files and only parses the new year
+        aggregator = IncrementalAggregator(
+            running_path, store_path, MCIndAreasDataType.VALUES, Frequency.HOURLY, max_workers=2
+        )
+        assert aggregator.ingested_years() == [1]
+        assert aggregator.update() == [2]
+        assert len(parsed_sources) == 2 * first_year_files
+        assert all("00002" in str(source) for source in parsed_sources[first_year_files:])
+        assert (store_path / LEDGER_FILE_NAME).exists()
+        df = aggregator.scan().collect()
+        assert df.columns == expected.columns
+        assert_key = ["mcYear", "area", "timeId"]
+        assert df.sort(assert_key).equals(expected.sort(assert_key))
+
+        # A modified file rewrites its year, without duplicating its rows
+        os.utime(running_path / "economy" / "mc-ind" / "00001" / "areas" / "fr" / "values-hourly.txt")
+        assert aggregator.update() == [1]
+        assert aggregator.scan().collect().sort(assert_key).equals(expected.sort(assert_key))
+
+        # Watching an ended simulation ingests every year at once
+        watching_aggregator = IncrementalAggregator(
+            running_path, tmp_path / "watched", MCIndLinksDataType.VALUES, Frequency.HOURLY, ["de - fr"]
+        )
+        assert watching_aggregator.scan().collect().is_empty()
+        assert watching_aggregator.watch(lambda: False) == [1, 2]
+        assert watching_aggregator.scan().collect()["link"].unique().to_list() == ["de - fr"]
+
+        with pytest.raises(ValueError, match="another aggregation"):
+            IncrementalAggregator(running_path, store_path, MCIndAreasDataType.DETAILS, Frequency.HOURLY)
+        with pytest.raises(FileExistsError, match="is not empty"):
+            IncrementalAggregator(running_path, running_path, MCIndAreasDataType.VALUES, Frequency.HOURLY)
+
+    def test_incremental_aggregation_empty_files(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        output_name = "20201014-1425eco-goodbye"
+        setup_output(tmp_path, output_name)
+        output_path = tmp_path / "studyTest" / "output" / output_name
+        (output_path / "execution_info.ini").touch()
+
+        # Files just created by the simulation don't hold any row yet
+        def is_empty(source: Path | bytes) -> bool:
+            return "00002" in str(source) or f"areas{os.sep}de" in str(source)
+
+        def parse_empty_files(source: Path | bytes, *args: Any, **kwargs: Any) -> Any:
+            output = parse_output_file(source, *args, **kwargs)
+            return dataclasses.replace(output, data=output.data.clear()) if is_empty(source) else output
+
+        monkeypatch.setattr(output_aggregation, "parse_output_file", parse_empty_files)
+        aggregator = IncrementalAggregator(output_path, tmp_path / "store", MCIndAreasDataType.VALUES, Frequency.HOURLY)
+        assert aggregator.update() == [1, 2]
+        df = aggregator.scan().collect()
+        assert df["mcYear"].unique().to_list() == [1]
+        assert "de" not in df["area"].to_list()
+        assert aggregator.update() == []
+
+        # Their rows are ingested once they are written
+        monkeypatch.setattr(output_aggregation, "parse_output_file", parse_output_file)
+        for file_path in (output_path / "economy" / "mc-ind" / "00002").rglob("*.txt"):
+            os.utime(file_path)
+        assert aggregator.update() == [2]
+        assert aggregator.scan().collect()["mcYear"].unique().sort().to_list() == [1, 2]
+
+        # A year without any row yet is scanned as an empty store
+        empty_aggregator = IncrementalAggregator(
+            output_path, tmp_path / "empty_store", MCIndAreasDataType.VALUES, Frequency.HOURLY, mc_years=[2]
+        )
+        monkeypatch.setattr(output_aggregation, "parse_output_file", parse_empty_files)
+        assert empty_aggregator.update() == [2]
+        assert empty_aggregator.scan().collect().is_empty()
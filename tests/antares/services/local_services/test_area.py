@@ -20,6 +20,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import polars as pl
 
 from checksumdir import dirhash
 
@@ -711,6 +712,45 @@ class TestReadLoad:
             matrix = area.get_load_matrix()
             assert matrix.equals(expected_df)
 
+    def test_read_load_columns_local(self, local_study_w_areas: Study) -> None:
+        area = local_study_w_areas.get_areas()["fr"]
+        load = pd.DataFrame(data=np.arange(8760 * 4).reshape(8760, 4))
+        area.set_load(load)
+        assert area.get_load_matrix(columns=[2, 0]).equals(load.iloc[:, [2, 0]])
+
+    def test_read_load_output_formats_local(self, local_study_w_areas: Study) -> None:
+        area = local_study_w_areas.get_areas()["fr"]
+        load = pd.DataFrame(data=np.arange(8760 * 3, dtype=float).reshape(8760, 3))
+        area.set_load(load)
+
+        array = area.get_load_matrix(columns=[2], output_format=matrix_tool.MatrixFormat.NUMPY)
+        assert isinstance(array, np.ndarray)
+        assert np.array_equal(array, load.iloc[:, [2]].to_numpy())
+        polars_df = area.get_load_matrix(output_format=matrix_tool.MatrixFormat.POLARS)
+        assert isinstance(polars_df, pl.DataFrame)
+        assert np.array_equal(polars_df.to_numpy(), load.to_numpy())
+
+    def test_read_many_matrices_local(self, local_study_w_areas: Study) -> None:
+        areas = local_study_w_areas.get_areas()
+        expected = {}
+        for k, area in enumerate(areas.values()):
+            load = pd.DataFrame(data=np.full((8760, 2), k))
+            wind = pd.DataFrame(data=np.full((8760, 3), -k))
+            area.set_load(load)
+            area.set_wind(wind)
+            expected[matrix_tool.TimeSeriesRequest(TimeSeriesFileType.LOAD, area_id=area.id)] = load
+            expected[matrix_tool.TimeSeriesRequest(TimeSeriesFileType.WIND, area_id=area.id)] = wind
+
+        matrices = local_study_w_areas.read_timeseries_many(list(expected), max_workers=2)
+        assert list(matrices) == list(expected)
+        for request, matrix in matrices.items():
+            assert matrix.equals(expected[request])
+
+        with pytest.raises(FileNotFoundError):
+            local_study_w_areas.read_timeseries_many(
+                [matrix_tool.TimeSeriesRequest(TimeSeriesFileType.LOAD, area_id="x")]
+            )
+
 
 class TestReadRenewable:
     def test_read_renewable_from_study(self, local_study_with_renewable: Study) -> None:
@@ -15,7 +15,9 @@ import re
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft import BindingConstraintFrequency, Study
 from antares.craft.exceptions.exceptions import (
@@ -32,6 +34,7 @@ from antares.craft.model.binding_constraint import (
     LinkData,
 )
 from antares.craft.service.local_services.factory import read_study_local
+from antares.craft.tools.matrix_tool import MatrixFormat
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 
@@ -102,6 +105,14 @@ class TestBindingConstraints:
         bc.set_equal_term(matrix)
         assert bc.get_equal_term_matrix().equals(matrix)
 
+        # Default matrices depend on the constraint frequency, whatever the format
+        bc_2 = local_study_w_constraints.get_binding_constraints()["bc_2"]
+        default_matrix = bc_2.get_less_term_matrix(output_format=MatrixFormat.NUMPY)
+        assert np.array_equal(default_matrix, np.zeros((8784, 1)))
+        default_df = bc_2.get_less_term_matrix(output_format=MatrixFormat.POLARS)
+        assert isinstance(default_df, pl.DataFrame)
+        assert default_df.shape == (8784, 1)
+
         # Try to update with wrongly formatted matrix
         matrix = pd.DataFrame(data=[[1, 2, 3], [4, 5, 6]])
         with pytest.raises(
@@ -14,9 +14,14 @@ import pytest
 from dataclasses import replace
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import polars as pl
+
 from antares.craft import HydroAllocation, Study, read_study_local
 from antares.craft.exceptions.exceptions import InvalidFieldForVersionError
 from antares.craft.model.hydro import Hydro, HydroProperties, HydroPropertiesUpdate, InflowStructureUpdate
+from antares.craft.tools.matrix_tool import MatrixFormat
 from antares.craft.tools.serde_local.ini_reader import IniReader
 from antares.craft.tools.serde_local.ini_writer import IniWriter
 
@@ -256,3 +261,15 @@ fr = True
         ini_path = study_path / "input" / "hydro" / "allocation" / "fr.ini"
         ini_content = IniReader().read(ini_path)
         assert ini_content == {"[allocation]": {"DE": 1.3, "fr": 1.0}}
+
+    def test_matrices_output_formats(self, local_study_w_areas: Study) -> None:
+        hydro = local_study_w_areas.get_areas()["fr"].hydro
+        maxpower = pd.DataFrame(data=np.arange(365 * 4, dtype=float).reshape(365, 4))
+        hydro.set_maxpower(maxpower)
+
+        array = hydro.get_maxpower(columns=[3, 1], output_format=MatrixFormat.NUMPY)
+        assert isinstance(array, np.ndarray)
+        assert np.array_equal(array, maxpower.iloc[:, [3, 1]].to_numpy())
+        polars_df = hydro.get_maxpower(output_format=MatrixFormat.POLARS)
+        assert isinstance(polars_df, pl.DataFrame)
+        assert np.array_equal(polars_df.to_numpy(), maxpower.to_numpy())
@@ -17,10 +17,12 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import polars as pl
 
 from antares.craft import ConstraintTerm, FilterOption, LinkData, Study
 from antares.craft.exceptions.exceptions import LinkDeletionError, MatrixFormatError, ReferencedObjectDeletionNotAllowed
 from antares.craft.model.link import AssetType, LinkProperties, LinkPropertiesUpdate, LinkUi, LinkUiUpdate
+from antares.craft.tools.matrix_tool import MatrixFormat
 from antares.craft.tools.serde_local.ini_reader import IniReader
 
 
@@ -132,6 +134,14 @@ class TestLink:
         link.set_parameters(parameters_matrix)
         assert link.get_parameters().equals(parameters_matrix)
 
+        # Reads matrices as numpy arrays or polars frames
+        array = link.get_parameters(columns=[0, 2], output_format=MatrixFormat.NUMPY)
+        assert isinstance(array, np.ndarray)
+        assert np.array_equal(array, parameters_matrix.iloc[:, [0, 2]].to_numpy())
+        polars_df = link.get_capacity_direct(output_format=MatrixFormat.POLARS)
+        assert isinstance(polars_df, pl.DataFrame)
+        assert np.array_equal(polars_df.to_numpy(), matrix.to_numpy())
+
         # Try to update with wrongly formatted matrix
         matrix = pd.DataFrame(data=[[1, 2, 3], [4, 5, 6]])
         with pytest.raises(
@@ -18,6 +18,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import polars as pl
 
 from checksumdir import dirhash
 
@@ -41,6 +42,7 @@ from antares.craft.service.local_services.models.st_storage import (
     parse_st_storage_local,
     serialize_st_storage_local,
 )
+from antares.craft.tools.matrix_tool import MatrixFormat
 from antares.craft.tools.serde_local.ini_reader import IniReader
 
 
@@ -125,6 +127,14 @@ class TestSTStorage:
         storage.set_storage_inflows(matrix)
         assert storage.get_storage_inflows().equals(matrix)
 
+        # Reads matrices as numpy arrays or polars frames
+        array = storage.get_storage_inflows(columns=[0], output_format=MatrixFormat.NUMPY)
+        assert isinstance(array, np.ndarray)
+        assert np.array_equal(array, matrix.to_numpy())
+        polars_df = storage.get_pmax_injection(output_format=MatrixFormat.POLARS)
+        assert isinstance(polars_df, pl.DataFrame)
+        assert np.array_equal(polars_df.to_numpy(), matrix.to_numpy())
+
         # Try to update with wrongly formatted matrix
         matrix = pd.DataFrame(data=[[1, 2, 3], [4, 5, 6]])
         with pytest.raises(
@@ -408,6 +418,18 @@ def test_nominal_case_additional_constraints(local_study_92: Study) -> None:
     pd.testing.assert_frame_equal(term, new_term)
 
 
+def test_set_constraint_term_on_new_storage(local_study_92: Study) -> None:
+    sts = local_study_92.get_areas()["fr"].create_st_storage("bat")
+
+    # The folder of the constraint terms doesn't exist yet, it's created when writing the matrix
+    new_term = pd.DataFrame(np.ones((8760, 1)))
+    sts.set_constraint_term("constraint1", new_term)
+    pd.testing.assert_frame_equal(sts.get_constraint_term("constraint1"), new_term)
+    array = sts.get_constraint_term("constraint1", output_format=MatrixFormat.NUMPY)
+    assert isinstance(array, np.ndarray)
+    assert np.array_equal(array, new_term.to_numpy())
+
+
 def test_error_cases(local_study_w_storage: Study) -> None:
     sts = local_study_w_storage.get_areas()["fr"].get_st_storages()["sts_1"]
     assert sts.get_constraints() == {}
@@ -11,10 +11,12 @@
 # This file is part of the Antares project.
 import pytest
 
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 
-from antares.craft import Study
+from antares.craft import Study, read_study_local
 from antares.craft.model.thermal import ThermalClusterPropertiesUpdate
 
 
@@ -35,6 +37,21 @@ class TestThermalTsGeneration:
             expected_series = pd.DataFrame(np.full((8760, 4), (k + 1) * 100), dtype=np.int64)
             assert series.equals(expected_series)
 
+    def test_with_matrix_store(self, local_study_w_thermals: Study, tmp_path: Path) -> None:
+        study = read_study_local(Path(local_study_w_thermals.path), matrix_store_dir=tmp_path / "store")
+        clusters = [cluster for area in study.get_areas().values() for cluster in area.get_thermals().values()]
+        for cluster in clusters:
+            cluster.update_properties(ThermalClusterPropertiesUpdate(nominal_capacity=100))
+        study.generate_thermal_timeseries(4)
+        # Every cluster has the same series: it's only stored once
+        expected_series = pd.DataFrame(np.full((8760, 4), 100), dtype=np.int64)
+        for cluster in clusters:
+            assert cluster.get_series_matrix().equals(expected_series)
+            series_path = (
+                Path(study.path) / "input" / "thermal" / "series" / cluster.area_id / cluster.id / "series.txt"
+            )
+            assert series_path.stat().st_nlink == len(clusters) + 1
+
     def test_error_case(self, local_study_w_thermals: Study) -> None:
         thermal = local_study_w_thermals.get_areas()["it"].get_thermals()["thermal_it"]
         thermal.set_prepro_data(pd.DataFrame(np.full((365, 6), 12)))
@@ -12,11 +12,25 @@
 
 import pytest
 
+import os
+
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from antares.craft.tools.matrix_tool import DEFAULT_MATRIX_MAPPING, OPTIONAL_MATRICES, read_timeseries, write_timeseries
+from antares.craft.tools import matrix_store
+from antares.craft.tools.matrix_cache import MatrixCache, MatrixCacheStats, MatrixMemoryCache, MatrixMemoryCacheStats
+from antares.craft.tools.matrix_store import MatrixStore, MatrixStoreStats
+from antares.craft.tools.matrix_tool import (
+    DEFAULT_MATRIX_MAPPING,
+    OPTIONAL_MATRICES,
+    MatrixFormat,
+    MatrixInfo,
+    matrix_info,
+    read_timeseries,
+    write_timeseries,
+)
 from antares.craft.tools.time_series_tool import TimeSeriesFileType
 
 
@@ -51,3 +65,282 @@ def test_write_timeseries(tmp_path: Path) -> None:
     thermal_modulation_path = file_path / "input/bindingconstraints/constraint_1_eq.txt"
     assert thermal_modulation_path.exists()
     assert thermal_modulation_path.is_file()
+
+
+def test_write_default_timeseries(tmp_path: Path) -> None:
+    default_matrix = DEFAULT_MATRIX_MAPPING[TimeSeriesFileType.RESERVES]
+    file_path = tmp_path / TimeSeriesFileType.RESERVES.value.format(area_id="fr")
+
+    # An empty series is written as an empty file, which is read back as the default matrix
+    write_timeseries(tmp_path, pd.DataFrame(), TimeSeriesFileType.RESERVES, area_id="fr")
+    assert file_path.stat().st_size == 0
+    assert read_timeseries(TimeSeriesFileType.RESERVES, tmp_path, area_id="fr") is default_matrix
+
+    # The data explicitly given is always written, even if it equals the default matrix
+    write_timeseries(tmp_path, default_matrix.copy(), TimeSeriesFileType.RESERVES, area_id="fr")
+    assert file_path.stat().st_size > 0
+    assert read_timeseries(TimeSeriesFileType.RESERVES, tmp_path, area_id="fr").equals(default_matrix)
+
+
+def test_read_timeseries_schema(tmp_path: Path) -> None:
+    file_path = tmp_path / "input" / "load" / "series" / "load_fr.txt"
+    file_path.parent.mkdir(parents=True)
+    # Integers on the first rows only, and a value too big to fit in an Int64
+    rows = ["1\t2\t3"] * 200 + ["4\t5.5\t100000000000000000000"]
+    file_path.write_text("\n".join(rows) + "\n")
+
+    df = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr")
+    assert df.shape == (201, 3)
+    assert df.dtypes.tolist() == ["int64", "float64", "float64"]
+    assert df.iloc[-1].tolist() == [4, 5.5, 1e20]
+
+
+def test_read_timeseries_output_formats(tmp_path: Path) -> None:
+    df = pd.DataFrame([[1.5, 2.0], [3.0, 4.25]])
+    write_timeseries(tmp_path, df, TimeSeriesFileType.LOAD, area_id="fr")
+
+    array = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", output_format=MatrixFormat.NUMPY)
+    assert isinstance(array, np.ndarray)
+    assert np.array_equal(array, df.to_numpy())
+
+    polars_df = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", output_format=MatrixFormat.POLARS)
+    assert polars_df.columns == ["column_1", "column_2"]
+    assert np.array_equal(polars_df.to_numpy(), df.to_numpy())
+
+    # Default matrices are converted as well
+    write_timeseries(tmp_path, None, TimeSeriesFileType.WIND, area_id="fr")
+    default = read_timeseries(TimeSeriesFileType.WIND, tmp_path, area_id="fr", output_format=MatrixFormat.POLARS)
+    assert default.shape == DEFAULT_MATRIX_MAPPING[TimeSeriesFileType.WIND].shape
+
+    # Memory-mapped arrays are returned as they are
+    cache = MatrixCache(tmp_path / "cache", memory_map=True)
+    mapped = read_timeseries(
+        TimeSeriesFileType.LOAD, tmp_path, area_id="fr", cache=cache, output_format=MatrixFormat.NUMPY
+    )
+    assert isinstance(mapped, np.memmap)
+    assert np.array_equal(mapped, df.to_numpy())
+
+
+def test_read_timeseries_with_cache(tmp_path: Path) -> None:
+    study_path = tmp_path / "study"
+    cache = MatrixCache(tmp_path / "cache")
+    df = pd.DataFrame([[1.5, 2.0], [3.0, 4.25]])
+    write_timeseries(study_path, df, TimeSeriesFileType.LOAD, area_id="fr", cache=cache)
+
+    # First read parses the text file and fills the cache
+    first_read = read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id="fr", cache=cache)
+    assert first_read.equals(df)
+    assert cache.stats == MatrixCacheStats(hits=0, misses=1, invalidations=0)
+
+    # Second read is served by the cache
+    second_read = read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id="fr", cache=cache)
+    assert second_read.equals(df)
+    assert cache.stats == MatrixCacheStats(hits=1, misses=1, invalidations=0)
+
+    # Writing the matrix again invalidates the entry
+    new_df = pd.DataFrame([[5.0], [6.0]])
+    write_timeseries(study_path, new_df, TimeSeriesFileType.LOAD, area_id="fr", cache=cache)
+    assert cache.stats.invalidations == 1
+    assert read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id="fr", cache=cache).equals(new_df)
+    assert cache.stats.misses == 2
+
+    # Purging the cache removes every entry, and only them
+    (cache.cache_dir / "outputs").mkdir()
+    (cache.cache_dir / "notes.txt").write_text("kept")
+    assert cache.purge() == 1
+    assert sorted(path.name for path in cache.cache_dir.iterdir()) == ["notes.txt", "outputs"]
+    read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id="fr", cache=cache)
+    assert cache.stats.misses == 3
+
+
+def test_read_timeseries_memory_mapped(tmp_path: Path) -> None:
+    study_path = tmp_path / "study"
+    cache = MatrixCache(tmp_path / "cache", memory_map=True)
+    df = pd.DataFrame([[1.5, 2.0], [3.0, 4.25]])
+    write_timeseries(study_path, df, TimeSeriesFileType.LOAD, area_id="fr", cache=cache)
+
+    first_read = read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id="fr", cache=cache)
+    second_read = read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id="fr", cache=cache)
+    assert first_read.equals(df)
+    assert second_read.equals(df)
+    assert cache.stats == MatrixCacheStats(hits=1, misses=1, invalidations=0)
+
+    # The dataframe is a read-only view over the memory-mapped file
+    array = second_read.to_numpy()
+    assert not array.flags.owndata
+    assert not array.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        array[0, 0] = 12
+
+    # Writing the matrix again invalidates the entry
+    new_df = pd.DataFrame([[5.0], [6.0]])
+    write_timeseries(study_path, new_df, TimeSeriesFileType.LOAD, area_id="fr", cache=cache)
+    assert read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id="fr", cache=cache).equals(new_df)
+    assert cache.stats.misses == 2
+
+
+def test_read_timeseries_with_memory_cache(tmp_path: Path) -> None:
+    df = pd.DataFrame(np.ones((10, 2)))
+    memory_cache = MatrixMemoryCache(max_bytes=2 * df.memory_usage(index=True).sum())
+    for area_id in ["fr", "de", "it"]:
+        write_timeseries(tmp_path, df, TimeSeriesFileType.LOAD, area_id=area_id, memory_cache=memory_cache)
+
+    first_read = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", memory_cache=memory_cache)
+    second_read = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", memory_cache=memory_cache)
+    assert second_read is first_read
+    assert second_read.equals(df)
+    assert memory_cache.stats == MatrixMemoryCacheStats(hits=1, misses=1, evictions=0, invalidations=0)
+
+    # Cached matrices are shared, so they can't be modified
+    with pytest.raises(ValueError, match="read-only"):
+        second_read.iloc[0, 0] = 12
+
+    # The budget only fits two matrices: reading a third one evicts the least recently used
+    read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="de", memory_cache=memory_cache)
+    read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="it", memory_cache=memory_cache)
+    assert memory_cache.stats.evictions == 1
+    assert memory_cache.size <= memory_cache.max_bytes
+
+    # Writing a matrix invalidates its entry
+    new_df = pd.DataFrame(np.zeros((10, 2)))
+    write_timeseries(tmp_path, new_df, TimeSeriesFileType.LOAD, area_id="it", memory_cache=memory_cache)
+    assert memory_cache.stats.invalidations == 1
+    assert read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="it", memory_cache=memory_cache).equals(new_df)
+
+    # Matrices modified behind the cache's back are not served
+    (tmp_path / "input" / "load" / "series" / "load_de.txt").write_text("1\t2\n")
+    matrix = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="de", memory_cache=memory_cache)
+    assert matrix.equals(pd.DataFrame([[1, 2]]))
+
+    # Matrices larger than the whole budget are not cached and are left writable
+    large_df = pd.DataFrame(np.ones((100, 2)))
+    write_timeseries(tmp_path, large_df, TimeSeriesFileType.LOAD, area_id="es", memory_cache=memory_cache)
+    large_matrix = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="es", memory_cache=memory_cache)
+    assert large_matrix.equals(large_df)
+    large_matrix.iloc[0, 0] = 12
+    misses = memory_cache.stats.misses
+    read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="es", memory_cache=memory_cache)
+    assert memory_cache.stats.misses == misses + 1
+
+
+def test_read_timeseries_columns(tmp_path: Path) -> None:
+    df = pd.DataFrame(np.arange(40, dtype=float).reshape(8, 5))
+    write_timeseries(tmp_path, df, TimeSeriesFileType.LOAD, area_id="fr")
+    expected = df.iloc[:, [3, 1]]
+
+    # Selected columns are returned in the requested order and keep their index as label
+    matrix = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", columns=[3, 1])
+    assert matrix.equals(expected)
+    numpy_matrix = read_timeseries(
+        TimeSeriesFileType.LOAD, tmp_path, area_id="fr", columns=[3, 1], output_format=MatrixFormat.NUMPY
+    )
+    assert np.array_equal(numpy_matrix, expected.to_numpy())
+
+    # The selection also applies to the cached matrices, whatever the cache
+    caches = [MatrixCache(tmp_path / "cache"), MatrixCache(tmp_path / "mmap_cache", memory_map=True)]
+    for cache in caches:
+        for _ in range(2):
+            matrix = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", cache=cache, columns=[3, 1])
+            assert matrix.equals(expected)
+        assert cache.stats == MatrixCacheStats(hits=1, misses=1, invalidations=0)
+
+    memory_cache = MatrixMemoryCache(max_bytes=10_000)
+    read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", memory_cache=memory_cache)
+    matrix = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", memory_cache=memory_cache, columns=[3, 1])
+    assert matrix.equals(expected)
+    assert memory_cache.stats.hits == 1
+
+    # Default matrices are selected too
+    write_timeseries(tmp_path, pd.DataFrame(), TimeSeriesFileType.LOAD, area_id="de")
+    default_matrix = read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="de", columns=[0])
+    assert default_matrix.shape == (8760, 1)
+
+    for columns in [[5], [-1]]:
+        with pytest.raises(IndexError, match="out of bounds"):
+            read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", columns=columns)
+
+    # A column can only be selected once, whatever the cache
+    for selection_cache in [None, *caches]:
+        with pytest.raises(ValueError, match="selected several times"):
+            read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", cache=selection_cache, columns=[1, 3, 1])
+
+
+def test_matrix_info(tmp_path: Path) -> None:
+    df = pd.DataFrame(np.arange(30, dtype=float).reshape(10, 3))
+    write_timeseries(tmp_path, df, TimeSeriesFileType.LOAD, area_id="fr")
+    file_size = (tmp_path / "input" / "load" / "series" / "load_fr.txt").stat().st_size
+    expected = MatrixInfo(rows=10, columns=3, size=file_size, is_default=False)
+    assert matrix_info(TimeSeriesFileType.LOAD, tmp_path, area_id="fr") == expected
+
+    # The shape is read from the cache entry headers once the matrix is cached
+    for cache in [MatrixCache(tmp_path / "cache"), MatrixCache(tmp_path / "mmap_cache", memory_map=True)]:
+        assert cache.get_shape(tmp_path / "input" / "load" / "series" / "load_fr.txt") is None
+        read_timeseries(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", cache=cache)
+        assert cache.get_shape(tmp_path / "input" / "load" / "series" / "load_fr.txt") == (10, 3)
+        assert matrix_info(TimeSeriesFileType.LOAD, tmp_path, area_id="fr", cache=cache) == expected
+
+    # Files without a final line feed
+    (tmp_path / "input" / "load" / "series" / "load_de.txt").write_text("1\t2\n3\t4")
+    assert matrix_info(TimeSeriesFileType.LOAD, tmp_path, area_id="de") == MatrixInfo(2, 2, 7, False)
+
+    # Default matrices
+    write_timeseries(tmp_path, pd.DataFrame(), TimeSeriesFileType.LOAD, area_id="it")
+    assert matrix_info(TimeSeriesFileType.LOAD, tmp_path, area_id="it") == MatrixInfo(8760, 1, 0, True)
+    optional_matrix = matrix_info(TimeSeriesFileType.THERMAL_CO2, tmp_path, area_id="fr", cluster_id="gas")
+    assert optional_matrix == MatrixInfo(8760, 1, 0, True)
+
+    with pytest.raises(FileNotFoundError):
+        matrix_info(TimeSeriesFileType.LOAD, tmp_path, area_id="es")
+
+
+def test_write_timeseries_with_store(tmp_path: Path) -> None:
+    study_path = tmp_path / "study"
+    store = MatrixStore(tmp_path / "store")
+    df = pd.DataFrame(np.arange(20, dtype=float).reshape(10, 2))
+    for cluster_id in ["gas", "coal", "oil"]:
+        write_timeseries(
+            study_path, df, TimeSeriesFileType.THERMAL_DATA, area_id="fr", cluster_id=cluster_id, store=store
+        )
+
+    # The payload is written once, the other matrices are linked to it
+    paths = {
+        cluster_id: study_path / TimeSeriesFileType.THERMAL_DATA.value.format(area_id="fr", cluster_id=cluster_id)
+        for cluster_id in ["gas", "coal", "oil"]
+    }
+    file_size = paths["gas"].stat().st_size
+    assert store.stats == MatrixStoreStats(written=1, linked=2, bytes_saved=2 * file_size)
+    assert paths["gas"].stat().st_nlink == 4
+    for cluster_id in paths:
+        matrix = read_timeseries(TimeSeriesFileType.THERMAL_DATA, study_path, area_id="fr", cluster_id=cluster_id)
+        assert matrix.equals(df)
+
+    # Rewriting a linked matrix, even without the store, never modifies the other ones
+    new_df = pd.DataFrame(np.ones((10, 2)))
+    write_timeseries(study_path, new_df, TimeSeriesFileType.THERMAL_DATA, area_id="fr", cluster_id="gas")
+    write_timeseries(study_path, None, TimeSeriesFileType.THERMAL_DATA, area_id="fr", cluster_id="coal")
+    assert read_timeseries(TimeSeriesFileType.THERMAL_DATA, study_path, area_id="fr", cluster_id="gas").equals(new_df)
+    assert paths["coal"].stat().st_size == 0
+    assert read_timeseries(TimeSeriesFileType.THERMAL_DATA, study_path, area_id="fr", cluster_id="oil").equals(df)
+    assert paths["oil"].stat().st_nlink == 2
+
+
+def test_write_timeseries_with_store_without_links(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # E.g. on a platform without reflinks and a file system without hard links
+    def _link(source: Path, target: Path) -> None:
+        raise OSError("Hard links are not supported")
+
+    monkeypatch.setattr(os, "link", _link)
+    monkeypatch.setattr(matrix_store, "_FICLONE", None)
+    study_path = tmp_path / "study"
+    (study_path / "input" / "load" / "series").mkdir(parents=True)
+    store = MatrixStore(tmp_path / "store")
+    df = pd.DataFrame(np.arange(20, dtype=float).reshape(10, 2))
+    for area_id in ["fr", "de"]:
+        write_timeseries(study_path, df, TimeSeriesFileType.LOAD, area_id=area_id, store=store)
+
+    # The payload is copied, so no space is saved
+    assert store.stats == MatrixStoreStats(written=1, linked=0, bytes_saved=0)
+    for area_id in ["fr", "de"]:
+        file_path = study_path / TimeSeriesFileType.LOAD.value.format(area_id=area_id)
+        assert file_path.stat().st_nlink == 1
+        assert read_timeseries(TimeSeriesFileType.LOAD, study_path, area_id=area_id).equals(df)